@@ -1,11 +1,12 @@
 from pathlib import Path
-from typing import Callable, Dict, Optional, Iterable
+from typing import Callable, Dict, Optional, Iterable, Iterator
 
 class ExtensionManager:
     """Manage file extensions and their optional content processors."""
 
     def __init__(self, supported_extensions: Optional[Iterable[str]] = None):
         self._processors: Dict[str, Optional[Callable[[str], str]]] = {}
+        self._streaming: Dict[str, bool] = {}
         if supported_extensions:
             for ext in supported_extensions:
                 self.register_extension(ext)
@@ -13,8 +14,21 @@ class ExtensionManager:
         # Register default processors
         self.register_extension('.java', self._process_java_content)
 
-    def register_extension(self, extension: str, processor: Optional[Callable[[str], str]] = None) -> None:
-        self._processors[extension.lower()] = processor
+    def register_extension(
+        self,
+        extension: str,
+        processor: Optional[Callable[[str], str]] = None,
+        streaming: bool = True
+    ) -> None:
+        """Register an extension.
+
+        Streaming processors are called on blocks of whole lines and their
+        outputs are concatenated. Pass ``streaming=False`` for processors that
+        need the complete file content in a single call.
+        """
+        ext = extension.lower()
+        self._processors[ext] = processor
+        self._streaming[ext] = streaming
 
     def supported_extensions(self) -> set:
         return set(self._processors.keys())
@@ -28,11 +42,36 @@ class ExtensionManager:
             return processor(content)
         return content
 
+    def process_stream(self, file_path: Path, chunks: Iterable[str]) -> Iterator[str]:
+        """Apply the processor to a stream of chunks, yielding processed text."""
+        ext = file_path.suffix.lower()
+        processor = self._processors.get(ext)
+        if not processor:
+            yield from chunks
+            return
+
+        if not self._streaming.get(ext, True):
+            yield processor("".join(chunks))
+            return
+
+        # Processors only see complete lines; keep the trailing partial line
+        pending = []
+        for chunk in chunks:
+            cut = chunk.rfind("\n") + 1
+            if not cut:
+                pending.append(chunk)
+                continue
+            pending.append(chunk[:cut])
+            yield processor("".join(pending))
+            pending = [chunk[cut:]] if cut < len(chunk) else []
+        if pending:
+            yield processor("".join(pending))
+
     @staticmethod
     def _process_java_content(content: str) -> str:
-        lines = content.splitlines()
+        lines = content.splitlines(keepends=True)
         filtered = [
             line for line in lines
             if not line.strip().startswith(('import ', 'package '))
         ]
-        return "\n".join(filtered)
+        return "".join(filtered)
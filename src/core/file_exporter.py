@@ -1,11 +1,56 @@
+import os
+import hashlib
+import itertools
+import logging
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional, TextIO, Iterable, Tuple
 from datetime import datetime
+from ..utils.file_utils import (DEFAULT_CHUNK_SIZE, iter_file_chunks, get_file_encoding,
+                                content_hash, content_hasher, format_file_size, decode_bytes)
+from .large_file_policy import skipped_marker
+
+def estimate_tokens(size: int) -> int:
+    """
+    Dosya boyutundan yaklaşık token sayısını tahmin eder (kaynak kodda ~4 bayt/token).
+    
+    Args:
+        size: Bayt cinsinden boyut
+        
+    Returns:
+        int: Tahmini token sayısı
+    """
+    return (size + 3) // 4
+
+@dataclass
+class ExportSummary:
+    """Son dışa aktarma işleminin özeti."""
+    exported_files: int = 0     # İçeriği yazılan dosya sayısı
+    skipped_files: int = 0      # Boyut politikası nedeniyle atlanan dosyalar
+    duplicate_files: int = 0    # Referans olarak yazılan yinelenen dosyalar
+    similar_files: int = 0      # Benzer dosya kümelerinde temsilciye bağlanan dosyalar
+    bytes_saved: int = 0        # Yinelenen/benzer içerikler yazılmayarak kazanılan bayt
+    over_budget_files: int = 0  # Token bütçesine sığmadığı için dışarıda bırakılanlar
+
+    def __str__(self) -> str:
+        text = f"{self.exported_files} dosya aktarıldı"
+        if self.skipped_files:
+            text += f", {self.skipped_files} büyük dosya atlandı"
+        if self.duplicate_files:
+            text += f", {self.duplicate_files} yinelenen dosya referans olarak yazıldı"
+        if self.similar_files:
+            text += f", {self.similar_files} benzer dosya temsilci dosyada listelendi"
+        if self.over_budget_files:
+            text += f", {self.over_budget_files} dosya token bütçesine sığmadı"
+        if self.bytes_saved:
+            text += f" ({format_file_size(self.bytes_saved)} tasarruf)"
+        return text
 
 class FileExporter:
     """Dosya dışa aktarma işlemlerini yöneten sınıf."""
 
-    def __init__(self, extension_manager=None):
+    def __init__(self, extension_manager=None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 policy_manager=None):
         self.export_format = """Path: {file_path}
 Code:
 {file_content}
@@ -14,6 +59,14 @@ Code:
         self.separator = "\n" + "=" * 80 + "\n"
         from .extension_manager import ExtensionManager
         self.extension_manager = extension_manager or ExtensionManager()
+        # Okuma parça boyutu; en büyük dosyadan bağımsız olarak bellek kullanımını sınırlar
+        self.chunk_size = chunk_size
+        from .large_file_policy import LargeFilePolicyManager
+        self.policy_manager = policy_manager or LargeFilePolicyManager()
+        self.last_summary = ExportSummary()
+        from .near_duplicate import NearDuplicateIndex
+        # İmza önbelleği dışa aktarmalar arasında korunur
+        self.near_duplicate_index = NearDuplicateIndex()
     
     def _create_export_file(self, output_path: Path) -> None:
         """Dışa aktarma dosyasını oluşturur ve UTF-8 BOM ekler."""
@@ -21,10 +74,93 @@ Code:
         with open(output_path, 'wb') as f:
             f.write(b'\xef\xbb\xbf')  # UTF-8 BOM
     
-    def _append_to_file(self, file_path: Path, content: str) -> None:
-        """Dosyaya içerik ekler."""
-        with open(file_path, 'a', encoding='utf-8') as f:
-            f.write(content)
+    def _iter_source(self, file_path: str | Path, size: Optional[int], encoding: str) -> Iterable[str]:
+        """Dosya içeriğini büyük dosya politikasına göre parça parça okur."""
+        if size is None:
+            # Dosya stat edilemedi, okuma hatası kayda yazılsın
+            return iter_file_chunks(file_path, self.chunk_size)
+        return self.policy_manager.iter_content(
+            file_path, self.chunk_size, encoding=encoding, size=size
+        )
+    
+    def _write_entry(self, out: TextIO, display_path: str, chunks: Iterable[str]) -> bool:
+        """Bir dosya kaydını parça parça çıktı dosyasına yazar.
+        
+        Returns:
+            bool: İçerik hatasız yazıldıysa True
+        """
+        header, footer = self.export_format.split('{file_content}', 1)
+        out.write(header.format(file_path=display_path))
+        complete = True
+        try:
+            for chunk in chunks:
+                out.write(chunk)
+        except Exception as e:
+            # Yazılmış kısım geri alınamaz, hatayı kaydın içine ekle
+            out.write(f"Dosya okuma hatası: {str(e)}")
+            complete = False
+        out.write(footer.format(separator=self.separator))
+        return complete
+    
+    @staticmethod
+    def _hashed(chunks: Iterable[str], hasher) -> Iterable[str]:
+        """Parçaları geçirirken hasher'a ekler."""
+        for chunk in chunks:
+            hasher.update(chunk.encode('utf-8', 'surrogatepass'))
+            yield chunk
+    
+    @staticmethod
+    def _reference_entry(original: Tuple[str, str], export_name: str) -> str:
+        """İlk kopyaya referans; başka bir çıktı dosyasındaysa dosya adı da yazılır."""
+        original_export, original_path = original
+        if original_export != export_name:
+            return f"[Aynı içerik: {original_path} ({original_export} içinde)]"
+        return f"[Aynı içerik: {original_path}]"
+    
+    def _hash_files(self, sizes: Dict[str, Optional[int]]) -> Dict[str, str]:
+        """Benzer dosya kümelemesi için tüm dosyaların içerik hash'lerini hesaplar."""
+        hashes = {}
+        for file_path, size in sizes.items():
+            if not size:
+                continue
+            try:
+                hashes[file_path] = content_hash(file_path, self.chunk_size)
+            except OSError as e:
+                logging.warning(f"Hash hesaplanamadı ({file_path}): {e}")
+        return hashes
+    
+    def _find_similar_files(
+        self,
+        files: List[str],
+        sizes: Dict[str, Optional[int]],
+        hashes: Dict[str, str]
+    ) -> Dict[str, List[str]]:
+        """Benzer dosya kümelerini bulur, temsilci -> diğer üyeler sözlüğü döndürür.
+        
+        Her içerikten yalnızca ilk dosya kümelenir. Kümeleme bittikten sonra
+        birebir kopyalar, ilk kopyanın bağlandığı temsilciye eklenir; temsilcinin
+        kendi kopyaları yinelenen içerik referansı olarak yazılır.
+        """
+        unique_files = []
+        copies: Dict[str, List[str]] = {}  # hash -> ilk dosyadan sonraki kopyalar
+        for file_path in files:
+            digest = hashes.get(file_path)
+            size = sizes.get(file_path)
+            if digest is None or self.policy_manager.should_skip(file_path, size):
+                continue
+            if digest in copies:
+                copies[digest].append(file_path)
+                continue
+            copies[digest] = []
+            unique_files.append(file_path)
+        
+        similar_members = {}
+        for members in self.near_duplicate_index.find_clusters(unique_files, hashes):
+            collapsed = list(members[1:])
+            for member in members[1:]:
+                collapsed.extend(copies[hashes[member]])
+            similar_members[members[0]] = collapsed
+        return similar_members
     
     def _format_display_path(self, file_path: str | Path, ref_path: Path) -> str:
         """Görüntülenecek yolu formatlar."""
@@ -42,22 +178,51 @@ Code:
         files: List[str],
         output_dir: str | Path,
         group_by: Optional[str] = None,
-        custom_name: Optional[str] = None
+        custom_name: Optional[str] = None,
+        deduplicate: bool = True,
+        collapse_similar: bool = False,
+        token_budget: Optional[int] = None,
+        priority: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Path]:
         """
         Dosyaları dışa aktarır.
         
+        İşlem özeti `last_summary` özelliğinde saklanır.
+        
         Args:
             files: Dışa aktarılacak dosyaların yolları
             output_dir: Çıktı klasörü
             group_by: Gruplandırma türü ('layer', 'folder' veya None)
             custom_name: Özel dosya adı
+            deduplicate: Aynı çıktıyı üreten dosyalar ilk örneğe referans olarak
+                yazılır; işlenmiş içerik yazılırken hash'lenir, kopya olduğu
+                anlaşılan kayıt geri alınıp referansla değiştirilir (her dosya
+                bir kez okunur)
+            collapse_similar: Birbirine çok benzeyen dosyalardan yalnızca ilki yazılır,
+                diğerleri onun kaydında listelenir
+            token_budget: Tahmini toplam token sınırı (None ise sınırsız)
+            priority: Bütçe doluyken önce alınacak dosyalar için dosya -> öncelik
+                (büyük değer önce, örn. churn indeksinden commit sayısı)
             
         Returns:
             Dict[str, Path]: Oluşturulan dosyaların grup adı ve yolları
         """
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
+        summary = self.last_summary = ExportSummary()
+        
+        # Dosya boyutlarını al
+        sizes: Dict[str, Optional[int]] = {}
+        for file_path in files:
+            try:
+                sizes[file_path] = os.stat(file_path).st_size
+            except OSError:
+                sizes[file_path] = None
+        
+        # Bütçe varsa öncelikli dosyalardan başlayarak sığanları al
+        if token_budget:
+            files = self._apply_token_budget(files, sizes, token_budget, priority or {})
+            summary.over_budget_files = len(sizes) - len(files)
         
         # Dosyaları gruplara ayır
         if group_by == 'folder':
@@ -69,6 +234,25 @@ Code:
         
         exported_files = {}
         
+        # Benzer dosya kümelemesi ham içerik hash'lerini önceden ister
+        hashes = {}
+        if collapse_similar:
+            hashes = self._hash_files(sizes)
+        # Boyutu benzersiz olan dosyanın kopyası olamaz, yalnızca çakışanlar hash'lenir
+        size_counts: Dict[int, int] = {}
+        for file_path in files:
+            size = sizes[file_path]
+            if size:
+                size_counts[size] = size_counts.get(size, 0) + 1
+        # hash -> (ilk kopyanın çıktı dosyası, görüntülenen yolu)
+        first_seen: Dict[str, Tuple[str, str]] = {}
+        
+        # Benzer dosya kümeleri: temsilci -> diğer üyeler
+        similar_members: Dict[str, List[str]] = {}
+        if collapse_similar:
+            similar_members = self._find_similar_files(files, sizes, hashes)
+        collapsed = {member for members in similar_members.values() for member in members}
+        
         # Her grup için ayrı dosya oluştur
         for group_name, group_files in groups.items():
             if not group_files:  # Boş grupları atla
@@ -86,38 +270,200 @@ Code:
             ref_path = Path(group_files[0]).parent.parent
             
             # Dosyaları aktar
-            for file_path in group_files:
-                try:
-                    # Dosya içeriğini oku
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-
-                    # Uzantıya özel içerik işleme
-                    content = self.extension_manager.process_content(Path(file_path), content)
+            with open(export_path, 'a', encoding='utf-8') as out:
+                for file_path in group_files:
+                    # Boyut sınırını aşan dosyalar okunmaz, yalnızca tek satırlık not yazılır
+                    size = sizes[file_path]
+                    if size is not None and self.policy_manager.should_skip(file_path, size):
+                        self._write_entry(out, self._format_display_path(file_path, ref_path),
+                                          [skipped_marker(size)])
+                        summary.skipped_files += 1
+                        continue
+                    
+                    # Benzer dosya kümesinin temsilcisi dışındaki üyeler yazılmaz
+                    if file_path in collapsed:
+                        summary.similar_files += 1
+                        summary.bytes_saved += size or 0
+                        continue
                     
                     # Path'i formatla
                     display_path = self._format_display_path(file_path, ref_path)
                     
-                    # İçeriği formatla ve dosyaya ekle
-                    content = self.export_format.format(
-                        file_path=display_path,
-                        file_content=content,
-                        separator=self.separator
-                    )
-                    self._append_to_file(export_path, content)
+                    try:
+                        encoding = get_file_encoding(file_path)
+                    except OSError:
+                        encoding = 'utf-8'
+                    
+                    # Dosyayı parça parça oku ve uzantıya özel işlemden geçir
+                    chunks = self._iter_source(file_path, size, encoding)
+                    chunks = self.extension_manager.process_stream(Path(file_path), chunks)
+                    members = similar_members.get(file_path)
+                    
+                    # Kırpılmadan tam yazılacak, boyutu çakışan dosyalar yazarken hash'lenir.
+                    # Hash işlenmiş çıktıdan alınır: aynı baytlar farklı uzantı işlemcisinden
+                    # geçince farklı çıktı verir. Küme temsilcileri üye listesini taşıdığından
+                    # referansa çevrilmez.
+                    hasher = None
+                    if deduplicate and not members and size_counts.get(size, 0) > 1:
+                        policy = self.policy_manager.get_policy(file_path)
+                        if policy is None or not policy.applies_to(size):
+                            hasher = content_hasher()
+                            entry_start = out.tell()
+                            chunks = self._hashed(chunks, hasher)
                     
-                except Exception as e:
-                    error_content = self.export_format.format(
-                        file_path=str(file_path),
-                        file_content=f"Dosya okuma hatası: {str(e)}",
-                        separator=self.separator
-                    )
-                    self._append_to_file(export_path, error_content)
+                    if members:
+                        member_paths = ", ".join(
+                            self._format_display_path(m, ref_path) for m in members
+                        )
+                        chunks = itertools.chain(
+                            chunks, [f"\n[Benzer dosyalar ({len(members)}): {member_paths}]"]
+                        )
+                    complete = self._write_entry(out, display_path, chunks)
+                    if hasher is not None and complete:
+                        digest = hasher.hexdigest()
+                        original = first_seen.get(digest)
+                        if original is not None:
+                            # Kopya olduğu yazarken anlaşıldı, kaydı referansla değiştir
+                            out.seek(entry_start)
+                            out.truncate()
+                            self._write_entry(out, display_path,
+                                              [self._reference_entry(original, export_path.name)])
+                            summary.duplicate_files += 1
+                            summary.bytes_saved += size
+                            continue
+                        first_seen[digest] = (export_path.name, display_path)
+                    summary.exported_files += 1
             
             exported_files[group_name] = export_path
         
+        logging.info(f"Dışa aktarma özeti: {summary}")
         return exported_files
     
+    def _apply_token_budget(
+        self,
+        files: List[str],
+        sizes: Dict[str, Optional[int]],
+        token_budget: int,
+        priority: Dict[str, Any]
+    ) -> List[str]:
+        """Öncelik sırasıyla bütçeye sığan dosyaları seçer, özgün sırayı korur."""
+        ordered = sorted(files, key=lambda f: priority.get(f, 0), reverse=True)
+        remaining = token_budget
+        chosen = set()
+        for file_path in ordered:
+            tokens = estimate_tokens(sizes.get(file_path) or 0)
+            if tokens <= remaining:
+                chosen.add(file_path)
+                remaining -= tokens
+        logging.info(f"Token bütçesi: {len(chosen)}/{len(files)} dosya, "
+                     f"{token_budget - remaining}/{token_budget} token")
+        return [f for f in files if f in chosen]
+    
+    def export_diffs(
+        self,
+        files: List[str],
+        diffs: Iterable[Tuple[str, str]],
+        output_dir: str | Path,
+        custom_name: Optional[str] = None
+    ) -> Dict[str, Path]:
+        """
+        Dosyaların tamamı yerine yalnızca değişen kısımlarını (diff) dışa aktarır.
+        
+        Args:
+            files: Seçili dosyaların yolları (görüntülenen yolların referansı için)
+            diffs: (dosya yolu, diff metni) çiftleri, akış halinde tüketilir
+            output_dir: Çıktı klasörü
+            custom_name: Özel dosya adı
+            
+        Returns:
+            Dict[str, Path]: Oluşturulan dosyanın adı ve yolu
+        """
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+        summary = self.last_summary = ExportSummary()
+        if not files:
+            return {}
+        
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        name = custom_name or f"diff_{timestamp}"
+        safe_name = "".join(c if c.isalnum() or c in ('-', '_') else '_' for c in name)
+        export_path = output_path / f"{safe_name}.txt"
+        self._create_export_file(export_path)
+        
+        ref_path = Path(files[0]).parent.parent
+        with open(export_path, 'a', encoding='utf-8') as out:
+            for file_path, diff in diffs:
+                display_path = self._format_display_path(file_path, ref_path)
+                self._write_entry(out, display_path, [diff])
+                summary.exported_files += 1
+        
+        logging.info(f"Diff dışa aktarma özeti: {summary}")
+        return {name: export_path}
+    
+    def export_ref_changes(
+        self,
+        changes: List[dict],
+        blobs: Iterable[Tuple[str, Optional[bytes]]],
+        output_dir: str | Path,
+        custom_name: Optional[str] = None
+    ) -> Dict[str, Path]:
+        """
+        İki Git referansı arasında değişen dosyaların yeni hallerini dışa aktarır.
+        
+        Args:
+            changes: GitRefChange kayıtları (blobs ile aynı sırada)
+            blobs: (spec, içerik) çiftleri, silinen dosyalar için içerik None
+            output_dir: Çıktı klasörü
+            custom_name: Özel dosya adı
+            
+        Returns:
+            Dict[str, Path]: Oluşturulan dosyanın adı ve yolu
+        """
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+        summary = self.last_summary = ExportSummary()
+        
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        name = custom_name or f"changes_{timestamp}"
+        safe_name = "".join(c if c.isalnum() or c in ('-', '_') else '_' for c in name)
+        export_path = output_path / f"{safe_name}.txt"
+        self._create_export_file(export_path)
+        
+        first_seen: Dict[str, str] = {}
+        with open(export_path, 'a', encoding='utf-8') as out:
+            for change, (_, data) in zip(changes, blobs):
+                path = change['path']
+                display_path = path
+                if change.get('old_path'):
+                    display_path = f"{path} (eski: {change['old_path']})"
+                
+                if data is None:
+                    self._write_entry(out, display_path, ["[Dosya silindi]"])
+                    summary.exported_files += 1
+                    continue
+                if self.policy_manager.should_skip(path, len(data)):
+                    self._write_entry(out, display_path, [skipped_marker(len(data))])
+                    summary.skipped_files += 1
+                    continue
+                
+                # Aynı çıktı daha önce yazıldıysa referans ver; hash işlenmiş
+                # içerikten alınır ki farklı uzantı işlemcileri karışmasın
+                content = self.extension_manager.process_content(Path(path), decode_bytes(data))
+                digest = hashlib.blake2b(content.encode('utf-8', 'surrogatepass'),
+                                         digest_size=16).hexdigest()
+                if digest in first_seen:
+                    self._write_entry(out, display_path, [f"[Aynı içerik: {first_seen[digest]}]"])
+                    summary.duplicate_files += 1
+                    summary.bytes_saved += len(data)
+                    continue
+                first_seen[digest] = path
+                
+                self._write_entry(out, display_path, [content])
+                summary.exported_files += 1
+        
+        logging.info(f"Referans değişiklikleri dışa aktarma özeti: {summary}")
+        return {name: export_path}
+    
     def _group_by_folder(self, files: List[str]) -> Dict[str, List[str]]:
         """Dosyaları üst klasörlere göre gruplar."""
         groups: Dict[str, List[str]] = {}
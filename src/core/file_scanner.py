@@ -14,6 +14,7 @@ class FileScanner:
     
     def __init__(self, config_manager=None, extension_manager=None):
         self._scanned_files: List[FileInfo] = []
+        self._path_index: Optional[Dict[str, FileInfo]] = None  # Yol -> dosya (gerektiğinde)
         self._excluded_dirs: Set[str] = {'.git', 'node_modules', 'bin', 'obj', 'build', 'dist'}
         self._lock = Lock()
         self._file_queue = Queue(maxsize=1000)
@@ -29,13 +30,17 @@ class FileScanner:
             self.extension_manager = ExtensionManager(exts)
         else:
             self.extension_manager = extension_manager
+
+        from .large_file_policy import LargeFilePolicyManager
+        self.policy_manager = LargeFilePolicyManager.from_config(self.config_manager)
     
     def refresh_extensions(self):
-        """Desteklenen uzantıları yeniden yükler."""
+        """Desteklenen uzantıları ve büyük dosya politikalarını yeniden yükler."""
         exts = None
         if self.config_manager:
             exts = self.config_manager.get('supported_extensions', None)
         self.extension_manager = type(self.extension_manager)(exts)
+        self.policy_manager = type(self.policy_manager).from_config(self.config_manager)
         
     @property
     def scanned_files(self) -> List[FileInfo]:
@@ -58,7 +63,8 @@ class FileScanner:
                 try:
                     if entry.is_file():
                         # Dosya uzantısını kontrol et
-                        if self._is_supported_file(Path(entry.name)):
+                        if (self._is_supported_file(Path(entry.name)) and
+                                not self.policy_manager.should_skip(entry.name, entry.stat().st_size)):
                             self._file_queue.put(entry.path)
                             self._total_files += 1
                     elif entry.is_dir() and not self._should_skip_directory(entry.name):
@@ -101,6 +107,7 @@ class FileScanner:
         
         # Önceki tarama sonuçlarını temizle
         self._scanned_files.clear()
+        self._path_index = None
         self._processed_count = 0
         self._total_files = 0
         
@@ -179,12 +186,10 @@ class FileScanner:
         self.update_info_label()
     
     def get_file_by_path(self, file_path: str | Path) -> FileInfo | None:
-        """Belirtilen yoldaki dosyayı bulur."""
-        path_str = str(Path(file_path))
-        for file_info in self._scanned_files:
-            if str(file_info.path) == path_str:
-                return file_info
-        return None
+        """Belirtilen yoldaki dosyayı yol indeksinden O(1) bulur."""
+        if self._path_index is None or len(self._path_index) != len(self._scanned_files):
+            self._path_index = {str(f.path): f for f in self._scanned_files}
+        return self._path_index.get(str(Path(file_path)))
     
     def select_all(self, selected: bool = True) -> None:
         """Tüm dosyaları seçer veya seçimi kaldırır."""
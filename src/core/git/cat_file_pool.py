@@ -0,0 +1,176 @@
+import logging
+import queue
+import subprocess
+import threading
+from typing import Iterable, Iterator, List, Optional, Tuple
+from .git_exceptions import GitOperationError
+
+# (sha, tür, boyut)
+ObjectInfo = Tuple[str, str, int]
+
+
+def _parse_header(header: bytes) -> Optional[ObjectInfo]:
+    """cat-file başlık satırını çözer; nesne yoksa veya belirsizse None döndürür.
+
+    Bulunamayan nesnelerde satır "<spec> missing" biçimindedir ve spec boşluk
+    içerebilir; bu yüzden alan sayısına değil son eke bakılır.
+    """
+    header = header.rstrip()
+    if header.endswith((b' missing', b' ambiguous')):
+        return None
+    sha, kind, size = header.rsplit(b' ', 2)
+    return sha.decode('ascii'), kind.decode('ascii'), int(size)
+
+
+class _CatFileProcess:
+    """Tek bir uzun ömürlü `git cat-file --batch[-check]` süreci."""
+
+    def __init__(self, cwd: str, check_only: bool):
+        self.check_only = check_only
+        mode = '--batch-check' if check_only else '--batch'
+        self.process = subprocess.Popen(
+            ['git', 'cat-file', mode], cwd=cwd,
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+        )
+
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def request(self, specs: List[bytes]) -> Iterator[Tuple[Optional[ObjectInfo], Optional[bytes]]]:
+        """İstekleri yazar, her biri için (bilgi, içerik) döndürür.
+
+        İstekler ayrı bir iş parçacığından yazılır, çıktı bu sırada okunur.
+        Yazma ve okuma sıralı yapılsaydı boru tamponları dolduğunda (Windows'ta
+        4 KB) git çıktısını, biz de girdiyi yazmayı bekleyip kilitlenebilirdik.
+        """
+        stdin, stdout = self.process.stdin, self.process.stdout
+        errors: List[Exception] = []
+
+        def feed():
+            try:
+                stdin.write(b''.join(spec + b'\n' for spec in specs))
+                stdin.flush()
+            except (OSError, ValueError) as e:
+                errors.append(e)
+
+        writer = threading.Thread(target=feed, name='cat-file-stdin', daemon=True)
+        writer.start()
+        for _ in range(len(specs)):
+            header = stdout.readline()
+            if not header:
+                raise GitOperationError("git cat-file beklenmedik şekilde sonlandı")
+            info = _parse_header(header)
+            if info is None:
+                yield None, None
+                continue
+            if self.check_only:
+                yield info, None
+            else:
+                data = stdout.read(info[2])
+                stdout.read(1)  # İçerikten sonraki yeni satır
+                yield info, data
+        # Tüm yanıtlar okunduysa yazma bitmiştir; hata durumunda süreç kapatılınca çözülür
+        writer.join()
+        if errors:
+            raise errors[0]
+
+    def close(self) -> None:
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+        try:
+            self.process.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+        self.process.stdout.close()
+
+
+class CatFilePool:
+    """Repository başına uzun ömürlü `git cat-file` süreç havuzu.
+
+    Her istek havuzdan boşta bir süreç alır, yoksa en fazla `size` sürece
+    kadar yenisini başlatır, diğer durumlarda boşa çıkanı bekler. Süreçler
+    istekler arasında açık kalır, böylece okuma başına süreç başlatma
+    maliyeti olmaz. Tüm metotlar iş parçacığı güvenlidir.
+    """
+
+    def __init__(self, cwd: str, size: int = 2):
+        self.cwd = cwd
+        self.size = size
+        self._idle = {False: queue.LifoQueue(), True: queue.LifoQueue()}
+        self._counts = {False: 0, True: 0}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _acquire(self, check_only: bool) -> _CatFileProcess:
+        idle = self._idle[check_only]
+        while True:
+            with self._lock:
+                if self._closed:
+                    raise GitOperationError("cat-file havuzu kapatıldı")
+                try:
+                    proc = idle.get_nowait()
+                except queue.Empty:
+                    proc = None
+                    if self._counts[check_only] < self.size:
+                        self._counts[check_only] += 1
+                        try:
+                            return _CatFileProcess(self.cwd, check_only)
+                        except OSError as e:
+                            self._counts[check_only] -= 1
+                            raise GitOperationError(f"git cat-file başlatılamadı: {e}")
+            if proc is None:
+                proc = idle.get()
+            if proc.alive():
+                return proc
+            # Ölmüş süreci at, yerine yenisi başlatılabilsin
+            with self._lock:
+                self._counts[check_only] -= 1
+
+    def _release(self, proc: _CatFileProcess, healthy: bool) -> None:
+        with self._lock:
+            if healthy and not self._closed:
+                self._idle[proc.check_only].put(proc)
+                return
+            self._counts[proc.check_only] -= 1
+        proc.close()
+
+    def _request(self, specs: Iterable[str], check_only: bool):
+        # Satır tabanlı protokol yeni satır içeren spec'leri taşıyamaz
+        encoded = [spec.encode('utf-8') if '\n' not in spec else None for spec in specs]
+        valid = [spec for spec in encoded if spec is not None]
+        proc = self._acquire(check_only)
+        healthy = False
+        try:
+            results = list(proc.request(valid))
+            healthy = True
+        except (OSError, ValueError) as e:
+            raise GitOperationError(f"git cat-file isteği başarısız: {e}")
+        finally:
+            self._release(proc, healthy)
+
+        results = iter(results)
+        return [next(results) if spec is not None else (None, None) for spec in encoded]
+
+    def read(self, specs: Iterable[str]) -> List[Optional[bytes]]:
+        """'<ref>:<yol>' veya SHA'ların içeriklerini okur, olmayanlar için None."""
+        return [data for _, data in self._request(specs, False)]
+
+    def info(self, specs: Iterable[str]) -> List[Optional[ObjectInfo]]:
+        """Nesnelerin (sha, tür, boyut) bilgisini okur, olmayanlar için None."""
+        return [info for info, _ in self._request(specs, True)]
+
+    def close(self) -> None:
+        """Tüm süreçleri kapatır."""
+        with self._lock:
+            self._closed = True
+            procs = []
+            for idle in self._idle.values():
+                while not idle.empty():
+                    procs.append(idle.get_nowait())
+        for proc in procs:
+            proc.close()
+        if procs:
+            logging.info(f"{len(procs)} cat-file süreci kapatıldı: {self.cwd}")
@@ -0,0 +1,180 @@
+import json
+import logging
+import os
+import subprocess
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from .git_exceptions import GitOperationError
+from .git_repository import _unquote_path
+
+_INDEX_VERSION = 1
+_COMMIT_MARK = '\x1e'
+
+
+class ChurnIndex:
+    """Git geçmişinden dosya başına değişiklik (churn) ve güncellik indeksi.
+
+    Her dosya için commit sayısı, son değişiklik zamanı ve değiştiren
+    yazarlar tutulur. Yazarlar bir listede tekilleştirilir, dosyalarda
+    yalnızca sıra numaraları saklanır. İndeks diske yazılır ve sonraki
+    güncellemelerde yalnızca son indekslenen commit'ten sonraki geçmiş
+    okunur.
+    """
+
+    def __init__(self, root: str | Path):
+        self.root = str(root)
+        self.head: Optional[str] = None
+        self.authors: List[str] = []
+        # Göreli yol ('/' ayraçlı) -> [commit sayısı, son değişiklik zamanı, yazar sıraları]
+        self.files: Dict[str, list] = {}
+        self._author_ids: Dict[str, int] = {}
+
+    @classmethod
+    def load(cls, root: str | Path, index_file: Path) -> 'ChurnIndex':
+        """Kayıtlı indeksi yükler; yoksa veya bozuksa boş indeks döndürür."""
+        index = cls(root)
+        try:
+            with open(index_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == _INDEX_VERSION:
+                index.head = data['head']
+                index.authors = data['authors']
+                index.files = data['files']
+                index._author_ids = {a: i for i, a in enumerate(index.authors)}
+        except (OSError, ValueError, KeyError) as e:
+            if not isinstance(e, FileNotFoundError):
+                logging.warning(f"Churn indeksi okunamadı, yeniden oluşturulacak: {e}")
+        return index
+
+    def copy(self) -> 'ChurnIndex':
+        """Arka planda güncellenebilecek bağımsız bir kopya döndürür."""
+        index = ChurnIndex(self.root)
+        index.head = self.head
+        index.authors = list(self.authors)
+        index.files = {path: [e[0], e[1], list(e[2])] for path, e in self.files.items()}
+        index._author_ids = dict(self._author_ids)
+        return index
+
+    def save(self, index_file: Path) -> None:
+        """İndeksi atomik olarak diske yazar."""
+        index_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = index_file.with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': _INDEX_VERSION,
+                'head': self.head,
+                'authors': self.authors,
+                'files': self.files,
+            }, f, separators=(',', ':'))
+        os.replace(tmp_file, index_file)
+
+    def update(self) -> int:
+        """
+        İndeksi HEAD'e kadar günceller.
+
+        Kayıtlı HEAD mevcut HEAD'in atası ise yalnızca aradaki commit'ler
+        okunur, değilse (rebase, branch değişimi) indeks baştan oluşturulur.
+
+        Returns:
+            int: İşlenen commit sayısı
+        """
+        head = self._git('rev-parse', '--verify', '-q', 'HEAD').strip()
+        if not head:
+            return 0  # Henüz commit yok
+        if head == self.head:
+            return 0
+
+        revision = 'HEAD'
+        if self.head and self._is_ancestor(self.head):
+            revision = f'{self.head}..HEAD'
+        else:
+            self.files.clear()
+            self.authors.clear()
+            self._author_ids.clear()
+
+        started = time.perf_counter()
+        commits = self._read_log(revision)
+        self.head = head
+        logging.info(
+            f"Churn indeksi güncellendi: {commits} commit, {len(self.files)} dosya, "
+            f"{time.perf_counter() - started:.2f} sn"
+        )
+        return commits
+
+    def _read_log(self, revision: str) -> int:
+        """`git log --name-only` çıktısını akış halinde okuyup indekse ekler."""
+        process = subprocess.Popen(
+            ['git', '-c', 'core.quotepath=off', 'log', '--name-only', '--no-merges',
+             '--no-renames', f'--format={_COMMIT_MARK}%at\t%aE', revision, '--'],
+            cwd=self.root, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+        )
+        commits = 0
+        timestamp, author_id = 0, 0
+        files = self.files
+        with process.stdout:
+            for raw in process.stdout:
+                line = raw.decode('utf-8', errors='replace').rstrip('\n')
+                if not line:
+                    continue
+                if line[0] == _COMMIT_MARK:
+                    ts, _, author = line[1:].partition('\t')
+                    timestamp = int(ts or 0)
+                    author_id = self._author_id(author)
+                    commits += 1
+                    continue
+
+                entry = files.get(line) if line[0] != '"' else None
+                if entry is None:
+                    path = _unquote_path(line)
+                    entry = files.setdefault(path, [0, 0, []])
+                entry[0] += 1
+                if timestamp > entry[1]:
+                    entry[1] = timestamp
+                if author_id not in entry[2]:
+                    entry[2].append(author_id)
+        if process.wait() != 0:
+            raise GitOperationError("git log okunamadı")
+        return commits
+
+    def _author_id(self, author: str) -> int:
+        author_id = self._author_ids.get(author)
+        if author_id is None:
+            author_id = self._author_ids[author] = len(self.authors)
+            self.authors.append(author)
+        return author_id
+
+    def _is_ancestor(self, commit: str) -> bool:
+        return subprocess.run(
+            ['git', 'merge-base', '--is-ancestor', commit, 'HEAD'],
+            cwd=self.root, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        ).returncode == 0
+
+    def _git(self, *args: str) -> str:
+        result = subprocess.run(['git', *args], cwd=self.root, capture_output=True, text=True)
+        return result.stdout
+
+    def _relative(self, file_path: str | Path) -> str:
+        return os.path.relpath(str(file_path), self.root).replace(os.sep, '/')
+
+    def get(self, file_path: str | Path) -> Optional[Tuple[int, int, int]]:
+        """Dosyanın (commit sayısı, son değişiklik zamanı, yazar sayısı) bilgisini döndürür."""
+        entry = self.files.get(self._relative(file_path))
+        if entry is None:
+            return None
+        return entry[0], entry[1], len(entry[2])
+
+    def commit_count(self, file_path: str | Path) -> int:
+        entry = self.files.get(self._relative(file_path))
+        return entry[0] if entry else 0
+
+    def last_modified(self, file_path: str | Path) -> int:
+        entry = self.files.get(self._relative(file_path))
+        return entry[1] if entry else 0
+
+    def hotspot_threshold(self, ratio: float = 0.1) -> int:
+        """En çok değişen dosyaların ilk `ratio` dilimine girmek için gereken commit sayısı."""
+        if not self.files:
+            return 0
+        counts = sorted((entry[0] for entry in self.files.values()), reverse=True)
+        return counts[max(int(len(counts) * ratio) - 1, 0)]
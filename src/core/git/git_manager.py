@@ -1,28 +1,46 @@
 import logging
+import os
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Callable
+from typing import Dict, List, Optional, Callable, Iterable, Iterator, Tuple
 from .git_repository import GitRepository
-from .git_types import GitFileStatus, GitDiff
+from .git_types import GitFileStatus, GitDiff, GitRefChange
+from .status_parser import iter_status_v2
+from .churn_index import ChurnIndex
+from .models.git_types import GitConfig
 from .git_exceptions import *
 
 class GitManager:
     """Git operasyonları yöneticisi."""
     
-    def __init__(self):
+    def __init__(self, config: Optional[GitConfig] = None):
         self.repositories: Dict[Path, GitRepository] = {}
         self.status_callbacks: List[Callable] = []
+        self.config = config or GitConfig()
+        self._repo_lock = threading.Lock()
+        # Repository -> (oluşturulma zamanı, index/HEAD damgası, durum)
+        self._status_cache: Dict[Path, Tuple[float, tuple, Dict[str, GitFileStatus]]] = {}
+        self._cache_lock = threading.Lock()
+        # Repository -> geçmişten çıkarılan churn indeksi
+        self._churn: Dict[Path, ChurnIndex] = {}
+        self._churn_lock = threading.Lock()
     
     def init_repository(self, path: Path) -> GitRepository:
         """Repository'yi başlat veya mevcut olanı getir."""
-        if path not in self.repositories:
-            try:
-                repo = GitRepository(path)
-                logging.info(f"Repository başarıyla başlatıldı: {path}")
-                self.repositories[path] = repo
-                return repo
-            except GitException as e:
-                raise GitInitError(f"Repository başlatılamadı: {str(e)}")
-        return self.repositories[path]
+        # Arka plan işleri aynı repository'yi aynı anda açabilir
+        with self._repo_lock:
+            if path not in self.repositories:
+                try:
+                    repo = GitRepository(path)
+                    logging.info(f"Repository başarıyla başlatıldı: {path}")
+                    self.repositories[path] = repo
+                    return repo
+                except GitException as e:
+                    raise GitInitError(f"Repository başlatılamadı: {str(e)}")
+            return self.repositories[path]
     
     def get_repository(self, path: Path) -> Optional[GitRepository]:
         """Path için repository döndür."""
@@ -32,55 +50,260 @@ class GitManager:
         """Durum değişikliklerini izle."""
         self.status_callbacks.append(callback)
     
-    def check_changes(self, path: Path) -> Dict[Path, GitFileStatus]:
-        """Değişiklikleri kontrol et."""
-        logging.info(f"Git değişiklikleri kontrol ediliyor: {path}")
-
+    def invalidate_status(self, path: Optional[Path] = None, only_if_stale: bool = False) -> None:
+        """
+        Durum önbelleğini temizle (path verilmezse tüm repository'ler için).
+        
+        only_if_stale verilirse kayıt yalnızca index/HEAD damgası değiştiyse
+        silinir; git status'un index'e kendi yazdığı untracked cache
+        önbelleği geçersiz kılmaz.
+        """
+        with self._cache_lock:
+            if path is None:
+                self._status_cache.clear()
+            elif only_if_stale:
+                cached = self._status_cache.get(Path(path))
+                if cached and cached[1] != self._status_stamp(Path(path)):
+                    del self._status_cache[Path(path)]
+            else:
+                self._status_cache.pop(Path(path), None)
+        logging.debug(f"Git durum önbelleği temizlendi: {path or 'tümü'}")
+    
+    def _status_stamp(self, path: Path) -> tuple:
+        """Index ve HEAD dosyalarının değişiklik damgasını döndür."""
+        git_dir = Path(path) / '.git'
+        repo = self.get_repository(path)
+        if repo and repo.repo:
+            git_dir = Path(repo.repo.git_dir)
+        
+        stamp = []
+        for name in ('index', 'HEAD'):
+            try:
+                st = os.stat(git_dir / name)
+                stamp.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                stamp.append(None)
+        return tuple(stamp)
+    
+    def _status_command(self, root: Path, path: Path) -> List[str]:
+        """Ayarlara göre git status komutunu oluştur."""
+        cmd = ['git']
+        if self.config.use_untracked_cache:
+            cmd += ['-c', 'core.untrackedCache=true']
+        else:
+            # Kullanıcının repository ayarı korunur; yalnızca index yeniden
+            # yazılmasın ki damga ve izleyiciler etkilenmesin
+            cmd.append('--no-optional-locks')
+        if self.config.use_fsmonitor:
+            cmd += ['-c', 'core.fsmonitor=true']
+        
+        untracked = self.config.untracked_files
+        if untracked not in ('no', 'normal', 'all'):
+            untracked = 'all'
+        cmd += ['status', '--porcelain=v2', '-z', f'--untracked-files={untracked}']
+        
+        # Yalnızca taranan alt ağaç sorgulansın
+        rel = os.path.relpath(str(path), str(root))
+        if rel != '.':
+            cmd += ['--', rel.replace(os.sep, '/')]
+        return cmd
+    
+    def check_changes(self, path: Path, use_cache: bool = True) -> Dict[str, GitFileStatus]:
+        """
+        Değişiklikleri kontrol et.
+        
+        Anahtarlar dosyaların mutlak yol metinleridir (str(path / göreli_yol)).
+        Sonuç, config.cache_timeout süresince ve index/HEAD değişmediği
+        sürece önbellekten döner. Döndürülen sözlük paylaşılır, değiştirilmemelidir.
+        """
+        path = Path(path)
+        
         # Repository'yi başlat veya mevcut olanı al
         repo = self.get_repository(path) or self.init_repository(path)
+        if not repo:
+            return {}
         
-        if repo:
+        if use_cache and self.config.cache_timeout > 0:
+            with self._cache_lock:
+                cached = self._status_cache.get(path)
+            if cached:
+                created, stamp, changes = cached
+                if (time.monotonic() - created < self.config.cache_timeout
+                        and stamp == self._status_stamp(path)):
+                    logging.debug(f"Git durumu önbellekten alındı: {path}")
+                    return changes
+        
+        logging.info(f"Git değişiklikleri kontrol ediliyor: {path}")
+        root = Path(repo.repo.working_tree_dir) if repo.repo else path
+        cmd = self._status_command(root, path)
+        # Untracked cache index'e yazılabilsin diye kilitlere izin verilirse
+        # damga komuttan sonra alınır, aksi halde önce
+        allow_index_write = self.config.use_untracked_cache
+        if not allow_index_write:
+            stamp = self._status_stamp(path)
+        
+        # Yollar repository köküne göredir
+        prefix = str(root) + os.sep
+        convert_sep = os.sep != '/'
+        changes: Dict[str, GitFileStatus] = {}
+        submodules = 0
+        started = time.perf_counter()
+        try:
+            process = subprocess.Popen(
+                cmd,
+                cwd=str(root),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+            with process.stdout:
+                for rel_path, status, _, is_submodule in iter_status_v2(process.stdout):
+                    if convert_sep:
+                        rel_path = rel_path.replace('/', os.sep)
+                    changes[prefix + rel_path] = status
+                    submodules += is_submodule
+            if process.wait() != 0:
+                raise GitOperationError(f"git status {process.returncode} koduyla sonlandı")
+        except GitException:
+            raise
+        except Exception as e:
+            logging.error(f"Git değişiklikleri kontrol edilirken hata: {e}")
+            raise GitException(f"Git değişiklikleri kontrol edilemedi: {e}")
+        
+        if allow_index_write:
+            stamp = self._status_stamp(path)
+        logging.info(
+            f"git status {time.perf_counter() - started:.2f} sn sürdü: "
+            f"{len(changes)} değişiklik ({submodules} submodule), "
+            f"untracked={self.config.untracked_files}, "
+            f"untrackedCache={self.config.use_untracked_cache}, "
+            f"fsmonitor={self.config.use_fsmonitor}"
+        )
+        
+        with self._cache_lock:
+            self._status_cache[path] = (time.monotonic(), stamp, changes)
+        return changes
+
+    def check_changes_many(self, paths: Iterable[Path], use_cache: bool = True) -> Dict[str, GitFileStatus]:
+        """
+        Birden çok repository'nin (submodule, iç içe repo) durumunu eş zamanlı al ve birleştir.
+        
+        Sorgular config.status_workers iş parçacıklı bir havuzda çalışır, toplam
+        süre en yavaş repository'ye yakındır. Sonuçlar verilen sırayla
+        birleştirilir; aynı yol için sonraki (iç) repository'nin durumu geçerlidir.
+        Repository olmayan yollar atlanır.
+        """
+        paths = list(dict.fromkeys(Path(p) for p in paths))
+        if len(paths) == 1:
             try:
-                # Git komutu çalıştırıp çıktıyı alalım
-                logging.info("Git status komutu çalıştırılıyor...")
-                import subprocess
-                result = subprocess.run(['git', 'status', '--porcelain'], 
-                                        cwd=str(path), 
-                                        capture_output=True, 
-                                        text=True)
-                logging.info(f"Git status çıktısı:\n{result.stdout}")
-                
-                changes = {}
-                for line in result.stdout.splitlines():
-                    if len(line) >= 3:  # En az "XY filename" formatında olmalı
-                        status_code = line[:2].strip()  # Status kodu
-                        file_path = Path(path) / line[3:].strip()  # Dosya yolu
-                        
-                        # Status kodunu analiz et
-                        if status_code.startswith('M'):  # Modified
-                            changes[file_path] = GitFileStatus.MODIFIED
-                            logging.info(f"Modified dosya bulundu: {file_path}")
-                        elif status_code.startswith('A'):  # Added
-                            changes[file_path] = GitFileStatus.ADDED
-                            logging.info(f"Added dosya bulundu: {file_path}")
-                        elif status_code.startswith('D'):  # Deleted
-                            changes[file_path] = GitFileStatus.DELETED
-                            logging.info(f"Deleted dosya bulundu: {file_path}")
-                        elif status_code.startswith('??'):  # Untracked
-                            changes[file_path] = GitFileStatus.UNTRACKED
-                            logging.info(f"Untracked dosya bulundu: {file_path}")
-                
-                logging.info(f"Toplam {len(changes)} değişiklik bulundu")
-                return changes
-                
-            except Exception as e:
-                logging.error(f"Git değişiklikleri kontrol edilirken hata: {e}")
-                raise GitException(f"Git değişiklikleri kontrol edilemedi: {e}")
-        return {}
+                return self.check_changes(paths[0], use_cache)
+            except GitInitError:
+                return {}
+        
+        def check(path: Path):
+            try:
+                return self.check_changes(path, use_cache), None
+            except GitInitError:
+                return None, None
+            except GitException as e:
+                logging.warning(f"Git durumu alınamadı ({path}): {e}")
+                return None, e
+        
+        started = time.perf_counter()
+        workers = max(1, min(self.config.status_workers, len(paths)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='git-status') as executor:
+            results = list(executor.map(check, paths))
+        
+        merged: Dict[str, GitFileStatus] = {}
+        errors = []
+        for changes, error in results:
+            if changes:
+                merged.update(changes)
+            if error:
+                errors.append(error)
+        if errors and len(errors) == len(paths):
+            raise errors[0]
+        
+        logging.info(f"{len(paths)} repository durumu {time.perf_counter() - started:.2f} sn'de alındı "
+                     f"({workers} paralel, {len(merged)} değişiklik)")
+        return merged
 
-    def get_file_diff(self, repo_path: Path, file_path: Path) -> Optional[GitDiff]:
+    def get_file_diff(self, repo_path: Path, file_path: Path) -> Optional[str]:
         """Dosya diff'ini al."""
         repo = self.get_repository(repo_path)
         if repo:
-            return repo.get_diff(file_path)
-        return None
\ No newline at end of file
+            return repo.get_diff(file_path, self.config.diff_context_lines, self.config.max_diff_size)
+        return None
+
+    def iter_file_diffs(self, repo_path: Path, files: Iterable[str | Path],
+                        context_lines: Optional[int] = None) -> Iterator[Tuple[str, str]]:
+        """
+        Seçili dosyaların diff'lerini tek git çağrısıyla dosya bazında döndür.
+        
+        Diff'ler config.max_diff_size ile sınırlanır ve blob SHA'larına göre önbelleğe alınır.
+        """
+        repo = self.get_repository(repo_path) or self.init_repository(repo_path)
+        if context_lines is None:
+            context_lines = self.config.diff_context_lines
+        return repo.iter_diffs(files, context_lines, self.config.max_diff_size)
+
+    def get_changes_between(self, repo_path: Path, base: str, head: str = 'HEAD') -> List[GitRefChange]:
+        """İki referans arasında değişen dosyaları döndür."""
+        repo = self.get_repository(repo_path) or self.init_repository(repo_path)
+        return repo.get_changes_between(base, head)
+
+    def read_blobs(self, repo_path: Path, specs: Iterable[str]) -> Iterator[Tuple[str, Optional[bytes]]]:
+        """Nesne veritabanından toplu içerik oku."""
+        repo = self.get_repository(repo_path) or self.init_repository(repo_path)
+        return repo.read_blobs(specs)
+
+    def close(self) -> None:
+        """Tüm repository'lerin arka plan git süreçlerini kapat."""
+        for repo in self.repositories.values():
+            repo.close()
+
+    def get_churn_index(self, repo_path: Path) -> Optional[ChurnIndex]:
+        """Oluşturulmuş churn indeksini döndür (henüz yoksa None)."""
+        return self._churn.get(Path(repo_path))
+
+    def build_churn_index(self, repo_path: Path) -> ChurnIndex:
+        """
+        Churn indeksini diskten yükle, son indekslenen commit'ten itibaren güncelle ve kaydet.
+        
+        İndeks .git/code_exporter/churn.json dosyasında saklanır.
+        """
+        repo_path = Path(repo_path)
+        repo = self.get_repository(repo_path) or self.init_repository(repo_path)
+        index_file = Path(repo.repo.git_dir) / 'code_exporter' / 'churn.json'
+        
+        with self._churn_lock:
+            index = self._churn.get(repo_path)
+            if index is None:
+                index = ChurnIndex.load(repo.repo.working_tree_dir, index_file)
+            else:
+                # Yayınlanmış indeks okunurken değişmesin
+                index = index.copy()
+            if index.update():
+                try:
+                    index.save(index_file)
+                except OSError as e:
+                    logging.warning(f"Churn indeksi kaydedilemedi: {e}")
+            self._churn[repo_path] = index
+        return index
+
+    def start_churn_index(self, repo_path: Path, callback: Callable) -> threading.Thread:
+        """
+        Churn indeksini arka planda oluştur.
+        
+        callback(repo_path, index) iş parçacığından çağrılır; hata olursa index None olur.
+        """
+        def run():
+            try:
+                index = self.build_churn_index(repo_path)
+            except Exception as e:
+                logging.warning(f"Churn indeksi oluşturulamadı: {e}")
+                index = None
+            callback(Path(repo_path), index)
+        
+        thread = threading.Thread(target=run, name='churn-index', daemon=True)
+        thread.start()
+        return thread
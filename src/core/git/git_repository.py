@@ -1,10 +1,59 @@
 from pathlib import Path
-from typing import List, Optional, Dict
-from dataclasses import dataclass
+from typing import List, Optional, Dict, Iterator, Tuple, Iterable
+from collections import OrderedDict
+from dataclasses import dataclass, field
 import git
 import logging
-from .git_types import GitFileStatus, GitDiff
+import os
+import subprocess
+import threading
+from .git_types import GitFileStatus, GitDiff, GitRefChange
 from .git_exceptions import GitInitError, GitOperationError
+from .cat_file_pool import CatFilePool
+
+_NULL_SHA = '0' * 40
+
+
+class _DiffCache:
+   """(eski blob, yeni blob, bağlam satırı) anahtarlı, bayt bütçeli LRU diff önbelleği."""
+   
+   def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+       self.max_bytes = max_bytes
+       self._entries: OrderedDict = OrderedDict()
+       self._size = 0
+       self._lock = threading.Lock()
+   
+   def get(self, key: tuple, max_size: Optional[int]) -> Optional[str]:
+       """Kayıtlı diff gövdesini döndürür.
+       
+       Kırpılmış kayıt yalnızca aynı sınır için, kırpılmamış kayıt ise
+       sınıra sığıyorsa geçerlidir.
+       """
+       with self._lock:
+           entry = self._entries.get(key)
+           if entry is None:
+               return None
+           body, cut_at, body_bytes = entry
+           if cut_at is not None and max_size != cut_at:
+               return None
+           if cut_at is None and max_size is not None and body_bytes > max_size:
+               return None
+           self._entries.move_to_end(key)
+           return body
+   
+   def put(self, key: tuple, body: str, cut_at: Optional[int]) -> None:
+       # Bütçe ve kırpma sınırı gibi boyut da UTF-8 bayt olarak tutulur
+       body_bytes = len(body.encode('utf-8'))
+       with self._lock:
+           old = self._entries.pop(key, None)
+           if old:
+               self._size -= old[2]
+           self._entries[key] = (body, cut_at, body_bytes)
+           self._size += body_bytes
+           while self._size > self.max_bytes and self._entries:
+               _, (_, _, evicted_bytes) = self._entries.popitem(last=False)
+               self._size -= evicted_bytes
+
 
 @dataclass
 class GitRepository:
@@ -12,15 +61,36 @@ class GitRepository:
    
    path: Path
    repo: Optional[git.Repo] = None
+   diff_cache: _DiffCache = field(default_factory=_DiffCache, repr=False)
+   _cat_file: Optional[CatFilePool] = field(default=None, init=False, repr=False)
+   _cat_file_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
    
    def __post_init__(self):
        """Repository'yi başlat veya bağlan."""
        try:
-           self.repo = git.Repo(self.path)
+           # Alt klasör açıldığında da üstteki repository bulunur
+           self.repo = git.Repo(self.path, search_parent_directories=True)
            logging.info(f"Git repository başarıyla açıldı: {self.path}")
-       except git.exc.InvalidGitRepositoryError:
+       except (git.exc.InvalidGitRepositoryError, git.exc.NoSuchPathError):
            raise GitInitError(f"Geçerli bir Git repository'si bulunamadı: {self.path}")
    
+   @property
+   def cat_file(self) -> CatFilePool:
+       """Repository'nin kalıcı cat-file süreç havuzu (ilk kullanımda oluşturulur)."""
+       with self._cat_file_lock:
+           if self._cat_file is None:
+               if not self.repo:
+                   raise GitOperationError("Repository başlatılmamış")
+               self._cat_file = CatFilePool(self.repo.working_tree_dir)
+           return self._cat_file
+   
+   def close(self) -> None:
+       """Açık git süreçlerini kapatır."""
+       with self._cat_file_lock:
+           pool, self._cat_file = self._cat_file, None
+       if pool is not None:
+           pool.close()
+   
    def get_status(self) -> Dict[Path, GitFileStatus]:
        """Repository durumunu döndür."""
        try:
@@ -57,21 +127,231 @@ class GitRepository:
            logging.error(f"Repository durumu alınırken hata: {e}")
            raise GitOperationError(f"Durum alınamadı: {str(e)}")
    
-   def get_diff(self, file_path: Path) -> GitDiff:
-       """Belirli bir dosyanın diff'ini al."""
-       try:
-           # Diff işlemleri...
-           logging.info(f"Diff alınıyor: {file_path}")
-           if not self.repo:
-               raise GitOperationError("Repository başlatılmamış")
-               
-           diff = self.repo.git.diff(file_path)
-           logging.debug(f"Diff alındı: {len(diff)} karakter")
+   def get_diff(self, file_path: Path, context_lines: int = 3,
+                max_size: Optional[int] = None) -> str:
+       """Belirli bir dosyanın index'e göre diff'ini al (değişiklik yoksa boş metin)."""
+       file_path = Path(file_path)
+       if not file_path.is_absolute():
+           file_path = Path(self.repo.working_tree_dir) / file_path
+       for _, diff in self.iter_diffs([file_path], context_lines, max_size, base=None):
            return diff
+       return ''
+   
+   def iter_diffs(self, file_paths: Iterable[str | Path], context_lines: int = 3,
+                  max_size: Optional[int] = None,
+                  base: Optional[str] = 'HEAD') -> Iterator[Tuple[str, str]]:
+       """
+       Birden çok dosyanın diff'ini tek `git diff` çağrısıyla alır.
+       
+       Önce dosyaların karşılaştırma tarafındaki ve çalışma ağacındaki blob
+       SHA'ları toplu olarak hesaplanır; (eski, yeni, bağlam) anahtarı
+       önbellekte olan ya da değişmemiş dosyalar için git diff çalıştırılmaz.
+       Kalanların çıktısı akış halinde okunur, dosya bazında bölünür ve
+       gövdesi max_size baytı aşan diff'ler okunurken kırpılır.
+       
+       Args:
+           file_paths: Diff'i alınacak dosyaların tam yolları
+           context_lines: Değişikliklerin çevresinde gösterilecek satır sayısı
+           max_size: Dosya başına en fazla diff gövdesi boyutu (None ise sınırsız)
+           base: Karşılaştırılacak referans; None ise index (`git diff` gibi)
            
-       except Exception as e:
-           logging.error(f"Diff alınırken hata: {e}")
+       Yields:
+           Tuple[str, str]: (dosyanın tam yolu, diff metni)
+       """
+       if not self.repo:
+           raise GitOperationError("Repository başlatılmamış")
+       
+       root = self.repo.working_tree_dir
+       wanted = {}
+       for file_path in file_paths:
+           rel = os.path.relpath(str(file_path), root).replace(os.sep, '/')
+           wanted[rel] = str(file_path)
+       if not wanted:
+           return
+       
+       shas = self._blob_shas(list(wanted), base)
+       pending = {}
+       hits = 0
+       for rel, full_path in wanted.items():
+           old_sha, new_sha = shas[rel]
+           if old_sha == new_sha:
+               continue  # Değişiklik yok
+           body = self.diff_cache.get((old_sha, new_sha, context_lines), max_size)
+           if body is not None:
+               hits += 1
+               yield full_path, _render_diff(rel, old_sha, new_sha, body)
+           else:
+               pending[rel] = full_path
+       
+       logging.info(f"Toplu diff: {len(wanted)} dosya, {hits} önbellekten, {len(pending)} git ile")
+       if not pending:
+           return
+       
+       cmd = ['git', '-c', 'core.quotepath=off', 'diff', '--no-color', '--no-ext-diff',
+              f'-U{context_lines}']
+       if base:
+           cmd.append(base)
+       cmd.append('--')
+       # Komut satırı sınırını aşmamak için çok sayıda dosyada pathspec verilmez,
+       # çıktı seçili dosyalara göre süzülür
+       if sum(len(rel) + 1 for rel in pending) < 8000:
+           cmd.extend(pending)
+       
+       try:
+           process = subprocess.Popen(cmd, cwd=root, stdout=subprocess.PIPE,
+                                      stderr=subprocess.DEVNULL)
+       except OSError as e:
+           raise GitOperationError(f"Diff alınamadı: {str(e)}")
+       
+       yielded = set()
+       try:
+           for rel, body, cut_at in _split_diff_output(process.stdout, max_size):
+               if rel not in pending:
+                   continue
+               old_sha, new_sha = shas[rel]
+               self.diff_cache.put((old_sha, new_sha, context_lines), body, cut_at)
+               yielded.add(rel)
+               yield pending[rel], _render_diff(rel, old_sha, new_sha, body)
+       finally:
+           process.stdout.close()
+           process.wait()
+       
+       # `git diff <ref>` takip edilmeyen dosyaları göstermez; bunlar için
+       # tamamı eklenmiş satırlardan oluşan diff üretilir
+       if not base:
+           return
+       for rel, full_path in pending.items():
+           old_sha, new_sha = shas[rel]
+           if rel in yielded or old_sha != _NULL_SHA or new_sha == _NULL_SHA:
+               continue
+           diff = self._added_diff(rel, context_lines, max_size)
+           if diff is None:
+               continue
+           body, cut_at = diff
+           self.diff_cache.put((old_sha, new_sha, context_lines), body, cut_at)
+           yield full_path, _render_diff(rel, old_sha, new_sha, body)
+   
+   def _added_diff(self, rel: str, context_lines: int,
+                   max_size: Optional[int]) -> Optional[Tuple[str, Optional[int]]]:
+       """Takip edilmeyen dosyanın /dev/null'a göre diff gövdesini ve kırpma sınırını döndürür."""
+       cmd = ['git', '-c', 'core.quotepath=off', 'diff', '--no-color', '--no-ext-diff',
+              f'-U{context_lines}', '--no-index', '--', '/dev/null', rel]
+       try:
+           process = subprocess.Popen(cmd, cwd=self.repo.working_tree_dir,
+                                      stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+       except OSError as e:
            raise GitOperationError(f"Diff alınamadı: {str(e)}")
+       try:
+           sections = list(_split_diff_output(process.stdout, max_size))
+       finally:
+           process.stdout.close()
+           process.wait()
+       if not sections:
+           return None
+       _, body, cut_at = sections[0]
+       return body, cut_at
+   
+   def _blob_shas(self, rel_paths: List[str], base: Optional[str] = 'HEAD') -> Dict[str, Tuple[str, str]]:
+       """Dosyaların base'deki (None ise index'teki) ve çalışma ağacındaki blob SHA'larını toplu hesaplar."""
+       root = self.repo.working_tree_dir
+       
+       # Eski taraf: kalıcı cat-file --batch-check süreci, olmayanlar sıfır SHA
+       infos = self.cat_file.info(f"{base or ''}:{rel}" for rel in rel_paths)
+       old = {rel: info[0] if info else _NULL_SHA for rel, info in zip(rel_paths, infos)}
+       
+       # Çalışma ağacı tarafı: mevcut dosyalar tek hash-object çağrısıyla (filtreler uygulanır)
+       existing = [rel for rel in rel_paths if os.path.isfile(os.path.join(root, rel))]
+       new = dict.fromkeys(rel_paths, _NULL_SHA)
+       cmd = ['git', 'hash-object', '--stdin-paths']
+       try:
+           new.update(zip(existing, self._run_batch(cmd, existing)))
+       except GitOperationError:
+           # Tek bir yol (örn. submodule içindeki dosya) tüm toplu çağrıyı
+           # durdurur; diğer dosyalar etkilenmesin diye tek tek denenir
+           for rel in existing:
+               try:
+                   new[rel] = self._run_batch(cmd, [rel])[0]
+               except GitOperationError:
+                   logging.debug(f"Blob SHA'sı hesaplanamadı: {rel}")
+       
+       return {rel: (old[rel], new[rel]) for rel in rel_paths}
+   
+   def _run_batch(self, cmd: List[str], lines: List[str]) -> List[str]:
+       """Satır tabanlı bir git komutuna girdileri verip satır satır çıktısını döndürür."""
+       if not lines:
+           return []
+       try:
+           result = subprocess.run(
+               cmd, cwd=self.repo.working_tree_dir,
+               input=''.join(line + '\n' for line in lines).encode('utf-8'),
+               capture_output=True
+           )
+       except OSError as e:
+           raise GitOperationError(f"{cmd[1]} çalıştırılamadı: {str(e)}")
+       output = result.stdout.decode('utf-8', errors='replace').splitlines()
+       if len(output) != len(lines):
+           raise GitOperationError(f"{cmd[1]} beklenmeyen çıktı üretti")
+       return output
+   
+   def get_changes_between(self, base: str, head: str = 'HEAD') -> List[GitRefChange]:
+       """
+       İki referans arasında değişen dosyaları yeniden adlandırma tespitiyle döndürür.
+       
+       `base...head` karşılaştırması kullanılır, yani head dalında ortak
+       atadan bu yana yapılan değişiklikler listelenir.
+       """
+       if not self.repo:
+           raise GitOperationError("Repository başlatılmamış")
+       
+       try:
+           output = self.repo.git.diff('--name-status', '-z', '-M', f'{base}...{head}')
+       except git.exc.GitCommandError as e:
+           raise GitOperationError(f"Referanslar karşılaştırılamadı: {str(e)}")
+       
+       status_map = {
+           'M': GitFileStatus.MODIFIED, 'T': GitFileStatus.MODIFIED,
+           'A': GitFileStatus.ADDED, 'D': GitFileStatus.DELETED,
+           'R': GitFileStatus.RENAMED, 'C': GitFileStatus.COPIED,
+       }
+       changes: List[GitRefChange] = []
+       fields = output.split('\0')
+       i = 0
+       while i < len(fields) and fields[i]:
+           code = fields[i][0]
+           if code in 'RC':
+               old_path, path = fields[i + 1], fields[i + 2]
+               i += 3
+           else:
+               old_path, path = None, fields[i + 1]
+               i += 2
+           changes.append(GitRefChange(
+               status=status_map.get(code, GitFileStatus.MODIFIED),
+               path=path,
+               old_path=old_path
+           ))
+       
+       logging.info(f"{base}...{head} arasında {len(changes)} değişiklik bulundu")
+       return changes
+   
+   def read_blobs(self, specs: Iterable[str], batch_size: int = 256) -> Iterator[Tuple[str, Optional[bytes]]]:
+       """
+       Nesne veritabanından birden çok içeriği kalıcı `git cat-file --batch` süreçleriyle okur.
+       
+       Args:
+           specs: "<ref>:<yol>" veya nesne SHA'ları
+           batch_size: Bellekte tutulacak en fazla içerik sayısı
+           
+       Yields:
+           Tuple[str, Optional[bytes]]: (spec, içerik), nesne yoksa içerik None
+       """
+       batch: List[str] = []
+       for spec in specs:
+           batch.append(spec)
+           if len(batch) >= batch_size:
+               yield from zip(batch, self.cat_file.read(batch))
+               batch = []
+       if batch:
+           yield from zip(batch, self.cat_file.read(batch))
    
    def _convert_status(self, item) -> GitFileStatus:
        """Git durumunu internal duruma dönüştür."""
@@ -91,4 +371,135 @@ class GitRepository:
                
        except Exception as e:
            logging.error(f"Durum dönüştürme hatası: {e}")
-           return GitFileStatus.UNMODIFIED
\ No newline at end of file
+           return GitFileStatus.UNMODIFIED
+
+
+_C_ESCAPES = {'a': 7, 'b': 8, 't': 9, 'n': 10, 'v': 11, 'f': 12, 'r': 13, '"': 34, '\\': 92}
+
+
+def _unquote_path(path: str) -> str:
+   """Git'in C tarzı tırnaklı yollarını çözer.
+   
+   Kaçış dizileri bayt düzeyinde çözülür (\\NNN sekizlik bir UTF-8 baytıdır),
+   tırnak içindeki diğer karakterler UTF-8 olarak eklenir; sonuç tek seferde
+   çözülür. Çözülemeyen baytlar, işletim sisteminin dosya adlarında olduğu
+   gibi surrogateescape ile korunur.
+   """
+   if len(path) < 2 or path[0] != '"' or path[-1] != '"':
+       return path
+   body = path[1:-1]
+   raw = bytearray()
+   i = 0
+   while i < len(body):
+       char = body[i]
+       if char == '\\' and i + 1 < len(body):
+           escape = body[i + 1]
+           octal = body[i + 1:i + 4]
+           if len(octal) == 3 and all(c in '01234567' for c in octal):
+               raw.append(int(octal, 8) & 0xFF)
+               i += 4
+               continue
+           if escape in _C_ESCAPES:
+               raw.append(_C_ESCAPES[escape])
+               i += 2
+               continue
+       raw += char.encode('utf-8', errors='surrogateescape')
+       i += 1
+   return raw.decode('utf-8', errors='surrogateescape')
+
+
+def _diff_section_path(lines: List[str]) -> Optional[str]:
+   """Bir dosya diff bölümünün başlık satırlarından dosya yolunu çıkarır."""
+   old_path = None
+   for line in lines:
+       # Boşluk içeren yolların sonuna git bir TAB ekler
+       if line.startswith('+++ '):
+           target = line[4:].rstrip('\n').rstrip('\t')
+           if target != '/dev/null':
+               return _unquote_path(target)[2:]
+       elif line.startswith('--- '):
+           source = line[4:].rstrip('\n').rstrip('\t')
+           if source != '/dev/null':
+               old_path = _unquote_path(source)[2:]
+       elif line.startswith('rename to '):
+           return _unquote_path(line[10:].rstrip('\n'))
+       elif line.startswith('@@'):
+           break
+   if old_path:
+       return old_path
+   
+   # Binary veya sadece mod değişikliği: "diff --git a/P b/P"
+   header = lines[0][len('diff --git '):].rstrip('\n')
+   if header.startswith('"'):
+       return _unquote_path(header.split('" ', 1)[0] + '"')[2:]
+   return header[2:2 + (len(header) - 5) // 2]
+
+
+def _diff_header(rel: str, old_sha: str, new_sha: str) -> str:
+   """Önbellekten dönen gövdeler için tutarlı bir diff başlığı oluşturur."""
+   lines = [f"diff --git a/{rel} b/{rel}\n"]
+   lines.append(f"index {old_sha[:7]}..{new_sha[:7]}\n")
+   lines.append("--- /dev/null\n" if old_sha == _NULL_SHA else f"--- a/{rel}\n")
+   lines.append("+++ /dev/null\n" if new_sha == _NULL_SHA else f"+++ b/{rel}\n")
+   return ''.join(lines)
+
+
+def _render_diff(rel: str, old_sha: str, new_sha: str, body: str) -> str:
+   """Gövdeyi güncel yolla oluşturulan başlıkla birleştirir.
+   
+   Önbellek anahtarı yol içermez; aynı blob çifti başka bir yolda da
+   kullanılabileceğinden gövdedeki binary notu da yeniden yazılır.
+   """
+   if body.startswith('Binary files '):
+       old = '/dev/null' if old_sha == _NULL_SHA else f"a/{rel}"
+       new = '/dev/null' if new_sha == _NULL_SHA else f"b/{rel}"
+       body = f"Binary files {old} and {new} differ\n" + body.partition('\n')[2]
+   return _diff_header(rel, old_sha, new_sha) + body
+
+
+def _diff_body(section: List[str]) -> str:
+   """Diff bölümünün başlıktan sonraki kısmını (hunk'lar veya binary notu) döndürür."""
+   for i, line in enumerate(section):
+       if line.startswith('@@') or line.startswith('Binary files'):
+           return ''.join(section[i:])
+   return ''
+
+
+def _split_diff_output(stream, max_size: Optional[int] = None) -> Iterator[Tuple[str, str, Optional[int]]]:
+   """
+   `git diff` çıktısını dosya bazında (göreli yol, gövde, kırpma sınırı) üçlülerine böler.
+   
+   max_size verilirse bir dosyanın diff gövdesi (başlıktan sonraki hunk'lar)
+   bu boyuta ulaştığında kalan satırları biriktirilmeden atlanır; başlık
+   satırları hiçbir zaman kırpılmaz. Kırpılmamış bölümlerde sınır None döner.
+   """
+   section: List[str] = []
+   size = 0
+   in_body = False
+   truncated = False
+   
+   def finish():
+       body = _diff_body(section)
+       if truncated:
+           body += f"\n... [diff kırpıldı, en fazla {max_size} bayt gösteriliyor] ...\n"
+       return _diff_section_path(section), body, max_size if truncated else None
+   
+   for raw in stream:
+       if raw.startswith(b'diff --git ') and section:
+           yield finish()
+           section = []
+           size = 0
+           in_body = False
+           truncated = False
+       if truncated:
+           continue
+       if not in_body:
+           in_body = raw.startswith(b'@@') or raw.startswith(b'Binary files')
+       if in_body:
+           if max_size is not None and size + len(raw) > max_size and size:
+               truncated = True
+               continue
+           size += len(raw)
+       section.append(raw.decode('utf-8', errors='replace'))
+   if section:
+       yield finish()
@@ -10,6 +10,7 @@ class GitFileStatus(Enum):
     RENAMED = auto()
     COPIED = auto()
     UNTRACKED = auto()
+    UNMERGED = auto()
 
 class GitDiff(TypedDict):
     file_path: Path
@@ -20,4 +21,9 @@ class GitDiff(TypedDict):
 class GitChange(TypedDict):
     line_number: int
     type: str  # 'added', 'deleted', 'modified'
-    content: str
\ No newline at end of file
+    content: str
+
+class GitRefChange(TypedDict):
+    status: GitFileStatus
+    path: str                # Yeni yol (repository köküne göre)
+    old_path: Optional[str]  # Yeniden adlandırma/kopyalamada eski yol
@@ -1,5 +1,5 @@
 from enum import Enum, auto
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from pathlib import Path
 from typing import Optional, Dict
 
@@ -12,6 +12,7 @@ class GitFileStatus(Enum):
     RENAMED = auto()
     COPIED = auto()
     UNTRACKED = auto()
+    UNMERGED = auto()
 
 @dataclass
 class GitDiff:
@@ -29,7 +30,17 @@ class GitConfig:
     auto_scan: bool = True
     excluded_branches: list = None
     diff_context_lines: int = 3
+    untracked_files: str = 'all'       # 'no', 'normal' veya 'all'
+    use_untracked_cache: bool = True   # core.untrackedCache
+    use_fsmonitor: bool = False        # core.fsmonitor (daemon/hook gerektirir)
+    status_workers: int = 4            # İç içe repository'ler için eş zamanlı status sayısı
     
     def __post_init__(self):
         if self.excluded_branches is None:
-            self.excluded_branches = ['gh-pages', 'release'] 
\ No newline at end of file
+            self.excluded_branches = ['gh-pages', 'release']
+    
+    @classmethod
+    def from_dict(cls, data: Optional[Dict]) -> 'GitConfig':
+        """Ayar sözlüğünden oluşturur, bilinmeyen anahtarları yok sayar."""
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in (data or {}).items() if k in known})
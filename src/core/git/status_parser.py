@@ -0,0 +1,76 @@
+import os
+from typing import BinaryIO, Iterator, Optional, Tuple
+from .git_types import GitFileStatus
+
+# Porcelain v2 kayıt türüne göre yol alanından önceki boşluk sayısı
+_PATH_FIELD = {b'1': 8, b'2': 9, b'u': 10}
+
+_CODE_STATUS = {
+    ord('M'): GitFileStatus.MODIFIED,
+    ord('T'): GitFileStatus.MODIFIED,
+    ord('A'): GitFileStatus.ADDED,
+    ord('D'): GitFileStatus.DELETED,
+    ord('R'): GitFileStatus.RENAMED,
+    ord('C'): GitFileStatus.COPIED,
+}
+
+# (yol, durum, eski yol, submodule mü)
+StatusEntry = Tuple[str, GitFileStatus, Optional[str], bool]
+
+
+def _iter_records(stream: BinaryIO, chunk_size: int) -> Iterator[bytes]:
+    """NUL ile ayrılmış kayıtları akıştan parça parça okur."""
+    rest = b''
+    while True:
+        data = stream.read(chunk_size)
+        if not data:
+            break
+        records = (rest + data).split(b'\0')
+        rest = records.pop()
+        yield from records
+    if rest:
+        yield rest
+
+
+def iter_status_v2(stream: BinaryIO, chunk_size: int = 64 * 1024) -> Iterator[StatusEntry]:
+    """
+    'git status --porcelain=v2 -z' çıktısını akış halinde ayrıştırır.
+
+    Yollar repository köküne göre ve '/' ayraçlı döner. Yeniden adlandırma
+    ve kopyalamada eski yol da verilir. Yoksayılan dosyalar ve başlık
+    satırları atlanır.
+
+    Args:
+        stream: Komutun ikili stdout akışı
+        chunk_size: Okuma parça boyutu
+    """
+    records = _iter_records(stream, chunk_size)
+    for record in records:
+        kind = record[:1]
+        if kind == b'?':
+            yield os.fsdecode(record[2:]), GitFileStatus.UNTRACKED, None, False
+            continue
+
+        fields = _PATH_FIELD.get(kind)
+        if fields is None:
+            # '#' başlıkları ve '!' yoksayılanlar
+            continue
+
+        parts = record.split(b' ', fields)
+        path = os.fsdecode(parts[fields])
+        is_submodule = parts[2][:1] == b'S'
+
+        if kind == b'u':
+            yield path, GitFileStatus.UNMERGED, None, is_submodule
+            continue
+
+        orig_path = None
+        if kind == b'2':
+            # Eski yol bir sonraki kayıttır
+            orig_path = os.fsdecode(next(records, b''))
+
+        # Önce index (X), değişiklik yoksa çalışma ağacı (Y) durumu
+        xy = parts[1]
+        code = xy[0] if xy[0] != 0x2e else xy[1]
+        status = _CODE_STATUS.get(code, GitFileStatus.MODIFIED)
+        yield path, status, orig_path, is_submodule
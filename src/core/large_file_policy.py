@@ -0,0 +1,250 @@
+import codecs
+import logging
+import os
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+from ..utils.file_utils import DEFAULT_CHUNK_SIZE, iter_file_chunks, format_file_size
+
+# Varsayılan politikalar; ConfigManager varsayılan ayarları da buradan alır
+DEFAULT_POLICIES = {
+    '*': {'mode': 'head_tail', 'max_bytes': 5 * 1024 * 1024,
+          'head_lines': 1000, 'tail_lines': 200},
+    '.min.js': {'mode': 'skip', 'max_bytes': 100 * 1024},
+    '.min.css': {'mode': 'skip', 'max_bytes': 100 * 1024},
+}
+
+
+@dataclass
+class LargeFilePolicy:
+    """Belirli bir boyutun üzerindeki dosyalara uygulanacak politika."""
+
+    mode: str = 'full'        # 'full', 'skip', 'truncate' veya 'head_tail'
+    max_bytes: int = 0        # Politika bu boyutu aşan dosyalara uygulanır
+    head_lines: int = 200     # Baştan alınacak satır sayısı
+    tail_lines: int = 50      # Sondan alınacak satır sayısı ('head_tail' için)
+
+    def applies_to(self, size: int) -> bool:
+        """Politikanın verilen dosya boyutu için geçerli olup olmadığını döndürür."""
+        return self.mode != 'full' and size > self.max_bytes
+
+
+class LargeFilePolicyManager:
+    """Uzantıya göre büyük dosya politikalarını yöneten sınıf.
+
+    Politikalar dosya adının sonuna göre eşleştirilir ('.min.js' gibi
+    birleşik uzantılar desteklenir), en uzun eşleşme kazanır. '*' anahtarı
+    diğer tüm dosyalar için varsayılan politikadır.
+    """
+
+    DEFAULT_POLICIES = DEFAULT_POLICIES
+
+    def __init__(self, policies: Optional[Dict[str, dict]] = None):
+        if policies is None:
+            policies = self.DEFAULT_POLICIES
+
+        known = {f.name for f in fields(LargeFilePolicy)}
+        self._policies: Dict[str, LargeFilePolicy] = {
+            key.lower(): LargeFilePolicy(**{k: v for k, v in value.items() if k in known})
+            for key, value in policies.items()
+        }
+        # Uzun son ekler önce denensin
+        self._suffixes = sorted(
+            (key for key in self._policies if key != '*'),
+            key=len, reverse=True
+        )
+
+    @classmethod
+    def from_config(cls, config_manager) -> 'LargeFilePolicyManager':
+        """ConfigManager'daki 'large_file_policies' ayarından oluşturur."""
+        policies = None
+        if config_manager:
+            policies = config_manager.get('large_file_policies', None)
+        return cls(policies)
+
+    def get_policy(self, file_path: str | Path) -> Optional[LargeFilePolicy]:
+        """Dosya için geçerli politikayı döndürür."""
+        name = os.path.basename(str(file_path)).lower()
+        for suffix in self._suffixes:
+            if name.endswith(suffix):
+                return self._policies[suffix]
+        return self._policies.get('*')
+
+    def should_skip(self, file_path: str | Path, size: Optional[int] = None) -> bool:
+        """Dosyanın boyutu nedeniyle tamamen atlanması gerekip gerekmediğini döndürür."""
+        policy = self.get_policy(file_path)
+        if policy is None or policy.mode != 'skip':
+            return False
+        if size is None:
+            size = os.stat(file_path).st_size
+        return policy.applies_to(size)
+
+    def iter_content(
+        self,
+        file_path: str | Path,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        encoding: str = 'utf-8',
+        size: Optional[int] = None
+    ) -> Iterator[str]:
+        """
+        Dosya içeriğini politikaya göre parça parça okur.
+
+        Politika uygulanmıyorsa dosyanın tamamı okunur. Aksi halde dosya
+        boyutu stat ile alınır ve yalnızca gereken kısımlar seek ile okunur.
+        Satırlar çözülmüş metin üzerinde sayılır; seek konumları kodlamanın
+        kod birimine (UTF-16 için 2, UTF-32 için 4 bayt) hizalanır.
+
+        Args:
+            file_path: Dosya yolu
+            chunk_size: Okuma parça boyutu
+            encoding: Dosya kodlaması (çözülemeyen baytlar değiştirilir)
+            size: Bilinen dosya boyutu (None ise stat ile alınır)
+        """
+        if size is None:
+            size = os.stat(file_path).st_size
+        policy = self.get_policy(file_path)
+
+        if policy is None or not policy.applies_to(size):
+            yield from iter_file_chunks(file_path, chunk_size, encoding, errors='replace')
+            return
+
+        if policy.mode == 'skip':
+            logging.info(f"Büyük dosya atlandı ({size} bayt): {file_path}")
+            yield skipped_marker(size)
+            return
+
+        # Çok uzun satırlara karşı okunacak bayt miktarını da sınırla
+        head_budget = max(policy.max_bytes, chunk_size)
+        if policy.mode == 'head_tail':
+            head_budget = max(head_budget // 2, 1)
+
+        with open(file_path, 'rb') as f:
+            unit, tail_encoding = _code_unit(f, encoding)
+            head = _HeadReader(f, encoding, unit)
+            yield from head.read(policy.head_lines, head_budget, chunk_size)
+
+            if head.complete:
+                return
+            if policy.mode == 'head_tail' and policy.tail_lines > 0:
+                # Kuyruk penceresi başın diskten okunan kısmıyla çakışmaz
+                tail_start = max(size - head_budget, head.raw_end)
+                tail_start += -tail_start % unit
+                tail = _read_tail(f, size, tail_start, policy.tail_lines, unit, tail_encoding)
+                omitted = size - head.text_bytes(tail_encoding) - len(tail.encode(tail_encoding, 'replace'))
+                if omitted > 0:
+                    yield f"\n... [yaklaşık {omitted} bayt atlandı] ...\n"
+                yield tail
+            else:
+                omitted = size - head.text_bytes(tail_encoding)
+                yield f"\n... [dosya kırpıldı, yaklaşık {omitted} bayt gösterilmiyor] ...\n"
+
+
+def skipped_marker(size: int) -> str:
+    """Politika nedeniyle atlanan dosyanın kaydına yazılan tek satır."""
+    return f"[Büyük dosya atlandı ({format_file_size(size)})]"
+
+
+def _code_unit(f, encoding: str):
+    """Kodlamanın kod birimi boyutu ve dosya ortasından çözmek için kodlama.
+
+    BOM'lu UTF-16/32 dosyalarında bayt sırası BOM'dan alınır; dosyanın
+    ortasından okunan kısımda BOM olmadığından açık sıralı kodlama gerekir.
+    """
+    try:
+        name = codecs.lookup(encoding).name
+    except LookupError:
+        return 1, 'utf-8'
+    if name in ('utf-16', 'utf-32'):
+        f.seek(0)
+        bom = f.read(4)
+        f.seek(0)
+        if name == 'utf-32':
+            return 4, 'utf-32-be' if bom.startswith(codecs.BOM_UTF32_BE) else 'utf-32-le'
+        return 2, 'utf-16-be' if bom.startswith(codecs.BOM_UTF16_BE) else 'utf-16-le'
+    if name.startswith('utf-16'):
+        return 2, name
+    if name.startswith('utf-32'):
+        return 4, name
+    if name == 'utf-8-sig':
+        return 1, 'utf-8'
+    return 1, name
+
+
+def _normalize_newlines(text: str) -> str:
+    return text.replace('\r\n', '\n').replace('\r', '\n')
+
+
+class _HeadReader:
+    """Dosyanın başından çözülmüş metin üzerinde satır sayarak okur."""
+
+    def __init__(self, f, encoding: str, unit: int):
+        self.f = f
+        self.decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+        self.unit = unit
+        self.raw_end = 0          # Diskten okunan bayt sayısı
+        self.complete = False     # Dosyanın tamamı yazıldı mı
+        self._written = []        # Yazılan metin parçaları (bayt tahmini için)
+
+    def read(self, max_lines: int, max_bytes: int, chunk_size: int):
+        size = os.fstat(self.f.fileno()).st_size
+        lines = 0
+        carry = ''
+        # Parça boyutu kod birimine hizalanır, karakterler ortadan bölünmez
+        chunk_size = max(chunk_size - chunk_size % self.unit, self.unit)
+        while self.raw_end < max_bytes:
+            data = self.f.read(min(chunk_size, max_bytes - self.raw_end))
+            self.raw_end += len(data)
+            final = self.raw_end >= size
+            text = carry + self.decoder.decode(data, final=final)
+            # Parça sınırına denk gelen CRLF bölünmesin
+            carry = ''
+            if text.endswith('\r') and not final:
+                carry, text = '\r', text[:-1]
+            text = _normalize_newlines(text)
+
+            pos = -1
+            for _ in range(max_lines - lines):
+                pos = text.find('\n', pos + 1)
+                if pos == -1:
+                    break
+                lines += 1
+            if lines >= max_lines and pos != -1:
+                # Kesimden sonra dosyada içerik kalmadıysa dosya tamdır
+                self.complete = final and pos + 1 == len(text)
+                text = text[:pos + 1]
+                self._written.append(text)
+                yield text
+                return
+            if text:
+                self._written.append(text)
+                yield text
+            if final or not data:
+                self.complete = final
+                return
+
+    def text_bytes(self, encoding: str) -> int:
+        """Yazılan baş kısmının yaklaşık bayt karşılığı."""
+        return sum(len(text.encode(encoding, 'replace')) for text in self._written)
+
+
+def _read_tail(f, size: int, start: int, max_lines: int, unit: int, encoding: str) -> str:
+    """Dosyanın sonundan en fazla max_lines satırı okur.
+
+    Pencere bir önceki kod biriminden başlatılır; ilk satır sonuna kadar
+    olan kısım (pencerenin ortasına düşen yarım satır) atılır.
+    """
+    read_from = max(start - unit, 0)
+    f.seek(read_from)
+    text = _normalize_newlines(f.read(size - read_from).decode(encoding, errors='replace'))
+    if read_from > 0:
+        cut = text.find('\n')
+        text = text[cut + 1:] if cut != -1 else ''
+
+    # Son max_lines satırın başlangıcını bul
+    pos = len(text) - 1 if text.endswith('\n') else len(text)
+    for _ in range(max_lines):
+        pos = text.rfind('\n', 0, pos)
+        if pos == -1:
+            break
+    return text[pos + 1:]
@@ -0,0 +1,228 @@
+import hashlib
+import logging
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+
+from ..utils.file_utils import get_file_encoding, iter_file_chunks
+
+_TOKEN_RE = re.compile(r'\w+')
+_EMPTY_BIN = (1 << 64) - 1
+# Süreç havuzuna bir görevde gönderilen dosya sayısı
+_CHUNK_FILES = 32
+
+
+def _minhash(text: str, num_perm: int, shingle_size: int) -> Optional[Tuple[int, ...]]:
+    """Metnin tek permütasyonlu MinHash imzası, shingle yoksa None."""
+    tokens = _TOKEN_RE.findall(text.lower())
+    if not tokens:
+        return None
+
+    k = min(shingle_size, len(tokens))
+    bins = [_EMPTY_BIN] * num_perm
+    for i in range(len(tokens) - k + 1):
+        shingle = ' '.join(tokens[i:i + k]).encode('utf-8')
+        h = int.from_bytes(hashlib.blake2b(shingle, digest_size=8).digest(), 'little')
+        slot = h % num_perm
+        if h < bins[slot]:
+            bins[slot] = h
+    return tuple(bins)
+
+
+def _read_prefix(file_path: str, max_chars: int) -> str:
+    """Dosyanın başından en fazla max_chars karakter okur."""
+    parts = []
+    remaining = max_chars
+    encoding = get_file_encoding(file_path)
+    for chunk in iter_file_chunks(file_path, min(remaining, 256 * 1024), encoding, errors='replace'):
+        parts.append(chunk[:remaining])
+        remaining -= len(parts[-1])
+        if remaining <= 0:
+            break
+    return ''.join(parts)
+
+
+def _signature_chunk(items: List[Tuple[str, str]], num_perm: int, shingle_size: int,
+                     max_chars: int) -> List[Tuple[str, Optional[Tuple[int, ...]]]]:
+    """(hash, yol) listesinin imzalarını hesaplar; süreç havuzunda çalışır."""
+    results = []
+    for digest, file_path in items:
+        try:
+            signature = _minhash(_read_prefix(file_path, max_chars), num_perm, shingle_size)
+        except OSError as e:
+            logging.warning(f"İmza hesaplanamadı ({file_path}): {e}")
+            signature = None
+        results.append((digest, signature))
+    return results
+
+
+class NearDuplicateIndex:
+    """MinHash imzaları ve LSH ile birbirine çok benzeyen dosyaları kümeleyen sınıf.
+
+    İmzalar tek permütasyonlu MinHash ile hesaplanır: her shingle bir kez
+    hash'lenir ve hash değerine göre bir bölmeye atılır, böylece imza
+    maliyeti permütasyon sayısından bağımsızdır. İmzalar içerik hash'ine
+    göre önbelleğe alınır, aynı içerik için tekrar hesaplanmaz. Hesaplama
+    saf Python olduğundan (GIL) yeni imzalar parçalar halinde bir süreç
+    havuzunda hesaplanır; tek çekirdekte veya az dosyada süreç başlatma
+    maliyetine girilmez.
+    """
+
+    def __init__(
+        self,
+        num_perm: int = 64,
+        bands: int = 16,
+        shingle_size: int = 5,
+        threshold: float = 0.8,
+        max_workers: Optional[int] = None,
+        min_parallel_files: int = 64,
+        max_chars: int = 1024 * 1024
+    ):
+        """
+        Args:
+            num_perm: İmza uzunluğu (bölme sayısı)
+            bands: LSH bant sayısı (num_perm'i tam bölmeli)
+            shingle_size: Bir shingle'daki token sayısı
+            threshold: Benzer sayılmak için gereken tahmini Jaccard benzerliği
+            max_workers: İmza hesaplayan süreç sayısı (None ise çekirdek sayısı)
+            min_parallel_files: Süreç havuzunun kullanılacağı en az yeni imza sayısı
+            max_chars: İmza için okunacak en fazla karakter sayısı
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm, bands değerine tam bölünmeli")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.threshold = threshold
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.min_parallel_files = min_parallel_files
+        self.max_chars = max_chars
+        self._signatures: Dict[str, Optional[Tuple[int, ...]]] = {}
+        self._lock = Lock()
+
+    def signature(self, text: str) -> Optional[Tuple[int, ...]]:
+        """Metnin MinHash imzasını hesaplar, shingle yoksa None döndürür."""
+        return _minhash(text, self.num_perm, self.shingle_size)
+
+    def similarity(self, sig_a: Tuple[int, ...], sig_b: Tuple[int, ...]) -> float:
+        """İki imza arasındaki tahmini Jaccard benzerliğini döndürür."""
+        matches = 0
+        used = 0
+        for a, b in zip(sig_a, sig_b):
+            if a == _EMPTY_BIN and b == _EMPTY_BIN:
+                continue
+            used += 1
+            if a == b:
+                matches += 1
+        return matches / used if used else 0.0
+
+    def _file_signature(self, file_path: str) -> Optional[Tuple[int, ...]]:
+        """Dosyanın başından en fazla max_chars karakter okuyup imzasını hesaplar."""
+        return self.signature(_read_prefix(file_path, self.max_chars))
+
+    def _ensure_signatures(self, hashes: Dict[str, str]) -> None:
+        """Önbellekte olmayan içeriklerin imzalarını hesaplar."""
+        with self._lock:
+            pending = {}
+            for file_path, digest in hashes.items():
+                if digest not in self._signatures and digest not in pending:
+                    pending[digest] = file_path
+
+        if not pending:
+            return
+
+        items = list(pending.items())
+        chunks = [items[i:i + _CHUNK_FILES] for i in range(0, len(items), _CHUNK_FILES)]
+        params = (self.num_perm, self.shingle_size, self.max_chars)
+        workers = min(self.max_workers, len(chunks))
+        results = {}
+        if workers > 1 and len(items) >= self.min_parallel_files:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    futures = [executor.submit(_signature_chunk, chunk, *params) for chunk in chunks]
+                    for future in futures:
+                        results.update(future.result())
+            except (OSError, BrokenProcessPool) as e:
+                logging.warning(f"İmza süreç havuzu kullanılamadı, sıralı hesaplanıyor: {e}")
+        for chunk in chunks:
+            if chunk[0][0] not in results:
+                results.update(_signature_chunk(chunk, *params))
+
+        with self._lock:
+            self._signatures.update(results)
+        logging.debug(f"{len(results)} yeni MinHash imzası hesaplandı")
+
+    def find_clusters(self, files: List[str], hashes: Dict[str, str]) -> List[List[str]]:
+        """
+        Benzer dosyaları kümeler.
+
+        Args:
+            files: Kümelenecek dosyalar (sıra, temsilci seçimini belirler)
+            hashes: Dosya yolu -> içerik hash'i
+
+        Returns:
+            List[List[str]]: En az iki elemanlı kümeler, ilk eleman temsilcidir
+        """
+        files = [f for f in files if f in hashes]
+        self._ensure_signatures(hashes)
+
+        signatures = []
+        for file_path in files:
+            signatures.append(self._signatures.get(hashes[file_path]))
+
+        # LSH: aynı bantta aynı değerlere sahip dosyalar aday çift olur
+        buckets: Dict[Tuple, List[int]] = {}
+        for idx, sig in enumerate(signatures):
+            if sig is None:
+                continue
+            for band in range(self.bands):
+                start = band * self.rows
+                rows = sig[start:start + self.rows]
+                # Tümü boş bölmelerden oluşan bant benzerlik göstermez; küçük
+                # dosyaların hepsini aynı kovaya toplamasın
+                if rows.count(_EMPTY_BIN) == self.rows:
+                    continue
+                key = (band,) + rows
+                buckets.setdefault(key, []).append(idx)
+
+        # Union-find ile adayları doğrulayarak birleştir
+        parent = list(range(len(files)))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        def union(a, b):
+            # Küçük indeks kök olsun, temsilci ilk seçilen dosya olur
+            root_a, root_b = find(a), find(b)
+            parent[max(root_a, root_b)] = min(root_a, root_b)
+
+        checked = set()
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            # Kovadaki her dosyayı kovada daha önce görülen kümelerin ilk elemanıyla karşılaştır
+            heads: List[int] = []
+            for idx in members:
+                for head in heads:
+                    if find(head) == find(idx):
+                        break
+                    if (head, idx) in checked:
+                        continue
+                    checked.add((head, idx))
+                    if self.similarity(signatures[head], signatures[idx]) >= self.threshold:
+                        union(head, idx)
+                        break
+                else:
+                    heads.append(idx)
+
+        clusters: Dict[int, List[str]] = {}
+        for idx, file_path in enumerate(files):
+            clusters.setdefault(find(idx), []).append(file_path)
+        return [members for members in clusters.values() if len(members) > 1]
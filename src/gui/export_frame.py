@@ -1,10 +1,10 @@
 from PyQt6.QtWidgets import (QFrame, QVBoxLayout, QHBoxLayout, QGroupBox,
                              QPushButton, QRadioButton, QLineEdit, QFileDialog,
                              QMessageBox, QComboBox, QLabel, QProgressDialog,
-                             QButtonGroup)
+                             QButtonGroup, QCheckBox, QSpinBox)
 from PyQt6.QtCore import Qt, pyqtSignal
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, Optional
 import os
 
 from ..core.file_exporter import FileExporter
@@ -23,13 +23,18 @@ class ExportFrame(QFrame):
     
     def __init__(self, file_exporter: FileExporter, 
                  template_manager: TemplateManager,
-                 config_manager: ConfigManager):
+                 config_manager: ConfigManager,
+                 git_manager=None):
         super().__init__()
         self.file_exporter = file_exporter
         self.template_manager = template_manager
         self.config_manager = config_manager
+        self.git_manager = git_manager
+        self.repository_path: Optional[Path] = None
         
-        self.selected_files: List[FileInfo] = []
+        # Seçili dosyalar dosya listesinin seçim deposundan gerektiğinde okunur
+        self._selection_source: Optional[Callable[[], List[FileInfo]]] = None
+        self._selected_files: Optional[List[FileInfo]] = []
         self.current_template: Optional[Template] = None
         
         self.init_ui()
@@ -65,6 +70,39 @@ class ExportFrame(QFrame):
         
         export_layout.addLayout(grouping_layout)
         
+        # Yinelenen içerikler
+        self.deduplicate_cb = QCheckBox("Aynı içerikli dosyaları tekrar yazma")
+        self.deduplicate_cb.setChecked(True)
+        export_layout.addWidget(self.deduplicate_cb)
+        
+        # Benzer içerikler (MinHash/LSH)
+        self.collapse_similar_cb = QCheckBox("Benzer dosyalardan yalnızca birini yaz")
+        self.collapse_similar_cb.setToolTip(
+            "Birbirine çok benzeyen dosyalar (DTO, migration vb.) kümelenir; "
+            "her kümeden bir dosya yazılır, diğerleri listelenir."
+        )
+        export_layout.addWidget(self.collapse_similar_cb)
+        
+        # Sadece değişiklikler
+        self.diff_only_cb = QCheckBox("Yalnızca değişiklikleri aktar (git diff)")
+        self.diff_only_cb.setToolTip("Dosyaların tamamı yerine HEAD'e göre değişen kısımları yazılır.")
+        self.diff_only_cb.setEnabled(self.git_manager is not None)
+        export_layout.addWidget(self.diff_only_cb)
+        
+        # Token bütçesi
+        budget_layout = QHBoxLayout()
+        budget_layout.addWidget(QLabel("Token Bütçesi:"))
+        self.token_budget_spin = QSpinBox()
+        self.token_budget_spin.setRange(0, 10_000_000)
+        self.token_budget_spin.setSingleStep(10_000)
+        self.token_budget_spin.setSpecialValueText("Sınırsız")
+        self.token_budget_spin.setToolTip(
+            "Tahmini token sınırı. Sınır aşılırsa Git geçmişinde en çok "
+            "değişen dosyalar önceliklidir."
+        )
+        budget_layout.addWidget(self.token_budget_spin)
+        export_layout.addLayout(budget_layout)
+        
         # Çıktı dosyası adı
         name_layout = QHBoxLayout()
         name_layout.addWidget(QLabel("Dosya Adı:"))
@@ -119,14 +157,38 @@ class ExportFrame(QFrame):
             self.output_dir_edit.setText(directory)
             self.config_manager.set('export_directory', directory)
     
+    def set_repository_path(self, path: str | Path | None) -> None:
+        """Diff modunda kullanılacak repository yolunu ayarlar."""
+        self.repository_path = Path(path) if path else None
+    
+    @property
+    def selected_files(self) -> List[FileInfo]:
+        """Seçili dosyalar; liste seçim değiştikten sonraki ilk erişimde oluşturulur."""
+        if self._selected_files is None:
+            self._selected_files = self._selection_source() if self._selection_source else []
+        return self._selected_files
+    
+    def set_selection_source(self, source: Callable[[], List[FileInfo]]) -> None:
+        """Seçili dosyaların okunacağı fonksiyonu ayarlar."""
+        self._selection_source = source
+        self._selected_files = None
+    
+    def on_selection_changed(self, count: int) -> None:
+        """Dosya listesindeki seçim değiştiğinde yalnızca sayıyı günceller."""
+        self._selected_files = None
+        self._update_selection_info(count)
+    
     def update_selected_files(self, files: List[FileInfo]) -> None:
         """Seçili dosya listesini günceller."""
-        self.selected_files = files
-        self.export_btn.setEnabled(bool(files))
+        self._selected_files = list(files)
+        self._update_selection_info(len(self._selected_files))
+    
+    def _update_selection_info(self, count: int) -> None:
+        self.export_btn.setEnabled(bool(count))
         
         # İlerleme bilgisini güncelle
-        if files:
-            self.progress_label.setText(f"{len(files)} dosya seçildi")
+        if count:
+            self.progress_label.setText(f"{count} dosya seçildi")
         else:
             self.progress_label.setText("Dosya seçilmedi")
     
@@ -180,12 +242,19 @@ class ExportFrame(QFrame):
             self.export_started.emit()
             
             # Dosyaları dışa aktar
-            exported = self.file_exporter.export_files(
-                self.selected_files,
-                output_path,
-                group_by=group_by,
-                custom_name=custom_name
-            )
+            if self.diff_only_cb.isChecked():
+                exported = self._export_diffs(output_path, custom_name)
+            else:
+                exported = self.file_exporter.export_files(
+                    self.selected_files,
+                    output_path,
+                    group_by=group_by,
+                    custom_name=custom_name,
+                    deduplicate=self.deduplicate_cb.isChecked(),
+                    collapse_similar=self.collapse_similar_cb.isChecked(),
+                    token_budget=self.token_budget_spin.value() or None,
+                    priority=self._churn_priority()
+                )
             
             # Başarılı sinyal
             self.export_completed.emit(len(self.selected_files))
@@ -198,6 +267,7 @@ class ExportFrame(QFrame):
                 self,
                 "Başarılı",
                 f"{len(exported)} dosya başarıyla dışa aktarıldı.\n"
+                f"{self.file_exporter.last_summary}\n"
                 f"Konum: {output_dir}"
             )
             
@@ -208,6 +278,28 @@ class ExportFrame(QFrame):
         finally:
             progress.close()
     
+    def _churn_priority(self) -> Optional[dict]:
+        """Token bütçesi için dosyaların Git geçmişindeki commit sayılarını döndürür."""
+        if not self.token_budget_spin.value() or not self.git_manager or not self.repository_path:
+            return None
+        index = self.git_manager.get_churn_index(self.repository_path)
+        if index is None:
+            return None
+        return {f: index.commit_count(f) for f in self.selected_files}
+    
+    def _export_diffs(self, output_path: Path, custom_name: str) -> dict:
+        """Seçili dosyaların yalnızca diff'lerini dışa aktarır."""
+        if not self.git_manager or not self.repository_path:
+            raise ValueError("Diff modu için açık bir Git repository'si gerekli")
+        
+        context_lines = self.config_manager.get_git_config().get('diff_context_lines', 3)
+        diffs = self.git_manager.iter_file_diffs(
+            self.repository_path, self.selected_files, context_lines
+        )
+        return self.file_exporter.export_diffs(
+            self.selected_files, diffs, output_path, custom_name=custom_name
+        )
+    
     def create_new_template(self) -> None:
         """Yeni şablon oluşturma dialogunu açar."""
         if not self.selected_files:
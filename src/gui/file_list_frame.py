@@ -1,10 +1,10 @@
 import logging
 from PyQt6.QtWidgets import (QFrame, QVBoxLayout, QHBoxLayout, QLineEdit,
-                             QPushButton, QTableWidget, QTableWidgetItem,
+                             QPushButton, QTableView,
                              QHeaderView, QLabel, QProgressDialog, QApplication,
-                             QCheckBox, QRadioButton, QTreeWidget, QTreeWidgetItem, QButtonGroup, QStackedWidget,
-                             QDialog, QTextEdit, QFileDialog, QMessageBox)
-from PyQt6.QtCore import Qt, pyqtSignal
+                             QCheckBox, QRadioButton, QTreeView, QButtonGroup, QStackedWidget,
+                             QDialog, QTextEdit, QFileDialog, QMessageBox, QComboBox)
+from PyQt6.QtCore import Qt, pyqtSignal, QFileSystemWatcher, QThread, QTimer
 from PyQt6.QtGui import QColor, QIcon
 import os
 from pathlib import Path
@@ -12,14 +12,86 @@ import time
 import csv
 from PyQt6.QtGui import QIcon, QColor
 from src.core.git.git_manager import GitManager
-from src.core.git.git_exceptions import GitException
+from src.core.git.git_exceptions import GitException, GitInitError
 from src.core.git.git_types import GitFileStatus
+from src.core.large_file_policy import LargeFilePolicyManager
+from src.utils.file_utils import iter_file_chunks, get_file_encoding
+from src.models.file_table import FileTable
+from src.models.directory_index import DirectoryIndex
+from src.models.selection_store import SelectionDelta, SelectionStore
+from src.models.trigram_index import SearchCancelled, TrigramIndex
+from src.models.fuzzy_index import FuzzyIndex, FuzzyMatches
+from src.models.git_status_codes import GitStatusCodes
+from src.gui.models import FileTableModel, FileFilterProxyModel, FolderTreeModel, format_size
+
+class GitStatusWorker(QThread):
+    """Git durumunu arka planda alan iş parçacığı."""
+    
+    status_ready = pyqtSignal(str, dict)
+    error_occurred = pyqtSignal(str, str)
+    
+    def __init__(self, git_manager: GitManager, directory: Path, use_cache: bool = True,
+                 nested_repos=(), parent=None):
+        super().__init__(parent)
+        self.git_manager = git_manager
+        self.directory = Path(directory)
+        self.use_cache = use_cache
+        self.nested_repos = list(nested_repos)
+    
+    def run(self):
+        try:
+            status = self.git_manager.check_changes_many(
+                [self.directory, *self.nested_repos], use_cache=self.use_cache
+            )
+            self.status_ready.emit(str(self.directory), status)
+        except GitException as e:
+            self.error_occurred.emit(str(self.directory), str(e))
+
+class SearchWorker(QThread):
+    """Büyük sonuç kümelerinde aramayı arka planda yapan iş parçacığı."""
+    
+    results_ready = pyqtSignal(int, str, object)  # Nesil, sorgu, sonuç
+    
+    def __init__(self, index, generation: int, query: str,
+                 within=None, parent=None):
+        super().__init__(parent)
+        self.index = index
+        self.generation = generation
+        self.query = query
+        self.within = within
+        self._cancelled = False
+    
+    def cancel(self):
+        """Daha yeni bir sorgu geldiğinde aramayı bir sonraki parçada durdurur."""
+        self._cancelled = True
+    
+    def run(self):
+        try:
+            hits = self.index.search(self.query, self.within, lambda: self._cancelled)
+        except SearchCancelled:
+            return
+        except Exception:
+            # İş parçacığında yakalanmayan hata sessizce kaybolmasın
+            logging.exception(f"Arama başarısız: {self.query!r}")
+            return
+        self.results_ready.emit(self.generation, self.query, hits)
 
 class FileListFrame(QFrame):
     """Basitleştirilmiş dosya listesi görünümü."""
     
-    # Seçili dosyalar sinyali
-    selection_changed = pyqtSignal(list)
+    # Seçim değiştiğinde seçili dosya sayısı; yollar get_selected_files ile alınır
+    selection_changed = pyqtSignal(int)
+    # Churn indeksi arka plandan hazır olduğunda (klasör, indeks)
+    churn_ready = pyqtSignal(str, object)
+    
+    # Yazma durduktan sonra aramanın başlaması için beklenen süre (ms)
+    SEARCH_DEBOUNCE_MS = 150
+    # Bu kadar adayın üzerindeki aramalar arka plan iş parçacığında yapılır
+    BACKGROUND_SEARCH_THRESHOLD = 50000
+    # Bulanık aramada puanlama Python'da yapıldığından eşik daha düşüktür
+    FUZZY_BACKGROUND_THRESHOLD = 5000
+    # Bulanık aramada gösterilen en iyi sonuç sayısı
+    FUZZY_RESULT_LIMIT = 1000
     
     def __init__(self, file_scanner=None, git_manager=None, config_manager=None):
         super().__init__()
@@ -28,37 +100,49 @@ class FileListFrame(QFrame):
         self.config_manager = config_manager
         self.current_directory = None
         self.git_status = {}
+        self.git_codes = GitStatusCodes()  # Tabloyla hizalı durum kodları
         self.total_files = 0
-        self.selected_files = set()
-        self.visible_rows = set()
+        # Liste, ağaç ve dışa aktarma aynı seçim deposunu paylaşır
+        self.selection = SelectionStore()
+        self.selection.add_listener(self._on_selection_changed)
+        self.file_table = FileTable()
+        self.dir_index = DirectoryIndex.from_table(self.file_table)
+        self.search_index = None
+        self.fuzzy_index = None  # İlk bulanık aramada oluşturulur
+        self.list_ids = []      # Geçmiş moduna göre sıralanmış dosya id'leri
+        self._list_reordered = False
+        self.visible_rows = []  # Filtreden geçen dosya id'leri
+        # Son aramanın sorgusu ve (id sırasındaki) sonuçları; yeni sorgu bunu
+        # genişletiyorsa yalnızca bu sonuçlar süzülür
+        self._last_search = None
+        self._search_generation = 0
+        self._search_worker = None
+        self._scanning = False
+        self._git_worker = None
+        self._workers = set()  # Çalışan arka plan iş parçacıkları (kapanışta beklenir)
+        self.churn_index = None
+        self.nested_repos = []
+        
+        # Index/HEAD değiştiğinde Git durum önbelleğini geçersiz kıl
+        self.git_watcher = QFileSystemWatcher(self)
+        self.git_watcher.fileChanged.connect(self._on_git_files_changed)
         self.setup_ui()
 
     def update_git_status(self, status: dict):
-        """Git durumunu günceller ve tabloyu yeniler."""
+        """Git durumunu günceller, tablo ve ağaç hücrelerini tek seferde yeniler."""
         self.git_status = status
+        self.git_codes = GitStatusCodes.from_status(self.file_table, status)
         
-        # Git değişikliklerini say
-        modified_count = sum(1 for s in status.values() if s == GitFileStatus.MODIFIED)
-        added_count = sum(1 for s in status.values() if s == GitFileStatus.ADDED)
-        deleted_count = sum(1 for s in status.values() if s == GitFileStatus.DELETED)
-        untracked_count = sum(1 for s in status.values() if s == GitFileStatus.UNTRACKED)
+        # Git değişikliklerini say (yalnızca taranan dosyalar)
+        counts = self.git_codes.counts()
+        modified_count = counts[GitFileStatus.MODIFIED]
+        added_count = counts[GitFileStatus.ADDED]
+        deleted_count = counts[GitFileStatus.DELETED]
+        untracked_count = counts[GitFileStatus.UNTRACKED]
         
-        # Tablo görünümünü güncelle
-        for row in range(self.table.rowCount()):
-            name_item = self.table.item(row, 1)
-            if name_item is None:
-                continue
-                
-            file_path_data = name_item.data(Qt.ItemDataRole.UserRole)
-            if file_path_data is None:
-                continue
-                
-            try:
-                file_path = Path(file_path_data)
-                if file_path in self.git_status:
-                    self._set_git_status_cell(row, self.git_status[file_path])
-            except Exception as e:
-                logging.warning(f"Git durumu güncellenirken hata: {e}")
+        # Modeller Git sütununu tek seferde yeniler
+        self.table_model.set_git_status(self.git_codes)
+        self.tree_model.set_git_status(self.git_codes)
         
         # Bilgi etiketini güncelle
         status_info = (
@@ -70,31 +154,109 @@ class FileListFrame(QFrame):
         )
         self.update_info_label(status_info)
         
-    def _set_git_status_cell(self, row: int, status: GitFileStatus):
-        """Git durumu hücresini ayarlar."""
-        item = QTableWidgetItem()
-        
-        if status == GitFileStatus.MODIFIED:
-            item.setText("✎ M")  # Kalem emoji ile Modified
-            item.setBackground(QColor(255, 255, 150))  # Daha belirgin sarı
-            item.setToolTip("Modified - Dosya değiştirildi")
-        elif status == GitFileStatus.ADDED:
-            item.setText("+ A")  # Plus işareti ile Added
-            item.setBackground(QColor(150, 255, 150))  # Daha belirgin yeşil
-            item.setToolTip("Added - Dosya eklendi")
-        elif status == GitFileStatus.DELETED:
-            item.setText("- D")  # Eksi işareti ile Deleted
-            item.setBackground(QColor(255, 150, 150))  # Daha belirgin kırmızı
-            item.setToolTip("Deleted - Dosya silindi")
-        elif status == GitFileStatus.UNTRACKED:
-            item.setText("? U")  # Soru işareti ile Untracked
-            item.setBackground(QColor(200, 200, 200))  # Gri
-            item.setToolTip("Untracked - Git tarafından takip edilmiyor")
+    def start_git_status(self, use_cache: bool = True):
+        """Git durumunu arka planda almaya başlar, sonuç sinyalle uygulanır."""
+        if not self.git_manager or not self.current_directory:
+            return
         
-        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.table.setItem(row, 5, item)  # Git durumu en sonda
-
+        worker = GitStatusWorker(self.git_manager, self.current_directory, use_cache,
+                                 self.nested_repos, self)
+        worker.status_ready.connect(self._on_git_status_ready)
+        worker.error_occurred.connect(self._on_git_status_error)
+        self._git_worker = worker
+        self._start_worker(worker)
+    
+    def _start_worker(self, worker: QThread):
+        """İş parçacığını başlatır ve bitene kadar referansını tutar."""
+        self._workers.add(worker)
+        worker.finished.connect(lambda: self._workers.discard(worker))
+        worker.finished.connect(worker.deleteLater)
+        worker.start()
+    
+    def stop_workers(self):
+        """Pencere kapanırken çalışan arka plan iş parçacıklarının bitmesini bekler."""
+        # Aramalar bir sonraki parçada durur, beklemek uzun sürmez
+        self._cancel_search()
+        for worker in list(self._workers):
+            worker.quit()
+            worker.wait()
+        self._workers.clear()
+    
+    def _on_git_status_ready(self, directory: str, status: dict):
+        """Arka plandan gelen Git durumunu görünümlere uygular."""
+        if directory != str(self.current_directory):
+            # Bu arada başka bir klasör açıldı, eski sonucu yok say
+            return
+        if self._scanning:
+            # Tablo henüz dolmadı, tarama bitince uygulanır
+            self.git_status = status
+            return
+        self.update_git_status(status)
+        self.apply_git_filter()
+    
+    def _start_churn_index(self):
+        """Git geçmişinden churn indeksini arka planda oluşturur."""
+        self.churn_index = None
+        self.history_combo.setEnabled(False)
+        if not self.git_manager or not self.current_directory:
+            return
+        try:
+            # Alt klasör açıldıysa üstteki repository bulunur
+            self.git_manager.init_repository(Path(self.current_directory))
+        except GitInitError:
+            return  # Git repository değil
+        # Geri çağrı iş parçacığından gelir, sinyal ile GUI iş parçacığına aktarılır
+        self.git_manager.start_churn_index(
+            self.current_directory,
+            lambda path, index: self.churn_ready.emit(str(path), index)
+        )
+    
+    def _on_churn_ready(self, directory: str, index):
+        """Churn indeksi hazır olduğunda geçmiş filtresini etkinleştirir."""
+        if directory != str(self.current_directory) or index is None:
+            return
+        self.churn_index = index
+        self.history_combo.setEnabled(True)
+        if self.history_combo.currentData() != 'all':
+            self._on_history_mode_changed()
+    
+    def _apply_history_order(self, file_ids: list) -> list:
+        """Geçmiş moduna göre dosya id'lerini süzer ve sıralar."""
+        mode = self.history_combo.currentData()
+        index = self.churn_index
+        if mode == 'all' or index is None:
+            return file_ids
+        
+        paths = self.file_table.paths
+        if mode == 'recent':
+            days = self.config_manager.get('churn_recent_days', 30) if self.config_manager else 30
+            since = time.time() - days * 86400
+            keyed = [(index.last_modified(paths[i]), i) for i in file_ids]
+            keyed = [item for item in keyed if item[0] >= since]
+        else:
+            threshold = max(index.hotspot_threshold(), 1)
+            keyed = [(index.commit_count(paths[i]), i) for i in file_ids]
+            keyed = [item for item in keyed if item[0] >= threshold]
         
+        keyed.sort(key=lambda item: item[0], reverse=True)
+        return [i for _, i in keyed]
+    
+    def _on_history_mode_changed(self, *args):
+        """Geçmiş modu değiştiğinde liste görünümünü yeniden oluşturur."""
+        if not self.list_view_btn.isChecked():
+            self.list_view_btn.setChecked(True)  # Sıralama liste görünümünde uygulanır
+            return
+        self._update_list_view()
+        self.filter_files(self.search_box.text())
+        self.update_info_label()
+    
+    def _on_git_status_error(self, directory: str, error: str):
+        """Arka plandaki Git durumu hatasını bildirir."""
+        if directory != str(self.current_directory):
+            return
+        logging.warning(f"Git durumu alınamadı: {error}")
+        self.update_info_label(f"Git hatası: {error}")
+    
     def setup_ui(self):
         """Kullanıcı arayüzünü oluşturur."""
         layout = QVBoxLayout(self)
@@ -107,10 +269,24 @@ class FileListFrame(QFrame):
         
         # Dosya Arama
         self.search_box = QLineEdit()
-        self.search_box.setPlaceholderText("Dosya ara... (En az 3 karakter)")
-        self.search_box.textChanged.connect(self.filter_files)
+        self.search_box.setPlaceholderText("Dosya ara...")
+        # Her tuşta değil, yazma durduğunda aranır
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(lambda: self.filter_files(self.search_box.text()))
+        self.search_box.textChanged.connect(self._search_timer.start)
         top_bar.addWidget(self.search_box)
         
+        # Bulanık arama (fzf tarzı, puana göre sıralı)
+        self.fuzzy_check = QCheckBox("Bulanık")
+        self.fuzzy_check.setToolTip(
+            "Harfleri sırasıyla içeren yolları en iyi eşleşme önce olacak şekilde listeler "
+            "(ör. usrsvcimpl → user/service/UserServiceImpl.java)"
+        )
+        self.fuzzy_check.toggled.connect(self._on_fuzzy_toggled)
+        top_bar.addWidget(self.fuzzy_check)
+        
         # Seçim Butonları Grubu için Container
         selection_buttons = QHBoxLayout()
 
@@ -139,6 +315,11 @@ class FileListFrame(QFrame):
         clear_btn.clicked.connect(lambda: self.toggle_all_selection(False))
         selection_buttons.addWidget(clear_btn)
         
+        # Seçimi Tersine Çevir
+        invert_btn = QPushButton("Seçimi Tersine Çevir")
+        invert_btn.clicked.connect(self.invert_selection)
+        selection_buttons.addWidget(invert_btn)
+        
         # Butonları ana layout'a ekle
         top_bar.addLayout(selection_buttons)
         layout.addLayout(top_bar)
@@ -148,35 +329,42 @@ class FileListFrame(QFrame):
         self.info_label.setStyleSheet("color: gray;")
         layout.addWidget(self.info_label)
 
-        # Liste görünümü ayarları
-        self.table = QTableWidget()
-        self.table.setColumnCount(7)  # Önizleme sütunu eklendi
-        self.table.setHorizontalHeaderLabels(
-            ["", "Dosya Adı", "Uzantı", "Klasör", "Boyut", "Git", "Önizle"]
-        )
+        # Liste görünümü ayarları (satırlar modelden istenildikçe üretilir)
+        self.table_model = FileTableModel(self.selection, self)
+        self.table_proxy = FileFilterProxyModel(self)
+        self.table_proxy.setSourceModel(self.table_model)
+        self.table = QTableView()
+        self.table.setModel(self.table_proxy)
+        self.table.verticalHeader().setDefaultSectionSize(22)
         
         header = self.table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.Fixed)
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.Stretch)
-        header.setSectionResizeMode(4, QHeaderView.ResizeMode.Fixed)
-        header.setSectionResizeMode(5, QHeaderView.ResizeMode.Fixed)
-        header.setSectionResizeMode(6, QHeaderView.ResizeMode.Fixed)  # Önizleme sütunu
-        
-        self.table.setColumnWidth(0, 30)
-        self.table.setColumnWidth(2, 70)
-        self.table.setColumnWidth(4, 100)
-        self.table.setColumnWidth(5, 40)
-        self.table.setColumnWidth(6, 40)  # Önizleme sütunu genişliği
+        for column in range(FileTableModel.PREVIEW_COLUMN + 1):
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.Fixed)
+        header.setSectionResizeMode(FileTableModel.NAME_COLUMN, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(FileTableModel.FOLDER_COLUMN, QHeaderView.ResizeMode.Stretch)
+        
+        self.table.setColumnWidth(FileTableModel.CHECK_COLUMN, 30)
+        self.table.setColumnWidth(FileTableModel.EXT_COLUMN, 70)
+        self.table.setColumnWidth(FileTableModel.SIZE_COLUMN, 100)
+        self.table.setColumnWidth(FileTableModel.TOKENS_COLUMN, 80)
+        self.table.setColumnWidth(FileTableModel.MTIME_COLUMN, 120)
+        self.table.setColumnWidth(FileTableModel.GIT_COLUMN, 40)
+        self.table.setColumnWidth(FileTableModel.PREVIEW_COLUMN, 40)  # Önizleme sütunu genişliği
+        
+        # Başlığa tıklayınca proxy önceden hesaplanmış anahtarlarla sıralar;
+        # başlangıçta sıralama yok (liste/geçmiş sırası korunur)
+        header.setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        self.table.setSortingEnabled(True)
 
         # Tablo tıklama olayını bağla
-        self.table.cellClicked.connect(self._on_cell_clicked)
+        self.table.clicked.connect(self._on_cell_clicked)
         
         # Klasör görünümü ayarları
-        self.folder_tree = QTreeWidget()
-        self.folder_tree.setHeaderLabels(["Dosya/Klasör", "Boyut", "Git"])
-        self.folder_tree.itemChanged.connect(self._on_tree_item_changed)
+        # Klasör çocukları yalnızca açıldığında modelden yüklenir
+        self.tree_model = FolderTreeModel(self.selection, self)
+        self.folder_tree = QTreeView()
+        self.folder_tree.setModel(self.tree_model)
+        self.folder_tree.setUniformRowHeights(True)
 
         # Stack widget oluştur ve görünümleri ekle
         self.stack_widget = QStackedWidget()
@@ -211,33 +399,51 @@ class FileListFrame(QFrame):
         self.filter_deleted.toggled.connect(self.apply_git_filter)
         self.filter_untracked.toggled.connect(self.apply_git_filter)
         
+        # Git geçmişine göre sıralama/filtre (churn indeksi hazır olunca etkinleşir)
+        filter_group.addStretch()
+        filter_group.addWidget(QLabel("Geçmiş:"))
+        self.history_combo = QComboBox()
+        self.history_combo.addItem("Tümü", 'all')
+        self.history_combo.addItem("Son değişenler", 'recent')
+        self.history_combo.addItem("Sıcak noktalar", 'hotspot')
+        self.history_combo.setToolTip("Git geçmişi indekslendikten sonra kullanılabilir")
+        self.history_combo.setEnabled(False)
+        self.history_combo.currentIndexChanged.connect(self._on_history_mode_changed)
+        filter_group.addWidget(self.history_combo)
+        self.churn_ready.connect(self._on_churn_ready)
+        
         layout.addLayout(filter_group)
    
     def refresh_git_status(self):
         """Git durumunu manuel olarak yeniler."""
         if self.git_manager and self.current_directory:
-            try:
-                logging.info(f"Git durumu yenileniyor: {self.current_directory}")
-                status = self.git_manager.check_changes(Path(self.current_directory))
-                
-                logging.info(f"Git durumu alındı: {status}")
-                self.update_git_status(status)
-                
-                # Değişiklik sayılarını hesapla
-                modified_count = sum(1 for s in status.values() if s == GitFileStatus.MODIFIED)
-                added_count = sum(1 for s in status.values() if s == GitFileStatus.ADDED)
-                deleted_count = sum(1 for s in status.values() if s == GitFileStatus.DELETED)
-                
-                status_info = (f"Git değişiklikleri: "
-                            f"{modified_count} modified, "
-                            f"{added_count} added, "
-                            f"{deleted_count} deleted")
-                logging.info(status_info)
-                self.update_info_label(status_info)
-                
-            except GitException as e:
-                logging.error(f"Git durumu alınamadı: {e}")
-                self.update_info_label(f"Git hatası: {str(e)}")
+            logging.info(f"Git durumu yenileniyor: {self.current_directory}")
+            self.start_git_status(use_cache=False)
+    
+    def _watch_git_files(self, directory: Path):
+        """Repository'nin index ve HEAD dosyalarını izlemeye alır."""
+        watched = self.git_watcher.files()
+        if watched:
+            self.git_watcher.removePaths(watched)
+        
+        # Alt klasör açıldıysa üstteki repository'nin dosyaları izlenir
+        git_dir = next(
+            (parent / '.git' for parent in (directory, *directory.parents) if (parent / '.git').is_dir()),
+            None
+        )
+        if git_dir:
+            paths = [str(git_dir / name) for name in ('index', 'HEAD') if (git_dir / name).exists()]
+            if paths:
+                self.git_watcher.addPaths(paths)
+    
+    def _on_git_files_changed(self, changed_path: str):
+        """İzlenen Git dosyası değiştiğinde önbelleği temizler."""
+        if self.git_manager and self.current_directory:
+            self.git_manager.invalidate_status(Path(self.current_directory), only_if_stale=True)
+        
+        # Dosya yeniden yazıldığında (atomik rename) izleme düşer, tekrar ekle
+        if changed_path not in self.git_watcher.files() and os.path.exists(changed_path):
+            self.git_watcher.addPath(changed_path)
     
     def refresh_extensions(self):
         """Extension'ları yeniler ve mevcut dizini yeniden tarar."""
@@ -246,11 +452,7 @@ class FileListFrame(QFrame):
     
     def format_size(self, size):
         """Dosya boyutunu formatlar."""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size < 1024:
-                return f"{size:.1f} {unit}"
-            size /= 1024
-        return f"{size:.1f} TB"
+        return format_size(size)
     
     def scan_directory(self, directory: str | Path):
         """Klasörü tarar ve dosyaları listeler."""
@@ -269,13 +471,30 @@ class FileListFrame(QFrame):
             logging.info(f"Klasör taraması başlıyor: {directory}")
             
             # Git repository kontrolü
+            self._watch_git_files(directory)
             if (directory / '.git').exists():
                 logging.info("Git repository tespit edildi")
             
+            # Git durumu tarama ile eş zamanlı arka planda alınır
+            self.git_status = {}
+            self.git_codes = GitStatusCodes()
+            self.nested_repos = []
+            self._scanning = True
+            self.start_git_status()
+            self._start_churn_index()
+            
             # Tabloları temizle
-            self.table.setRowCount(0)
-            self.selected_files.clear()
-            self.visible_rows.clear()
+            self.selection.reset(0)
+            self.file_table = FileTable()
+            self.dir_index = DirectoryIndex.from_table(self.file_table)
+            self.search_index = None
+            self.fuzzy_index = None
+            self._cancel_search()
+            self._last_search = None
+            self.list_ids = []
+            self.visible_rows = []
+            self.table_model.set_files(self.file_table)
+            self.tree_model.set_files(self.file_table, self.dir_index)
             
             # Desteklenen uzantılar - ConfigManager'dan al
             if self.config_manager:
@@ -285,200 +504,209 @@ class FileListFrame(QFrame):
                 # Fallback - eğer config_manager yoksa varsayılan
                 valid_extensions = {'.cs', '.java', '.js', '.jsx', '.ts', '.tsx', '.py', '.css'}
             skip_folders = {'.git', 'node_modules', 'bin', 'obj', 'build', 'dist'}
+            policy_manager = LargeFilePolicyManager.from_config(self.config_manager)
+            skipped_count = 0
             
-            # Dosyaları topla
-            files_data = []
+            # Dosyaları (tam yol, göreli klasör, ad, boyut, değişiklik zamanı) olarak topla
+            entries = []
+            root_dir = str(directory)
             
             # Dosyaları tara ve topla
-            for root, dirs, files in os.walk(str(directory)):
+            for root, dirs, files in os.walk(root_dir):
+                # İç içe repository ve submodule'ler ayrıca sorgulanır
+                if root != root_dir and ('.git' in dirs or '.git' in files):
+                    self.nested_repos.append(Path(root))
                 dirs[:] = [d for d in dirs if d not in skip_folders and not d.startswith('.')]
+                rel_folder = os.path.relpath(root, root_dir)
                 
                 for file in files:
-                    file_path = Path(root) / file
-                    if file_path.suffix.lower() in valid_extensions:
+                    if os.path.splitext(file)[1].lower() in valid_extensions:
+                        file_path = os.path.join(root, file)
                         try:
-                            rel_path = file_path.relative_to(directory)
-                            size = os.path.getsize(file_path)
+                            # Boyut ve zaman tek stat çağrısıyla alınır
+                            stat = os.stat(file_path)
+                            size = stat.st_size
+                            
+                            # Boyut politikasına göre atlanan dosyalar
+                            if policy_manager.should_skip(file, size):
+                                skipped_count += 1
+                                continue
                             
-                            files_data.append({
-                                'name': file_path.name,
-                                'ext': file_path.suffix[1:].upper(),
-                                'folder': str(rel_path.parent),
-                                'size': size,
-                                'path': str(file_path)
-                            })
+                            entries.append((file_path, rel_folder, file, size, stat.st_mtime))
                             
-                            if len(files_data) % 100 == 0:
-                                progress.setLabelText(f"{len(files_data)} dosya bulundu...")
+                            if len(entries) % 100 == 0:
+                                progress.setLabelText(f"{len(entries)} dosya bulundu...")
                                 QApplication.processEvents()
                                 
                         except Exception as e:
                             print(f"Hata: {file_path} - {e}")
             
-            # Klasör yapısını oluştur
-            self._current_folder_structure = self._build_folder_structure(files_data)
-            
-            # Tabloyu doldur
-            self.table.setRowCount(len(files_data))
-            for row, data in enumerate(files_data):
-                # Checkbox
-                checkbox = QTableWidgetItem()
-                checkbox.setFlags(Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled)
-                checkbox.setCheckState(Qt.CheckState.Unchecked)
-                self.table.setItem(row, 0, checkbox)
-                
-                # Dosya bilgileri
-                self.table.setItem(row, 1, QTableWidgetItem(data['name']))
-                self.table.setItem(row, 2, QTableWidgetItem(data['ext']))
-                self.table.setItem(row, 3, QTableWidgetItem(data['folder']))
-                self.table.setItem(row, 4, QTableWidgetItem(self.format_size(data['size'])))
-                self.table.setItem(row, 5, QTableWidgetItem(""))  # Git durumu için boş hücre
-                
-                # Önizleme ikonu
-                preview_item = QTableWidgetItem("👁")
-                preview_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                preview_item.setToolTip("Dosyayı önizle")
-                self.table.setItem(row, 6, preview_item)
-                
-                # Dosya yolunu sakla
-                self.table.item(row, 1).setData(Qt.ItemDataRole.UserRole, data['path'])
-                self._add_file_to_table(row, data)
-                if row % 1000 == 0:
-                    QApplication.processEvents()
-            
-            # Git durumunu güncelle
-            if self.git_manager:
-                try:
-                    status = self.git_manager.check_changes(self.current_directory)
-                    self.update_git_status(status)
-                except GitException as e:
-                    logging.warning(f"Git durumu alınamadı: {e}")
-            
-            # Görünüm güncellemesi
-            if self.list_view_btn.isChecked():
-                self._update_list_view()
-            else:
-                self._update_folder_view()
+            # Sütun tablosunu ve klasör indeksini oluştur
+            self.file_table = FileTable.from_entries(entries)
+            self.dir_index = DirectoryIndex.from_table(self.file_table)
+            self.search_index = TrigramIndex(self.file_table, self.dir_index)
+            self.selection.reset(len(self.file_table))
+            # Klasör sayaçları liste görünümündeki seçimlerle de güncellendiğinden
+            # ağaç modeli her zaman güncel tabloyu kullanır
+            self.tree_model.set_files(self.file_table, self.dir_index)
+            
+            # Görünüm güncellemesi (filtreler liste sırasını kullandığından
+            # klasör görünümündeyken de hazırlanır)
+            self._update_list_view()
+            
+            # Tarama sırasında gelen Git durumunu uygula
+            self._scanning = False
+            if self.git_status:
+                self.update_git_status(self.git_status)
+                self.apply_git_filter()
+            
+            # İç içe repository'ler bulunduysa hepsinin durumu birlikte alınır
+            # (kök repository'nin sonucu önbellekten gelir)
+            if self.nested_repos:
+                logging.info(f"{len(self.nested_repos)} iç içe repository bulundu")
+                self.start_git_status()
             
             # İstatistikleri güncelle
             duration = time.time() - start_time
-            self.total_files = len(files_data)
-            self.update_info_label(f"Tarama süresi: {duration:.1f} saniye")
-            
-            # Tüm satırları görünür olarak işaretle
-            self.visible_rows = set(range(self.total_files))
-            
-            # Sütunları otomatik boyutlandır
-            self.table.resizeColumnsToContents()
+            self.total_files = len(self.file_table)
+            scan_info = f"Tarama süresi: {duration:.1f} saniye"
+            if skipped_count:
+                scan_info += f" | {skipped_count} büyük dosya atlandı"
+            self.update_info_label(scan_info)
             
         finally:
+            self._scanning = False
             progress.close()
-        
-        # Tablo sinyallerini bağla
-        self.table.itemChanged.connect(self.on_item_changed)
     
     def filter_files(self, text: str):
-        """Dosyaları filtreler."""
+        """Dosyaları adında veya klasöründe geçen metne göre filtreler."""
         search_text = text.lower().strip()
-        self.visible_rows.clear()
+        self._cancel_search()
         
-        # 3 karakterden kısa aramaları ignore et
-        if len(search_text) < 3:
+        index = self._search_index()
+        if not search_text or index is None:
             # Tüm satırları göster
-            for row in range(self.table.rowCount()):
-                self.table.setRowHidden(row, False)
-                self.visible_rows.add(row)
+            self._last_search = None
+            self._set_visible_rows(self.list_ids)
+            self.update_info_label()
             return
-            
-        # Her satırı kontrol et
-        for row in range(self.table.rowCount()):
-            file_name = self.table.item(row, 1).text().lower()
-            folder = self.table.item(row, 3).text().lower()
-            
-            match = search_text in file_name or search_text in folder
-            self.table.setRowHidden(row, not match)
-            if match:
-                self.visible_rows.add(row)
+        
+        # Sorgu öncekini genişletiyorsa yalnızca önceki sonuçlar süzülür
+        within = None
+        if self._last_search is not None:
+            last_text, last_result = self._last_search
+            if last_text == search_text:
+                self._apply_search_results(last_result)
+                return
+            if index.extends(last_text, search_text):
+                within = (last_result.candidates if isinstance(last_result, FuzzyMatches)
+                          else last_result)
+        
+        threshold = self.BACKGROUND_SEARCH_THRESHOLD
+        if index is self.fuzzy_index:
+            threshold = self.FUZZY_BACKGROUND_THRESHOLD
+            if within is None and self._list_reordered:
+                # Geçmiş modunda yalnızca listedeki dosyalar puanlanır
+                within = self.list_ids
+        
+        candidates = len(self.file_table) if within is None else len(within)
+        if candidates < threshold:
+            self._apply_search(search_text, index.search(search_text, within))
+            return
+        
+        # Büyük aramalar arayüzü dondurmaz; sonuç nesil numarasıyla eşleştirilir
+        worker = SearchWorker(index, self._search_generation, search_text, within, self)
+        worker.results_ready.connect(self._on_search_results)
+        self._search_worker = worker
+        self._start_worker(worker)
+    
+    def _search_index(self):
+        """Seçili arama moduna göre indeksi döndürür (bulanık indeks gerektiğinde kurulur)."""
+        if not self.fuzzy_check.isChecked():
+            return self.search_index
+        if self.fuzzy_index is None and self.search_index is not None:
+            self.fuzzy_index = FuzzyIndex(self.file_table, self.FUZZY_RESULT_LIMIT)
+        return self.fuzzy_index
+    
+    def _on_fuzzy_toggled(self, checked: bool):
+        """Arama modu değişince önceki sonuçlar daraltma için kullanılamaz."""
+        self._last_search = None
+        self.filter_files(self.search_box.text())
+    
+    def _cancel_search(self):
+        """Süren arka plan aramasını iptal eder, sonucu artık kullanılmaz."""
+        self._search_generation += 1
+        if self._search_worker is not None:
+            self._search_worker.cancel()
+            self._search_worker = None
+    
+    def _on_search_results(self, generation: int, search_text: str, hits):
+        """Arka plandan gelen arama sonucunu uygular; eski sorgular yok sayılır."""
+        if generation != self._search_generation:
+            return
+        self._search_worker = None
+        self._apply_search(search_text, hits)
+    
+    def _apply_search(self, search_text: str, hits):
+        self._last_search = (search_text, hits)
+        self._apply_search_results(hits)
+    
+    def _apply_search_results(self, hits):
+        """Arama sonucunu görünüme uygular.
+        
+        Alt dize aramasında liste sırası korunur; bulanık aramada en iyi
+        eşleşmeler puan sırasıyla gösterilir.
+        """
+        extra_info = ""
+        if isinstance(hits, FuzzyMatches):
+            if len(hits.candidates) > len(hits.ranked):
+                extra_info = f"{len(hits.candidates)} eşleşmenin en iyi {len(hits.ranked)} tanesi"
+            hits = hits.ranked
+        elif self._list_reordered:
+            hit_set = set(hits)
+            hits = [i for i in self.list_ids if i in hit_set]
+        self._set_visible_rows(hits)
                 
         # İstatistikleri güncelle
-        self.update_info_label()
+        self.update_info_label(extra_info)
+    
+    def _set_visible_rows(self, file_ids: list):
+        """Liste görünümünde gösterilecek dosyaları proxy üzerinden ayarlar."""
+        self.visible_rows = file_ids
+        self.table_proxy.set_rows(file_ids)
     
     def toggle_search_results_selection(self, select: bool):
         """Arama sonuçlarını seçer/seçimini kaldırır."""
-        state = Qt.CheckState.Checked if select else Qt.CheckState.Unchecked
-        
-        # Sinyal bağlantısını geçici olarak kaldır
-        self.table.itemChanged.disconnect(self.on_item_changed)
-        
-        # Sadece görünür satırların seçimini değiştir
-        for row in self.visible_rows:
-            item = self.table.item(row, 0)
-            item.setCheckState(state)
-            
-            file_path = self.table.item(row, 1).data(Qt.ItemDataRole.UserRole)
-            if select:
-                self.selected_files.add(file_path)
-            else:
-                self.selected_files.discard(file_path)
-        
-        # Sinyal bağlantısını geri ekle
-        self.table.itemChanged.connect(self.on_item_changed)
-        
-        # Seçim değişikliğini bildir
-        self.selection_changed.emit(list(self.selected_files))
-        self.update_info_label()
+        self._set_selection(self.visible_rows, select)
     
     def toggle_all_selection(self, select: bool):
         """Tüm görünür öğeleri seçer/seçimi kaldırır."""
-        state = Qt.CheckState.Checked if select else Qt.CheckState.Unchecked
-        
-        # Sinyal bağlantısını geçici olarak kaldır
-        self.table.itemChanged.disconnect(self.on_item_changed)
-        
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, 0)
-            item.setCheckState(state)
-            
-            file_path = self.table.item(row, 1).data(Qt.ItemDataRole.UserRole)
-            if select:
-                self.selected_files.add(file_path)
-            else:
-                self.selected_files.discard(file_path)
-        
-        # Sinyal bağlantısını geri ekle
-        self.table.itemChanged.connect(self.on_item_changed)
-        
-        # Seçim değişikliğini bildir
-        self.selection_changed.emit(list(self.selected_files))
-        self.update_info_label()
+        self._set_selection(self.list_ids, select)
     
-    def on_item_changed(self, item):
-        """Öğe değişikliklerini işler."""
-        if item.column() == 0:  # Checkbox sütunu
-            row = item.row()
-            name_item = self.table.item(row, 1)
-            if name_item is None:  # Güvenlik kontrolü
-                return
-                
-            file_path = name_item.data(Qt.ItemDataRole.UserRole)
-            if file_path is None:  # Güvenlik kontrolü
-                return
-                
-            if item.checkState() == Qt.CheckState.Checked:
-                self.selected_files.add(file_path)
-            else:
-                self.selected_files.discard(file_path)
-            
-            self.selection_changed.emit(list(self.selected_files))
-            self.update_info_label()
+    def invert_selection(self):
+        """Tüm dosyaların seçimini tersine çevirir."""
+        self.selection.invert()
+    
+    def _set_selection(self, file_ids: list, select: bool):
+        """Verilen dosyaların seçimini tek seferde değiştirir."""
+        if len(file_ids) == len(self.file_table):
+            # Tüm tablo tek dilim atamasıyla işaretlenir
+            self.selection.set_range(0, len(self.file_table), select)
+        else:
+            self.selection.set_many(file_ids, select)
+    
+    def _on_selection_changed(self, delta: SelectionDelta):
+        """Seçim deposu değiştiğinde sayıyı bildirir ve etiketi günceller."""
+        self.selection_changed.emit(self.selection.count)
+        self.update_info_label()
         
     def update_info_label(self, extra_info: str = ""):
         """Bilgi etiketini günceller."""
-        visible_count = len(self.visible_rows) if self.visible_rows else self.table.rowCount()
+        visible_count = self.table_proxy.rowCount()
         
         info_text = (f"Toplam: {self.total_files} dosya | "
                     f"Görünen: {visible_count} | "
-                    f"Seçili: {len(self.selected_files)}")
+                    f"Seçili: {self.selection.count}")
                     
         if extra_info:
             info_text += f" | {extra_info}"
@@ -487,47 +715,44 @@ class FileListFrame(QFrame):
     
     def get_selected_files(self) -> list:
         """Seçili dosya yollarını döndürür."""
-        return list(self.selected_files)
+        paths = self.file_table.paths
+        return [paths[i] for i in self.selection.ids()]
 
     def apply_git_filter(self):
-        """Git durumuna göre dosyaları filtreler"""
-        self.visible_rows.clear()
-        
-        # Git durumlarını say
-        status_counts = {
-            GitFileStatus.MODIFIED: 0,
-            GitFileStatus.ADDED: 0,
-            GitFileStatus.DELETED: 0,
-            GitFileStatus.UNTRACKED: 0
-        }
+        """Git durumuna göre dosyaları filtreler.
+        
+        Sayımlar ve maske dosya başına durum kodu dizisi üzerinde toplu
+        işlemlerle hesaplanır; sonuç proxy modele tek seferde verilir.
+        """
+        # Seçili filtrelerin kabul ettiği durumlar
+        wanted = set()
+        if self.filter_modified.isChecked():
+            wanted.add(GitFileStatus.MODIFIED)
+        if self.filter_added.isChecked():
+            wanted.add(GitFileStatus.ADDED)
+        if self.filter_deleted.isChecked():
+            wanted.add(GitFileStatus.DELETED)
+        if self.filter_untracked.isChecked():
+            wanted.add(GitFileStatus.UNTRACKED)
+        
+        codes = self.git_codes
+        if len(codes) != len(self.file_table):
+            # Tarama sırasında: durum henüz yeni tabloya uygulanmadı
+            codes = GitStatusCodes(len(self.file_table))
+        
+        # Git durumlarını say (geçmiş modunda yalnızca listedeki dosyalar)
+        status_counts = codes.counts(self.list_ids if self._list_reordered else None)
+        
+        # Tümü seçiliyse her dosyayı, değilse ilgili durumdakileri göster
+        if self.filter_all.isChecked():
+            visible = self.list_ids
+        elif self._list_reordered:
+            mask = codes.mask(wanted)
+            visible = [i for i in self.list_ids if mask[i]]
+        else:
+            visible = codes.ids(wanted)
         
-        for row in range(self.table.rowCount()):
-            file_path = Path(self.table.item(row, 1).data(Qt.ItemDataRole.UserRole))
-            show_row = False
-            
-            if self.filter_all.isChecked():
-                # Tümü seçiliyse her dosyay göster
-                show_row = True
-            else:
-                # Dosya Git durumuna sahipse ve ilgili filtre seçiliyse göster
-                if file_path in self.git_status:
-                    status = self.git_status[file_path]
-                    if ((self.filter_modified.isChecked() and status == GitFileStatus.MODIFIED) or
-                        (self.filter_added.isChecked() and status == GitFileStatus.ADDED) or
-                        (self.filter_deleted.isChecked() and status == GitFileStatus.DELETED) or
-                        (self.filter_untracked.isChecked() and status == GitFileStatus.UNTRACKED)):
-                        show_row = True
-            
-            # Git durumlarını say
-            if file_path in self.git_status:
-                status = self.git_status[file_path]
-                if status in status_counts:
-                    status_counts[status] += 1
-            
-            # Satırı göster/gizle
-            self.table.setRowHidden(row, not show_row)
-            if show_row:
-                self.visible_rows.add(row)
+        self._set_visible_rows(visible)
         
         # Filtre butonlarının etiketlerini güncelle
         self.filter_modified.setText(f"Değişenler ({status_counts[GitFileStatus.MODIFIED]})")
@@ -563,69 +788,15 @@ class FileListFrame(QFrame):
     def _on_view_changed(self, checked):
         """Görünüm değişikliğini yönetir."""
         try:
-            # Mevcut seçimleri geçici olarak sakla
-            current_selections = self.selected_files.copy()
-            
+            # Seçimler her iki modelde de ortak seçim deposundan okunur
             if checked:  # Liste görünümü
                 self.stack_widget.setCurrentWidget(self.table)
-                if hasattr(self, '_current_folder_structure'):
-                    self._update_list_view()
-                    # Liste görünümüne geçerken seçili dosyaları koru
-                    self.selected_files = current_selections
-                    self._restore_list_selections()
+                self._update_list_view()
             else:  # Klasör görünümü
                 self.stack_widget.setCurrentWidget(self.folder_tree)
-                if hasattr(self, '_current_folder_structure'):
-                    self._update_folder_view()
-                    # Klasör görünümüne geçerken seçili dosyaları koru
-                    self.selected_files = current_selections
-                    self._restore_tree_selections()
-                    # Klasör durumlarını güncelle
-                    root = self.folder_tree.invisibleRootItem()
-                    for i in range(root.childCount()):
-                        self._update_folder_check_state(root.child(i))
+                self._update_folder_view()
         except Exception as e:
             logging.error(f"Görünüm değiştirme hatası: {str(e)}")
-            # Hata durumunda seçimleri geri yükle
-            self.selected_files = current_selections
-   
-    def _restore_tree_selections(self):
-        """Ağaç görünümünde seçimleri geri yükler."""
-        def restore_item(item):
-            for i in range(item.childCount()):
-                child = item.child(i)
-                file_path = child.data(0, Qt.ItemDataRole.UserRole)
-                if file_path and file_path in self.selected_files:
-                    child.setCheckState(0, Qt.CheckState.Checked)
-                if child.childCount() > 0:
-                    restore_item(child)
-        
-        root = self.folder_tree.invisibleRootItem()
-        restore_item(root)
-
-    def _restore_list_selections(self):
-        """Liste görünümünde seçimleri geri yükler."""
-        # Sinyal bağlantısını geçici olarak kaldır
-        self.table.itemChanged.disconnect(self.on_item_changed)
-        
-        try:
-            for row in range(self.table.rowCount()):
-                name_item = self.table.item(row, 1)
-                if name_item:
-                    file_path = name_item.data(Qt.ItemDataRole.UserRole)
-                    if file_path in self.selected_files:
-                        checkbox = self.table.item(row, 0)
-                        if checkbox:
-                            checkbox.setCheckState(Qt.CheckState.Checked)
-                        else:
-                            # Eğer checkbox item henüz oluşturulmamışsa oluştur
-                            checkbox = QTableWidgetItem()
-                            checkbox.setFlags(Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled)
-                            checkbox.setCheckState(Qt.CheckState.Checked)
-                            self.table.setItem(row, 0, checkbox)
-        finally:
-            # Sinyal bağlantısını geri ekle
-            self.table.itemChanged.connect(self.on_item_changed)
 
     def switch_view(self, view_type: str):
         """Belirli bir görünüme geçer."""
@@ -634,279 +805,28 @@ class FileListFrame(QFrame):
         else:
             self.folder_view_btn.setChecked(True)
 
-    def _build_folder_structure(self, files_data):
-        """Klasör yapısını oluşturur."""
-        folder_structure = {}
-        for file_data in files_data:
-            folder_path = Path(file_data['folder'])
-            current_dict = folder_structure
-            
-            # Klasör hiyerarşisini oluştur
-            for part in folder_path.parts:
-                if part not in current_dict:
-                    current_dict[part] = {'files': [], 'subfolders': {}}
-                current_dict = current_dict[part]['subfolders']
-            
-            # Dosyayı son klasöre ekle
-            if folder_path.parts:
-                target_dict = folder_structure
-                for part in folder_path.parts[:-1]:
-                    target_dict = target_dict[part]['subfolders']
-                target_dict[folder_path.parts[-1]]['files'].append(file_data)
-            else:
-                folder_structure.setdefault('root', {'files': [], 'subfolders': {}})
-                folder_structure['root']['files'].append(file_data)
-        
-        return folder_structure
-
     def _update_folder_view(self):
         """Klasör görünümünü günceller."""
-        if not hasattr(self, '_current_folder_structure'):
-            return
-            
-        # Mevcut seçimleri geçici olarak sakla
-        current_selections = self.selected_files.copy()
-        
-        self.folder_tree.clear()
-        self._populate_folder_tree(self.folder_tree.invisibleRootItem(), 
-                                self._current_folder_structure)
-                                
-        # Seçimleri geri yükle
-        self.selected_files = current_selections
-        self._restore_tree_selections()
-        
-        # Klasör durumlarını güncelle
-        root = self.folder_tree.invisibleRootItem()
-        for i in range(root.childCount()):
-            self._update_folder_check_state(root.child(i))
-
-    def _populate_folder_tree(self, parent_item, folder_dict):
-        """Klasör ağacını doldurur."""
-        for folder_name, content in folder_dict.items():
-            folder_item = QTreeWidgetItem(parent_item)
-            folder_item.setText(0, folder_name)
-            folder_item.setFlags(folder_item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-            folder_item.setCheckState(0, Qt.CheckState.Unchecked)
-            
-            # Klasördeki dosyaları ekle
-            for file_data in content['files']:
-                file_item = QTreeWidgetItem(folder_item)
-                file_item.setText(0, file_data['name'])
-                file_item.setText(1, self.format_size(file_data['size']))
-                file_item.setData(0, Qt.ItemDataRole.UserRole, file_data['path'])
-                file_item.setFlags(file_item.flags() | Qt.ItemFlag.ItemIsUserCheckable)
-                
-                # Eğer dosya seçili dosyalar listesindeyse işaretle
-                if file_data['path'] in self.selected_files:
-                    file_item.setCheckState(0, Qt.CheckState.Checked)
-                else:
-                    file_item.setCheckState(0, Qt.CheckState.Unchecked)
-                
-                # Git durumunu ekle
-                if Path(file_data['path']) in self.git_status:
-                    self._set_tree_item_git_status(file_item, 
-                                                self.git_status[Path(file_data['path'])])
-            
-            # Alt klasörleri işle
-            self._populate_folder_tree(folder_item, content['subfolders'])
-            
-            # Klasör durumunu güncelle
-            self._update_folder_check_state(folder_item)
+        if self.tree_model.table is not self.file_table:
+            self.tree_model.set_files(self.file_table, self.dir_index)
 
     def _update_list_view(self):
         """Liste görünümünü günceller."""
-        if not hasattr(self, '_current_folder_structure'):
-            return
-            
-        # Mevcut seçimleri geçici olarak sakla
-        current_selections = self.selected_files.copy()
-        
-        # Tabloyu temizle
-        self.table.setRowCount(0)
-        
-        # Dosyaları düz liste halinde topla
-        files_data = []
-        def collect_files(structure, path=""):
-            for folder_name, content in structure.items():
-                if folder_name != 'files':
-                    for file_data in content.get('files', []):
-                        files_data.append(file_data)
-                    if 'subfolders' in content:
-                        new_path = f"{path}/{folder_name}" if path else folder_name
-                        collect_files(content['subfolders'], new_path)
-        
-        collect_files(self._current_folder_structure)
-        
-        # Tabloyu doldur
-        self.table.setRowCount(len(files_data))
-        for row, data in enumerate(files_data):
-            self._add_file_to_table(row, data)
-            
-        # Seçimleri geri yükle
-        self.selected_files = current_selections
-
-    def _set_tree_item_git_status(self, item: QTreeWidgetItem, status: GitFileStatus):
-        """Ağaç görünümünde Git durumunu ayarlar."""
-        if status == GitFileStatus.MODIFIED:
-            item.setText(2, "✎ M")
-            item.setBackground(2, QColor(255, 255, 150))
-            item.setToolTip(2, "Modified - Dosya değiştirildi")
-        elif status == GitFileStatus.ADDED:
-            item.setText(2, "+ A")
-            item.setBackground(2, QColor(150, 255, 150))
-            item.setToolTip(2, "Added - Dosya eklendi")
-        elif status == GitFileStatus.DELETED:
-            item.setText(2, "- D")
-            item.setBackground(2, QColor(255, 150, 150))
-            item.setToolTip(2, "Deleted - Dosya silindi")
-        elif status == GitFileStatus.UNTRACKED:
-            item.setText(2, "? U")
-            item.setBackground(2, QColor(200, 200, 200))
-            item.setToolTip(2, "Untracked - Git tarafından takip edilmiyor")
-
-    def _on_tree_item_changed(self, item: QTreeWidgetItem, column: int):
-        """Ağaç görünümünde öğe değişikliklerini işler."""
-        if column == 0:  # Checkbox sütunu
-            # Sinyal bağlantısını geçici olarak kaldır
-            self.folder_tree.itemChanged.disconnect(self._on_tree_item_changed)
-            
-            is_checked = item.checkState(0) == Qt.CheckState.Checked
-            file_path = item.data(0, Qt.ItemDataRole.UserRole)
-            
-            if not file_path:  # Klasör öğesi
-                # Alt öğelerin tümünü işaretle/işareti kaldır
-                self._set_children_check_state(item, is_checked)
-            else:  # Dosya öğesi
-                if is_checked:
-                    self.selected_files.add(file_path)
-                else:
-                    self.selected_files.discard(file_path)
-            
-            # Üst klasörün durumunu kontrol et
-            self._update_parent_check_state(item.parent())
-            
-            # Sinyal bağlantısını geri ekle
-            self.folder_tree.itemChanged.connect(self._on_tree_item_changed)
-            
-            # Seçim değişikliğini bildir
-            self.selection_changed.emit(list(self.selected_files))
-            self.update_info_label()
-
-    def _update_parent_check_state(self, parent_item: QTreeWidgetItem):
-        """Üst klasörün işaret durumunu alt öğelere göre günceller."""
-        if not parent_item:
-            return
-            
-        child_count = parent_item.childCount()
-        checked_count = 0
-        partial_check = False
-        
-        for i in range(child_count):
-            child = parent_item.child(i)
-            if child.checkState(0) == Qt.CheckState.Checked:
-                checked_count += 1
-            elif child.checkState(0) == Qt.CheckState.PartiallyChecked:
-                partial_check = True
-                break
-        
-        if partial_check or (0 < checked_count < child_count):
-            parent_item.setCheckState(0, Qt.CheckState.PartiallyChecked)
-        elif checked_count == child_count:
-            parent_item.setCheckState(0, Qt.CheckState.Checked)
-        else:
-            parent_item.setCheckState(0, Qt.CheckState.Unchecked)
-            
-        # Üst klasörleri de güncelle
-        self._update_parent_check_state(parent_item.parent())
-
-    def _update_tree_view(self):
-        """Ağaç görünümünü günceller."""
-        self.folder_tree.clear()
-        
-        # Git durumunu güncelle
-        if self.git_manager and self.current_directory:
-            try:
-                status = self.git_manager.check_changes(self.current_directory)
-                self.update_git_status(status)
-            except GitException as e:
-                logging.warning(f"Git durumu alınamadı: {e}")
-        
-        # Ağacı doldur
-        self._populate_folder_tree(self.folder_tree.invisibleRootItem(), self._current_folder_structure)
-
-    def _add_file_to_table(self, row: int, data: dict):
-        """Tabloya dosya ekler."""
-        # Checkbox
-        checkbox = QTableWidgetItem()
-        checkbox.setFlags(Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled)
-        checkbox.setCheckState(Qt.CheckState.Unchecked)
-        self.table.setItem(row, 0, checkbox)
-        
-        # Dosya bilgileri
-        self.table.setItem(row, 1, QTableWidgetItem(data['name']))
-        self.table.setItem(row, 2, QTableWidgetItem(data['ext']))
-        self.table.setItem(row, 3, QTableWidgetItem(data['folder']))
-        self.table.setItem(row, 4, QTableWidgetItem(self.format_size(data['size'])))
-        self.table.setItem(row, 5, QTableWidgetItem(""))  # Git durumu için boş hücre
-        
-        # Önizleme ikonu
-        preview_item = QTableWidgetItem("👁")
-        preview_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        preview_item.setToolTip("Dosyayı önizle")
-        self.table.setItem(row, 6, preview_item)
-        
-        # Dosya yolunu gizli data olarak sakla
-        self.table.item(row, 1).setData(Qt.ItemDataRole.UserRole, data['path'])
-
-    def _set_children_check_state(self, item: QTreeWidgetItem, checked: bool):
-        """Alt öğelerin seçim durumunu ayarlar."""
-        state = Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
-        
-        for i in range(item.childCount()):
-            child = item.child(i)
-            child.setCheckState(0, state)
-            
-            # Dosya yolunu al
-            file_path = child.data(0, Qt.ItemDataRole.UserRole)
-            if file_path:
-                if checked:
-                    self.selected_files.add(file_path)
-                else:
-                    self.selected_files.discard(file_path)
-            
-            # Alt klasörleri de işle
-            if child.childCount() > 0:
-                self._set_children_check_state(child, checked)
-
-    def _update_folder_check_state(self, folder_item: QTreeWidgetItem):
-        """Klasör öğesinin seçim durumunu alt öğelere göre günceller."""
-        if folder_item is None:
-            return
-        
-        child_count = folder_item.childCount()
-        checked_count = 0
-        
-        for i in range(child_count):
-            child = folder_item.child(i)
-            if child.checkState(0) == Qt.CheckState.Checked:
-                checked_count += 1
-        
-        if checked_count == child_count:
-            folder_item.setCheckState(0, Qt.CheckState.Checked)
-        elif checked_count == 0:
-            folder_item.setCheckState(0, Qt.CheckState.Unchecked)
-        else:
-            folder_item.setCheckState(0, Qt.CheckState.PartiallyChecked)
-
-    def _on_cell_clicked(self, row: int, column: int):
+        # Satırlar sütun tablosundaki id'lerdir, hücreler model tarafından üretilir
+        file_ids = list(range(len(self.file_table)))
+        self.list_ids = self._apply_history_order(file_ids)
+        self._list_reordered = self.list_ids is not file_ids
+        if self.table_model.table is not self.file_table:
+            self.table_model.set_files(self.file_table)
+        self._set_visible_rows(self.list_ids)
+
+    def _on_cell_clicked(self, index):
         """Tablo hücresine tıklandığında çağrılır."""
-        if column == 6:  # Önizleme sütunu
-            name_item = self.table.item(row, 1)
-            if name_item:
-                file_path = name_item.data(Qt.ItemDataRole.UserRole)
-                if file_path:
-                    dialog = FilePreviewDialog(file_path, self)
-                    dialog.exec()
+        if index.column() == FileTableModel.PREVIEW_COLUMN:  # Önizleme sütunu
+            file_path = self.file_table.paths[self.table_proxy.mapToSource(index).row()]
+            if file_path:
+                dialog = FilePreviewDialog(file_path, self)
+                dialog.exec()
 
     def export_selections_to_csv(self):
         """Seçili dosyaları CSV dosyasına aktarır."""
@@ -983,12 +903,8 @@ class FileListFrame(QFrame):
                 )
                 return
 
-            # Mevcut seçimleri temizle
-            self.toggle_all_selection(False)
-
-            # Bulunan dosyaları seç
-            for file_path in imported_files:
-                self._select_file_in_views(file_path)
+            # Mevcut seçim, bulunan dosyalarla tek güncellemede değiştirilir
+            self._select_files_in_views(imported_files, replace=True)
 
             QMessageBox.information(
                 self,
@@ -1003,53 +919,26 @@ class FileListFrame(QFrame):
                 f"Dosyalar içe aktarılırken hata oluştu:\n{str(e)}"
             )
 
-    def _select_file_in_views(self, file_path: Path):
-        """Verilen dosyayı hem liste hem de ağaç görünümünde seçer."""
-        # Dosyayı selected_files setine ekle
-        self.selected_files.add(str(file_path))
+    def _select_files_in_views(self, file_paths: list, replace: bool = False):
+        """Verilen dosyaları tek bir seçim değişikliğiyle seçer.
         
-        # Liste görünümünde seç
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, 1)  # Dosya yolu sütunu
-            if item and Path(item.data(Qt.ItemDataRole.UserRole)) == file_path:
-                checkbox = self.table.item(row, 0)
-                if checkbox:
-                    checkbox.setCheckState(Qt.CheckState.Checked)
-                break
-
-        # Ağaç görünümünde seç
-        def find_and_select_in_tree(item: QTreeWidgetItem):
-            if item is None:
-                return False
-            
-            # Dosya öğesi kontrolü
-            item_path = item.data(0, Qt.ItemDataRole.UserRole)
-            if item_path and Path(item_path) == file_path:
-                item.setCheckState(0, Qt.CheckState.Checked)
-                return True
-
-            # Alt öğeleri kontrol et
-            for i in range(item.childCount()):
-                child = item.child(i)
-                if find_and_select_in_tree(child):
-                    # Üst klasörün durumunu güncelle
-                    self._update_parent_check_state(item)
-                    return True
-            return False
-
-        # Ağaç görünümünde seçimi uygula
-        root = self.folder_tree.invisibleRootItem()
-        for i in range(root.childCount()):
-            if find_and_select_in_tree(root.child(i)):
-                break
-
-        # Seçim değişikliğini bildir
-        self.selection_changed.emit(list(self.selected_files))
-        self.update_info_label()
+        Yollar tablonun yol indeksiyle O(1) id'ye çevrilir; replace ise
+        önceki seçim de aynı değişiklikte kaldırılır.
+        """
+        file_ids = self.file_table.ids_of(file_paths)
+        # Liste ve ağaç görünümleri seçim farkıyla güncellenir
+        if replace:
+            self.selection.assign(file_ids)
+        else:
+            self.selection.set_many(file_ids, True)
 
 class FilePreviewDialog(QDialog):
     """Dosya önizleme penceresi."""
     
+    # Önizlemede gösterilecek en fazla karakter sayısı
+    MAX_PREVIEW_CHARS = 2 * 1024 * 1024
+    PREVIEW_CHUNK_SIZE = 256 * 1024
+    
     def __init__(self, file_path, parent=None):
         super().__init__(parent)
         self.file_path = file_path
@@ -1076,8 +965,23 @@ class FilePreviewDialog(QDialog):
     def load_file_content(self):
         """Dosya içeriğini yükler."""
         try:
-            with open(self.file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            self.text_edit.setText(content)
+            # Büyük dosyaları tamamen belleğe almadan ilk kısmı göster
+            parts = []
+            loaded = 0
+            truncated = False
+            encoding = get_file_encoding(self.file_path)
+            chunks = iter_file_chunks(self.file_path, self.PREVIEW_CHUNK_SIZE, encoding, errors='replace')
+            for chunk in chunks:
+                if loaded + len(chunk) > self.MAX_PREVIEW_CHARS:
+                    parts.append(chunk[:self.MAX_PREVIEW_CHARS - loaded])
+                    truncated = True
+                    break
+                parts.append(chunk)
+                loaded += len(chunk)
+            
+            content = "".join(parts)
+            if truncated:
+                content += "\n\n... (Dosya çok büyük, yalnızca ilk kısmı gösteriliyor)"
+            self.text_edit.setPlainText(content)
         except Exception as e:
             self.text_edit.setText(f"Dosya açılamadı: {str(e)}")
\ No newline at end of file
@@ -1,11 +1,12 @@
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QSplitter, QMenuBar, QMenu, QMessageBox, QFileDialog,
                              QStatusBar, QDialog, QLabel, QLineEdit, QPushButton,
-                             QCheckBox, QProgressDialog)
+                             QCheckBox, QProgressDialog, QInputDialog)
 
 from src.core import file_scanner
 from src.core.git.git_exceptions import GitException, GitInitError
 from src.core.git.git_manager import GitManager
+from src.core.git.models.git_types import GitConfig
 from src.gui.dialogs.git_settings_dialog import GitSettingsDialog
 from src.gui.dialogs.settings_dialog import SettingsDialog
 from src.gui.dialogs.statistics_dialog import StatisticsDialog
@@ -39,7 +40,7 @@ class MainWindow(QMainWindow):
         
         self.config_manager = config_manager 
         logging.info("Git manager başlatılıyor...")
-        self.git_manager = GitManager()
+        self.git_manager = GitManager(GitConfig.from_dict(self.config_manager.get_git_config()))
         logging.info("Git manager başlatıldı")
         self.file_list = None
         # Pencere başlığı ve boyutu
@@ -113,6 +114,11 @@ class MainWindow(QMainWindow):
         branch_menu = QMenu("Branch Değiştir", self)
         git_menu.addMenu(branch_menu)
         
+        # İki referans arasındaki değişiklikleri dışa aktar
+        ref_export_action = QAction("Branch Farkını Dışa Aktar...", self)
+        ref_export_action.triggered.connect(self.export_ref_changes)
+        git_menu.addAction(ref_export_action)
+        
         # Git ayarları
         git_settings_action = QAction("Git Ayarları", self)
         git_settings_action.triggered.connect(self.show_git_settings)
@@ -182,10 +188,15 @@ class MainWindow(QMainWindow):
         from src.core.file_exporter import FileExporter
         from src.core.template_manager import TemplateManager
         from src.core.extension_manager import ExtensionManager
+        from src.core.large_file_policy import LargeFilePolicyManager
 
         ext_mgr = ExtensionManager(self.config_manager.get('supported_extensions', None))
         file_scanner = FileScanner(config_manager=self.config_manager, extension_manager=ext_mgr)
-        file_exporter = FileExporter(extension_manager=ext_mgr)
+        file_exporter = FileExporter(
+            extension_manager=ext_mgr,
+            chunk_size=self.config_manager.get('read_chunk_size', 1024 * 1024),
+            policy_manager=LargeFilePolicyManager.from_config(self.config_manager)
+        )
         template_manager = TemplateManager(
             self.config_manager.get_app_dirs()['templates']
         )
@@ -198,7 +209,8 @@ class MainWindow(QMainWindow):
         self.export_frame = ExportFrame(
             file_exporter=file_exporter,
             template_manager=template_manager,
-            config_manager=self.config_manager
+            config_manager=self.config_manager,
+            git_manager=self.git_manager
         )
         self.splitter.addWidget(self.export_frame)
         
@@ -209,25 +221,20 @@ class MainWindow(QMainWindow):
         self.splitter.setSizes([int(self.width() * 0.6), int(self.width() * 0.4)])
         
         # Paneller arası sinyal bağlantıları
-        self.file_list.selection_changed.connect(self.export_frame.update_selected_files)
+        self.export_frame.set_selection_source(self.file_list.get_selected_files)
+        self.file_list.selection_changed.connect(self.export_frame.on_selection_changed)
         self.export_frame.export_started.connect(self.on_export_started)
         self.export_frame.export_completed.connect(self.on_export_completed)
         self.export_frame.export_failed.connect(self.on_export_failed)
     
     
-    def show_git_settings(self):
-        """Git ayarları penceresini gösterir."""
-        # Git ayarları dialog'unu göster
-        dialog = GitSettingsDialog(self.config_manager, self)
-        dialog.exec()
-        
     def refresh_git_status(self):
         """Git durumunu yeniler."""
         if self.git_manager:
             try:
                 current_dir = self.file_list.current_directory
                 if current_dir:
-                    changes = self.git_manager.check_changes(Path(current_dir))
+                    changes = self.git_manager.check_changes(Path(current_dir), use_cache=False)
                     self.file_list.update_git_status(changes)
             except GitException as e:
                 QMessageBox.warning(
@@ -236,6 +243,49 @@ class MainWindow(QMainWindow):
                     f"Git durumu güncellenirken hata oluştu:\n{str(e)}"
                 )
 
+    def export_ref_changes(self):
+        """İki referans arasında değişen dosyaları dışa aktarır."""
+        current_dir = self.file_list.current_directory
+        if not current_dir:
+            QMessageBox.warning(self, "Uyarı", "Önce bir proje klasörü açın!")
+            return
+        
+        base, ok = QInputDialog.getText(self, "Branch Farkı", "Karşılaştırılacak referans:", text="main")
+        if not ok or not base.strip():
+            return
+        head, ok = QInputDialog.getText(self, "Branch Farkı", "Hedef referans:", text="HEAD")
+        if not ok or not head.strip():
+            return
+        
+        output_dir = self.export_frame.output_dir_edit.text()
+        if not output_dir:
+            output_dir = QFileDialog.getExistingDirectory(self, "Çıktı Klasörünü Seç", current_dir)
+            if not output_dir:
+                return
+        
+        try:
+            repo_path = Path(current_dir)
+            changes = self.git_manager.get_changes_between(repo_path, base.strip(), head.strip())
+            # Silinen dosyaların içeriği yok, None olarak okunur
+            specs = [f"{head.strip()}:{change['path']}" for change in changes]
+            extension_manager = self.export_frame.file_exporter.extension_manager
+            supported = [
+                (change, spec) for change, spec in zip(changes, specs)
+                if extension_manager.is_supported(Path(change['path']).suffix)
+            ]
+            blobs = self.git_manager.read_blobs(repo_path, [spec for _, spec in supported])
+            self.export_frame.file_exporter.export_ref_changes(
+                [change for change, _ in supported], blobs, output_dir
+            )
+            self.status_bar.showMessage(
+                f"Branch farkı dışa aktarıldı: {self.export_frame.file_exporter.last_summary}",
+                5000
+            )
+        except GitException as e:
+            QMessageBox.warning(self, "Git Hatası", f"Branch farkı alınamadı:\n{str(e)}")
+        except Exception as e:
+            self.on_export_failed(str(e))
+    
     def select_directory(self):
         """Klasör seçme dialogunu açar."""
         directory = QFileDialog.getExistingDirectory(
@@ -252,6 +302,7 @@ class MainWindow(QMainWindow):
         try:
             # Klasörü tara
             self.file_list.scan_directory(directory)
+            self.export_frame.set_repository_path(directory)
             
             # Son kullanılan klasörlere ekle
             self.add_recent_directory(directory)
@@ -319,7 +370,10 @@ class MainWindow(QMainWindow):
     def show_git_settings(self):
         """Git ayarları penceresini gösterir."""
         dialog = GitSettingsDialog(self.config_manager, self)
-        dialog.exec()
+        if dialog.exec():
+            # Yeni önbellek süresi vb. ayarlar hemen geçerli olsun
+            self.git_manager.config = GitConfig.from_dict(self.config_manager.get_git_config())
+            self.git_manager.invalidate_status()
     
     def show_statistics(self):
         """İstatistikler penceresini gösterir."""
@@ -382,6 +436,13 @@ class MainWindow(QMainWindow):
         """Program kapatılırken çağrılır."""
         # Pencere ayarlarını kaydet
         self.save_window_settings()
+        
+        # Arka plan iş parçacıkları git süreçleri kapanmadan bitmeli
+        self.file_list.stop_workers()
+        
+        # Kalıcı git süreçlerini kapat
+        if self.git_manager:
+            self.git_manager.close()
         event.accept()
     
     def check_for_updates(self):
@@ -0,0 +1,7 @@
+# src/gui/models/__init__.py
+
+from .file_table_model import FileTableModel, GIT_STATUS_STYLES, format_size
+from .file_filter_proxy import FileFilterProxyModel
+from .folder_tree_model import FolderTreeModel
+
+__all__ = ['FileTableModel', 'FileFilterProxyModel', 'FolderTreeModel', 'GIT_STATUS_STYLES', 'format_size']
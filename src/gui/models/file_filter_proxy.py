@@ -0,0 +1,118 @@
+from typing import List, Optional
+from PyQt6.QtCore import Qt, QAbstractProxyModel, QModelIndex
+
+
+class FileFilterProxyModel(QAbstractProxyModel):
+    """Dosya listesini süzen ve sıralayan proxy model.
+
+    Kaynak model (FileTableModel) her dosya için bir satır içerir ve satır
+    numarası dosya id'sidir. Proxy yalnızca gösterilecek id'lerin listesini
+    tutar; arama, Git filtresi ve sıralama bu listeyi tek seferde değiştirir,
+    satır başına gizleme/gösterme yapılmaz.
+
+    Sıralamada öğeler karşılaştırılmaz: kaynak modelin önceden hesapladığı
+    permütasyon (tüm satırlar görünürken) veya sıra numaraları (süzülmüş
+    satırlar için) kullanılır. Etkin sıralama yeni satır listelerine de
+    uygulanır.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[int] = []         # Proxy satırı -> dosya id
+        self._source_rows: List[int] = []  # Sıralanmamış (verildiği sıradaki) id'ler
+        self._positions: Optional[dict] = None  # Dosya id -> proxy satırı (gerektiğinde)
+        self._sort_column = -1             # -1: verilen sıra korunur
+        self._sort_order = Qt.SortOrder.AscendingOrder
+
+    def setSourceModel(self, source):
+        super().setSourceModel(source)
+        source.modelReset.connect(self._on_source_reset)
+        source.dataChanged.connect(self._on_source_data_changed)
+
+    def set_rows(self, rows: List[int]):
+        """Gösterilecek dosya id'lerini sırasıyla ayarlar (etkin sıralama uygulanır)."""
+        self.beginResetModel()
+        self._source_rows = rows
+        self._rows = self._sorted(rows)
+        self._positions = None
+        self.endResetModel()
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        """Satırları kaynak modelin sıralama anahtarlarıyla sıralar."""
+        self._sort_column = column
+        self._sort_order = order
+        self.set_rows(self._source_rows)
+
+    def _sorted(self, rows: List[int]) -> List[int]:
+        source = self.sourceModel()
+        if self._sort_column < 0 or source is None or not rows:
+            return rows
+        if len(rows) == source.rowCount():
+            # Tüm dosyalar görünür: hazır permütasyon doğrudan kullanılır
+            order = source.sort_order(self._sort_column)
+            if order is None:
+                return rows
+            rows = list(order)
+        else:
+            ranks = source.sort_ranks(self._sort_column)
+            if ranks is None:
+                return rows
+            rows = sorted(rows, key=ranks.__getitem__)
+        if self._sort_order == Qt.SortOrder.DescendingOrder:
+            rows.reverse()
+        return rows
+
+    def rows(self) -> List[int]:
+        return self._rows
+
+    def _on_source_reset(self):
+        self.set_rows([])
+
+    def _on_source_data_changed(self, top_left, bottom_right, roles=()):
+        if (top_left.column() <= self._sort_column <= bottom_right.column()
+                and Qt.ItemDataRole.CheckStateRole not in roles):
+            # Sıralama sütununun değerleri değişti (ör. Git durumu), yeniden sırala
+            self.set_rows(self._source_rows)
+            return
+        # Kaynaktaki değişiklik sütun bazında iletilir; yalnızca ekrandaki
+        # satırlar yeniden çizildiğinden tüm aralığı bildirmek ucuzdur
+        if self._rows:
+            self.dataChanged.emit(
+                self.index(0, top_left.column()),
+                self.index(len(self._rows) - 1, bottom_right.column()),
+                roles
+            )
+
+    def index(self, row, column, parent=QModelIndex()):
+        if parent.isValid() or not 0 <= row < len(self._rows):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=QModelIndex()):
+        return QModelIndex()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        source = self.sourceModel()
+        return 0 if parent.isValid() or source is None else source.columnCount()
+
+    def mapToSource(self, proxy_index):
+        if not proxy_index.isValid():
+            return QModelIndex()
+        return self.sourceModel().index(self._rows[proxy_index.row()], proxy_index.column())
+
+    def mapFromSource(self, source_index):
+        if not source_index.isValid():
+            return QModelIndex()
+        if self._positions is None:
+            self._positions = {file_id: row for row, file_id in enumerate(self._rows)}
+        row = self._positions.get(source_index.row())
+        return QModelIndex() if row is None else self.createIndex(row, source_index.column())
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Vertical:
+            # Satır numaraları dosya id'si değil, görünen sıra
+            return section + 1 if role == Qt.ItemDataRole.DisplayRole else None
+        return self.sourceModel().headerData(section, orientation, role)
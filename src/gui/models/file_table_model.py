@@ -0,0 +1,205 @@
+import time
+from array import array
+from typing import Dict, Optional, Sequence
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QColor
+from src.core.git.git_types import GitFileStatus
+from src.models.file_table import FileTable
+from src.models.git_status_codes import GitStatusCodes
+from src.models.selection_store import SelectionDelta, SelectionStore
+from src.core.file_exporter import estimate_tokens
+
+# Git durumu -> (etiket, arka plan rengi, ipucu); liste ve ağaç görünümü ortak kullanır
+GIT_STATUS_STYLES = {
+    GitFileStatus.MODIFIED: ("✎ M", QColor(255, 255, 150), "Modified - Dosya değiştirildi"),
+    GitFileStatus.ADDED: ("+ A", QColor(150, 255, 150), "Added - Dosya eklendi"),
+    GitFileStatus.DELETED: ("- D", QColor(255, 150, 150), "Deleted - Dosya silindi"),
+    GitFileStatus.UNTRACKED: ("? U", QColor(200, 200, 200), "Untracked - Git tarafından takip edilmiyor"),
+    GitFileStatus.RENAMED: ("→ R", QColor(150, 200, 255), "Renamed - Dosya yeniden adlandırıldı"),
+    GitFileStatus.COPIED: ("⧉ C", QColor(150, 200, 255), "Copied - Dosya kopyalandı"),
+    GitFileStatus.UNMERGED: ("⚠ !", QColor(255, 180, 100), "Unmerged - Çözülmemiş çakışma"),
+}
+
+
+def format_size(size) -> str:
+    """Dosya boyutunu formatlar."""
+    for unit in ['B', 'KB', 'MB', 'GB']:
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+class FileTableModel(QAbstractTableModel):
+    """FileTable dizileri üzerinde çalışan sanal liste modeli.
+
+    Satır numarası dosya sıra numarasıdır (id); hücre metni, seçim işareti
+    ve Git durumu `data()` içinde istenildiği anda üretilir. Böylece bellek
+    ve çizim maliyeti yalnızca ekranda görünen satırlarla orantılıdır.
+    Süzme ve sıralama FileFilterProxyModel'de yapılır. İşaretler ortak
+    SelectionStore'dan okunur ve oraya yazılır.
+
+    Sıralama görüntülenen metinler yerine sütun başına önceden hesaplanan
+    anahtar dizileriyle (sayısal boyut, zaman, tekil klasör sırası, Git
+    durum kodu) yapılır. Bir sütunun sıralı id permütasyonu (argsort) ilk
+    istendiğinde bir kez hesaplanır ve tablo değişene kadar saklanır.
+    """
+
+    HEADERS = ["", "Dosya Adı", "Uzantı", "Klasör", "Boyut", "Token", "Değiştirilme", "Git", "Önizle"]
+    (CHECK_COLUMN, NAME_COLUMN, EXT_COLUMN, FOLDER_COLUMN, SIZE_COLUMN,
+     TOKENS_COLUMN, MTIME_COLUMN, GIT_COLUMN, PREVIEW_COLUMN) = range(9)
+
+    def __init__(self, selection: SelectionStore, parent=None):
+        super().__init__(parent)
+        self.table = FileTable()
+        self.git_codes = GitStatusCodes()
+        self.selection = selection
+        self._sort_orders: Dict[int, array] = {}  # Sütun -> artan sıralı dosya id'leri
+        self._sort_ranks: Dict[int, array] = {}   # Sütun -> dosya id'sinin sıradaki yeri
+        selection.add_listener(self._on_selection_changed)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.table)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        if index.column() == self.CHECK_COLUMN:
+            return Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled
+        return Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        file_id = index.row()
+        column = index.column()
+        table = self.table
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == self.NAME_COLUMN:
+                return table.names[file_id]
+            if column == self.EXT_COLUMN:
+                return table.exts[file_id]
+            if column == self.FOLDER_COLUMN:
+                return table.folder(file_id)
+            if column == self.SIZE_COLUMN:
+                return format_size(table.sizes[file_id])
+            if column == self.TOKENS_COLUMN:
+                return f"{estimate_tokens(table.sizes[file_id]):,}"
+            if column == self.MTIME_COLUMN:
+                return time.strftime('%Y-%m-%d %H:%M', time.localtime(table.mtimes[file_id]))
+            if column == self.GIT_COLUMN:
+                style = self._git_style(file_id)
+                return style[0] if style else ""
+            if column == self.PREVIEW_COLUMN:
+                return "👁"
+        elif role == Qt.ItemDataRole.CheckStateRole:
+            if column == self.CHECK_COLUMN:
+                return Qt.CheckState.Checked if file_id in self.selection else Qt.CheckState.Unchecked
+        elif role == Qt.ItemDataRole.BackgroundRole:
+            if column == self.GIT_COLUMN:
+                style = self._git_style(file_id)
+                return style[1] if style else None
+        elif role == Qt.ItemDataRole.ToolTipRole:
+            if column == self.GIT_COLUMN:
+                style = self._git_style(file_id)
+                return style[2] if style else None
+            if column == self.PREVIEW_COLUMN:
+                return "Dosyayı önizle"
+        elif role == Qt.ItemDataRole.TextAlignmentRole:
+            if column in (self.GIT_COLUMN, self.PREVIEW_COLUMN):
+                return Qt.AlignmentFlag.AlignCenter
+            if column in (self.SIZE_COLUMN, self.TOKENS_COLUMN):
+                return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+        elif role == Qt.ItemDataRole.UserRole:
+            return table.paths[file_id]
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole) -> bool:
+        if (not index.isValid() or index.column() != self.CHECK_COLUMN
+                or role != Qt.ItemDataRole.CheckStateRole):
+            return False
+        checked = Qt.CheckState(value) == Qt.CheckState.Checked
+        self.selection.set_many([index.row()], checked)
+        return True
+
+    def _git_style(self, file_id: int):
+        status = self.git_codes.status(file_id)
+        return GIT_STATUS_STYLES.get(status) if status is not None else None
+
+    def set_files(self, table: FileTable):
+        """Yeni tarama sonucunu ayarlar."""
+        self.beginResetModel()
+        self.table = table
+        self.git_codes = GitStatusCodes(len(table))
+        self._sort_orders = {}
+        self._sort_ranks = {}
+        self.endResetModel()
+
+    def set_git_status(self, codes: GitStatusCodes):
+        """Tabloyla hizalı Git durum kodlarını ayarlar, Git sütunu tek sinyalle yenilenir."""
+        self.git_codes = codes
+        self._sort_orders.pop(self.GIT_COLUMN, None)
+        self._sort_ranks.pop(self.GIT_COLUMN, None)
+        self._column_changed(self.GIT_COLUMN)
+
+    def _sort_keys(self, column: int) -> Optional[Sequence]:
+        """Sütunun dosya id'sine göre sıralama anahtarları; sıralanamıyorsa None."""
+        table = self.table
+        if column == self.NAME_COLUMN:
+            return [name.lower() for name in table.names]
+        if column == self.EXT_COLUMN:
+            return table.exts
+        if column == self.FOLDER_COLUMN:
+            # Klasör id'leri zaten klasör yolu sırasıyla verilmiştir
+            return table.folder_ids
+        if column in (self.SIZE_COLUMN, self.TOKENS_COLUMN):
+            # Token tahmini boyutla orantılıdır
+            return table.sizes
+        if column == self.MTIME_COLUMN:
+            return table.mtimes
+        if column == self.GIT_COLUMN:
+            return self.git_codes.codes
+        return None
+
+    def sort_order(self, column: int) -> Optional[array]:
+        """Tüm dosya id'lerinin sütuna göre artan sırası (argsort); sıralanamıyorsa None."""
+        order = self._sort_orders.get(column)
+        if order is None:
+            keys = self._sort_keys(column)
+            if keys is None:
+                return None
+            # Anahtar dizisinin __getitem__'i C düzeyinde çağrılır; eşitlerde id sırası korunur
+            order = self._sort_orders[column] = array('I', sorted(range(len(keys)), key=keys.__getitem__))
+        return order
+
+    def sort_ranks(self, column: int) -> Optional[array]:
+        """Dosya id'si -> sütun sırasındaki yeri; süzülmüş satırları sıralamak için."""
+        ranks = self._sort_ranks.get(column)
+        if ranks is None:
+            order = self.sort_order(column)
+            if order is None:
+                return None
+            ranks = array('I', bytes(4 * len(order)))
+            for position, file_id in enumerate(order):
+                ranks[file_id] = position
+            self._sort_ranks[column] = ranks
+        return ranks
+
+    def _on_selection_changed(self, delta: SelectionDelta):
+        """Seçim değiştiğinde işaret sütununu yeniden çizdirir."""
+        self._column_changed(self.CHECK_COLUMN, [Qt.ItemDataRole.CheckStateRole])
+
+    def _column_changed(self, column: int, roles=None):
+        if len(self.table):
+            self.dataChanged.emit(
+                self.index(0, column), self.index(len(self.table) - 1, column), roles or []
+            )
@@ -0,0 +1,305 @@
+from array import array
+from typing import Iterable
+from PyQt6.QtCore import Qt, QAbstractItemModel, QModelIndex
+from src.models.directory_index import DirectoryIndex
+from src.models.file_table import FileTable
+from src.models.git_status_codes import GitStatusCodes
+from src.models.selection_store import SelectionDelta, SelectionStore
+from .file_table_model import GIT_STATUS_STYLES, format_size
+
+
+class FolderTreeModel(QAbstractItemModel):
+    """DirectoryIndex üzerinde tembel (lazy) çalışan klasör ağacı modeli.
+
+    Bir klasörün çocukları yalnızca klasör açıldığında `fetchMore` ile
+    görünüme eklenir; kapalı klasörler için hiçbir satır oluşturulmaz.
+    Her klasör için alt ağacındaki seçili dosya sayısı tutulur; klasörün
+    işaret durumu (boş, kısmi, tam) bu sayaçla toplam dosya sayısından
+    türetilir. Bir dosyanın seçimi değiştiğinde yalnızca ata zincirindeki
+    sayaçlar güncellenir. Seçimler ortak SelectionStore'dan okunur, oradaki
+    değişiklikler fark olarak dinlenir.
+
+    Model indeksleri iç numara olarak klasörler için `düğüm * 2`, dosyalar
+    için `id * 2 + 1` taşır.
+    """
+
+    HEADERS = ["Dosya/Klasör", "Boyut", "Git"]
+    NAME_COLUMN, SIZE_COLUMN, GIT_COLUMN = range(3)
+    FETCH_BATCH = 1000
+
+    def __init__(self, selection: SelectionStore, parent=None):
+        super().__init__(parent)
+        self.table = FileTable()
+        self.index_data = DirectoryIndex.from_table(self.table)
+        self.git_codes = GitStatusCodes()
+        self.selection = selection
+        selection.add_listener(self._on_selection_changed)
+        self._fetched = {}          # Düğüm -> görünüme eklenen çocuk sayısı
+        self._checked = array('I', [0])  # Düğüm -> alt ağaçtaki seçili dosya sayısı
+
+    def set_files(self, table: FileTable, index: DirectoryIndex):
+        """Yeni tarama sonucunu ayarlar; yalnızca kök düzeyi yüklenir."""
+        self.beginResetModel()
+        self.table = table
+        self.index_data = index
+        self.git_codes = GitStatusCodes(len(table))
+        self._fetched = {}
+        self._checked = array('I', bytes(4 * len(index)))
+        self.endResetModel()
+        self.update_check_states()
+
+    # Model indeksi yardımcıları
+    def _node(self, parent: QModelIndex) -> int:
+        """Geçerli olmayan indeks kök düğümdür."""
+        return parent.internalId() >> 1 if parent.isValid() else 0
+
+    def _dir_index(self, node: int, column: int = 0) -> QModelIndex:
+        if node == 0:
+            return QModelIndex()
+        parent = self.index_data.parents[node]
+        row = self.index_data.file_count(parent) + self.index_data.positions[node]
+        return self.createIndex(row, column, node << 1)
+
+    def index(self, row, column, parent=QModelIndex()):
+        node = self._node(parent)
+        if row < 0 or row >= self._fetched.get(node, 0):
+            return QModelIndex()
+        files = self.index_data.file_count(node)
+        if row < files:
+            return self.createIndex(row, column, ((self.index_data.file_start[node] + row) << 1) | 1)
+        return self.createIndex(row, column, self.index_data.children[node][row - files] << 1)
+
+    def parent(self, index=QModelIndex()):
+        if not index.isValid():
+            return QModelIndex()
+        item = index.internalId()
+        if item & 1:
+            node = self.index_data.node_of_file(self.table, item >> 1)
+        else:
+            node = self.index_data.parents[item >> 1]
+        return self._dir_index(node)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.column() > 0:
+            return 0
+        if parent.isValid() and parent.internalId() & 1:
+            return 0
+        return self._fetched.get(self._node(parent), 0)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return len(self.HEADERS)
+
+    def hasChildren(self, parent=QModelIndex()) -> bool:
+        if parent.isValid() and parent.internalId() & 1:
+            return False
+        return self.index_data.child_count(self._node(parent)) > 0
+
+    def canFetchMore(self, parent) -> bool:
+        if parent.isValid() and parent.internalId() & 1:
+            return False
+        node = self._node(parent)
+        return self._fetched.get(node, 0) < self.index_data.child_count(node)
+
+    def fetchMore(self, parent):
+        node = self._node(parent)
+        fetched = self._fetched.get(node, 0)
+        remaining = self.index_data.child_count(node) - fetched
+        if remaining <= 0:
+            return
+        count = min(remaining, self.FETCH_BATCH)
+        self.beginInsertRows(parent, fetched, fetched + count - 1)
+        self._fetched[node] = fetched + count
+        self.endInsertRows()
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        flags = Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
+        if index.column() == self.NAME_COLUMN:
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        return flags
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        item = index.internalId()
+        column = index.column()
+
+        if not item & 1:  # Klasör
+            node = item >> 1
+            if column != self.NAME_COLUMN:
+                return None
+            if role == Qt.ItemDataRole.DisplayRole:
+                return self.index_data.names[node]
+            if role == Qt.ItemDataRole.CheckStateRole:
+                return self._dir_check_state(node)
+            return None
+
+        file_id = item >> 1
+        path = self.table.paths[file_id]
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == self.NAME_COLUMN:
+                return self.table.names[file_id]
+            if column == self.SIZE_COLUMN:
+                return format_size(self.table.sizes[file_id])
+            if column == self.GIT_COLUMN:
+                style = self._git_style(file_id)
+                return style[0] if style else None
+        elif role == Qt.ItemDataRole.CheckStateRole:
+            if column == self.NAME_COLUMN:
+                return Qt.CheckState.Checked if file_id in self.selection else Qt.CheckState.Unchecked
+        elif role == Qt.ItemDataRole.BackgroundRole:
+            if column == self.GIT_COLUMN:
+                style = self._git_style(file_id)
+                return style[1] if style else None
+        elif role == Qt.ItemDataRole.ToolTipRole:
+            if column == self.GIT_COLUMN:
+                style = self._git_style(file_id)
+                return style[2] if style else None
+        elif role == Qt.ItemDataRole.UserRole:
+            return path
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole) -> bool:
+        if (not index.isValid() or index.column() != self.NAME_COLUMN
+                or role != Qt.ItemDataRole.CheckStateRole):
+            return False
+        checked = Qt.CheckState(value) == Qt.CheckState.Checked
+        item = index.internalId()
+        if item & 1:
+            self.selection.set_many([item >> 1], checked)
+        else:
+            # Klasörün alt ağacı ardışık bir id aralığıdır
+            node = item >> 1
+            self.selection.set_range(
+                self.index_data.file_start[node], self.index_data.subtree_end[node], checked
+            )
+        return True
+
+    def _git_style(self, file_id: int):
+        status = self.git_codes.status(file_id)
+        return GIT_STATUS_STYLES.get(status) if status is not None else None
+
+    def _dir_check_state(self, node: int) -> Qt.CheckState:
+        checked = self._checked[node]
+        if checked == 0:
+            return Qt.CheckState.Unchecked
+        if checked == self.index_data.total_files(node):
+            return Qt.CheckState.Checked
+        return Qt.CheckState.PartiallyChecked
+
+    def _on_selection_changed(self, delta: SelectionDelta):
+        """Seçim farkını klasör sayaçlarına uygular."""
+        if not isinstance(delta.ids, range):
+            self.files_changed(delta.ids, delta.selected)
+            return
+        node = self._range_node(delta.ids.start, delta.ids.stop)
+        if node is not None and delta.selected is not None:
+            self.set_subtree(node, delta.selected)
+        else:
+            self.update_check_states()
+
+    def _range_node(self, start: int, end: int):
+        """Alt ağacı tam olarak [start, end) olan klasörü bulur (O(derinlik))."""
+        index = self.index_data
+        if start >= end or end > len(self.table):
+            return None
+        for node in index.ancestors(index.node_of_file(self.table, start)):
+            if index.file_start[node] == start and index.subtree_end[node] == end:
+                return node
+            if index.file_start[node] < start:
+                break
+        return None
+
+    def update_check_states(self):
+        """Klasör sayaçlarını seçim bitset'inden baştan hesaplar (tam yenileme)."""
+        index = self.index_data
+        counts = self._checked
+        for node in range(len(index)):
+            counts[node] = self.selection.count_range(index.file_start[node], index.file_end[node])
+        # Düğümler ön-sıralı, tersten gidince çocuklar üst düğümden önce toplanır
+        for node in range(len(index) - 1, 0, -1):
+            counts[index.parents[node]] += counts[node]
+        self._fetched_changed(self.NAME_COLUMN, [Qt.ItemDataRole.CheckStateRole])
+
+    def files_changed(self, file_ids: Iterable[int], checked: bool):
+        """
+        Seçim durumu gerçekten değişen dosyaların ata sayaçlarını günceller.
+
+        Dosyalar önce klasörlerine göre toplanır, sonra her klasör için
+        yalnızca ata zinciri (O(derinlik)) güncellenir.
+        """
+        index = self.index_data
+        step = 1 if checked else -1
+        direct = {}
+        for file_id in file_ids:
+            node = index.node_of_file(self.table, file_id)
+            direct[node] = direct.get(node, 0) + step
+
+        touched = set()
+        for node, delta in direct.items():
+            for ancestor in index.ancestors(node):
+                self._checked[ancestor] += delta
+                touched.add(ancestor)
+
+        self._nodes_changed(touched)
+        for node in direct:
+            self._children_changed(node)
+
+    def set_subtree(self, node: int, checked: bool):
+        """
+        Klasörün tüm alt ağacını tek seferde seçer veya seçimini kaldırır.
+
+        Alt klasör sayaçları toplamlarından doğrudan yazılır (dosya başına
+        değil, klasör başına), atalara ise tek bir fark eklenir.
+        """
+        index = self.index_data
+        delta = (index.total_files(node) if checked else 0) - self._checked[node]
+        for descendant in range(node, index.node_end[node]):
+            self._checked[descendant] = index.total_files(descendant) if checked else 0
+        parent = index.parents[node]
+        if parent >= 0:
+            for ancestor in index.ancestors(parent):
+                self._checked[ancestor] += delta
+
+        self._nodes_changed(index.ancestors(node))
+        for descendant in range(node, index.node_end[node]):
+            self._children_changed(descendant)
+
+    def _nodes_changed(self, nodes: Iterable[int]):
+        """Görünümde yüklü klasör satırlarının işaret hücrelerini yeniler."""
+        for node in nodes:
+            if node == 0:
+                continue
+            index = self._dir_index(node)
+            if index.row() < self._fetched.get(self.index_data.parents[node], 0):
+                self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+
+    def _children_changed(self, node: int):
+        """Klasörün yüklü çocuklarının işaret hücrelerini yeniler."""
+        fetched = self._fetched.get(node, 0)
+        if fetched:
+            parent = self._dir_index(node)
+            self.dataChanged.emit(
+                self.index(0, self.NAME_COLUMN, parent), self.index(fetched - 1, self.NAME_COLUMN, parent),
+                [Qt.ItemDataRole.CheckStateRole]
+            )
+
+    def set_git_status(self, codes: GitStatusCodes):
+        """Tabloyla hizalı Git durum kodlarını ayarlar, yüklenmiş satırların Git sütunu yenilenir."""
+        self.git_codes = codes
+        self._fetched_changed(self.GIT_COLUMN)
+
+    def _fetched_changed(self, column: int, roles=None):
+        """Görünüme eklenmiş her klasörün çocukları için tek dataChanged sinyali."""
+        for node, fetched in self._fetched.items():
+            if fetched:
+                parent = self._dir_index(node)
+                self.dataChanged.emit(
+                    self.index(0, column, parent), self.index(fetched - 1, column, parent), roles or []
+                )
@@ -0,0 +1,119 @@
+import os
+from array import array
+from typing import List
+from .file_table import FileTable
+
+
+class DirectoryIndex:
+    """FileTable üzerinden önceden hesaplanan klasör ağacı indeksi.
+
+    Her klasör bir düğüm numarasıyla temsil edilir; 0 numaralı düğüm tarama
+    köküdür. Düğümler ön-sıra (pre-order) ile numaralanır, bu yüzden bir
+    düğümün ataları her zaman kendisinden küçük numaralıdır.
+
+    FileTable dosyaları klasör sırasıyla dizdiği için her düğümün doğrudan
+    dosyaları [file_start, file_end), tüm alt ağacının dosyaları ise
+    [file_start, subtree_end) ardışık aralıklarıdır. Aynı şekilde alt
+    klasör düğümleri de [düğüm + 1, node_end) aralığındadır.
+    """
+
+    def __init__(self):
+        self.names: List[str] = []          # Klasör adı
+        self.parents = array('i')           # Üst düğüm (kök için -1)
+        self.positions = array('I')         # Üst düğümün alt klasörleri içindeki sırası
+        self.children: List[List[int]] = [] # Alt klasör düğümleri
+        self.file_start = array('I')        # Doğrudan dosyaların ilk id'si
+        self.file_end = array('I')          # Doğrudan dosyaların son id'si + 1
+        self.subtree_end = array('I')       # Alt ağaçtaki son dosya id'si + 1
+        self.node_end = array('I')          # Alt ağaçtaki son düğüm + 1
+        self.folder_nodes = array('I')      # FileTable klasör sırası -> düğüm
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _add_node(self, name: str, parent: int, first_file: int) -> int:
+        node = len(self.names)
+        self.names.append(name)
+        self.parents.append(parent)
+        self.children.append([])
+        if parent >= 0:
+            self.positions.append(len(self.children[parent]))
+            self.children[parent].append(node)
+        else:
+            self.positions.append(0)
+        self.file_start.append(first_file)
+        self.file_end.append(first_file)
+        self.subtree_end.append(first_file)
+        self.node_end.append(node + 1)
+        return node
+
+    @classmethod
+    def from_table(cls, table: FileTable) -> 'DirectoryIndex':
+        """Sıralı FileTable'dan klasör ağacını tek geçişte oluşturur."""
+        index = cls()
+        index._add_node('', -1, 0)
+        nodes = {(): 0}
+        folder_nodes = [0] * len(table.folders)
+
+        # Her klasörün dosyaları ardışık olduğundan sınırlar tek geçişte bulunur
+        folder_ids = table.folder_ids
+        count = len(folder_ids)
+        start = 0
+        while start < count:
+            folder_id = folder_ids[start]
+            end = start + 1
+            while end < count and folder_ids[end] == folder_id:
+                end += 1
+
+            folder = table.folders[folder_id]
+            parts = () if folder == '.' else tuple(folder.split(os.sep))
+            node = nodes.get(parts)
+            if node is None:
+                # Eksik ataları (doğrudan dosyası olmayan klasörler) da oluştur
+                for depth in range(1, len(parts) + 1):
+                    key = parts[:depth]
+                    if key not in nodes:
+                        nodes[key] = index._add_node(parts[depth - 1], nodes[parts[:depth - 1]], start)
+                node = nodes[parts]
+
+            index.file_start[node] = start
+            index.file_end[node] = end
+            folder_nodes[folder_id] = node
+            start = end
+
+        # Alt ağaç sonlarını yapraklardan köke doğru topla
+        for node in range(len(index) - 1, -1, -1):
+            end = max(index.subtree_end[node], index.file_end[node])
+            index.subtree_end[node] = end
+            parent = index.parents[node]
+            if parent >= 0:
+                if end > index.subtree_end[parent]:
+                    index.subtree_end[parent] = end
+                if index.node_end[node] > index.node_end[parent]:
+                    index.node_end[parent] = index.node_end[node]
+
+        index.folder_nodes = array('I', folder_nodes)
+        return index
+
+    def file_count(self, node: int) -> int:
+        """Düğümün doğrudan dosya sayısı."""
+        return self.file_end[node] - self.file_start[node]
+
+    def child_count(self, node: int) -> int:
+        """Düğümün görünümdeki çocuk sayısı (önce dosyalar, sonra klasörler)."""
+        return self.file_count(node) + len(self.children[node])
+
+    def total_files(self, node: int) -> int:
+        """Düğümün alt ağacındaki toplam dosya sayısı."""
+        return self.subtree_end[node] - self.file_start[node]
+
+    def ancestors(self, node: int):
+        """Düğümün kendisi dahil köke kadar olan ataları (O(derinlik))."""
+        parents = self.parents
+        while node >= 0:
+            yield node
+            node = parents[node]
+
+    def node_of_file(self, table: FileTable, file_id: int) -> int:
+        """Dosyanın bulunduğu klasör düğümü."""
+        return self.folder_nodes[table.folder_ids[file_id]]
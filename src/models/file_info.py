@@ -1,7 +1,8 @@
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 import os
+from ..utils.file_utils import DEFAULT_CHUNK_SIZE, iter_file_chunks, get_file_encoding
 
 @dataclass
 class FileInfo:
@@ -54,11 +55,29 @@ class FileInfo:
                 search_term in str(self.path).lower() or
                 (self.layer_name and search_term in self.layer_name.lower()))
     
-    def get_content(self) -> str:
-        """Dosya içeriğini UTF-8 formatında okur."""
+    def iter_content(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+        """Dosya içeriğini tespit edilen kodlamayla parça parça okur."""
+        encoding = get_file_encoding(self.path)
+        return iter_file_chunks(self.path, chunk_size, encoding, errors='replace')
+    
+    def get_content(self, max_chars: Optional[int] = None) -> str:
+        """
+        Dosya içeriğini tespit edilen kodlamayla okur.
+        
+        Args:
+            max_chars: Okunacak en fazla karakter sayısı (None ise tamamı)
+        """
         try:
-            with open(self.path, 'r', encoding='utf-8') as f:
-                return f.read()
+            parts = []
+            remaining = max_chars
+            for chunk in self.iter_content():
+                if remaining is not None:
+                    chunk = chunk[:remaining]
+                    remaining -= len(chunk)
+                parts.append(chunk)
+                if remaining is not None and remaining <= 0:
+                    break
+            return "".join(parts)
         except Exception as e:
             return f"Dosya okuma hatası: {str(e)}"
     
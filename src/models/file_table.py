@@ -0,0 +1,77 @@
+import os
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class FileTable:
+    """Taranan dosyaları sütun dizileri halinde tutan sınıf.
+
+    Her dosya bir sıra numarasıyla (id) temsil edilir ve bilgileri paralel
+    dizilerde saklanır; satır başına nesne oluşturulmaz. Klasör adları
+    tekilleştirilir, dosyalar yalnızca klasör sıra numarasını tutar.
+
+    Dosyalar (klasör parçaları, dosya adı) sırasıyla dizilir. Böylece bir
+    klasörün tüm alt ağacı ardışık bir id aralığı oluşturur.
+    """
+
+    def __init__(self):
+        self.paths: List[str] = []          # Tam yol
+        self.names: List[str] = []          # Dosya adı
+        self.exts: List[str] = []           # Noktasız, büyük harf uzantı
+        self.folders: List[str] = []        # Tekil göreli klasör yolları ('.' kök)
+        self.folder_ids = array('I')        # Dosya -> klasör sıra numarası
+        self.sizes = array('q')             # Bayt cinsinden boyut
+        self.mtimes = array('d')            # Son değişiklik zamanı (epoch saniye)
+        self._path_ids: Optional[Dict[str, int]] = None  # Tam yol -> id (gerektiğinde)
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[Tuple[str, str, str, int, float]]) -> 'FileTable':
+        """
+        (tam yol, göreli klasör, dosya adı, boyut, değişiklik zamanı) kayıtlarından tablo oluşturur.
+
+        Args:
+            entries: Klasör yolu os.sep ayraçlı, kök için '.'
+        """
+        entries = list(entries)
+
+        # Klasörler bir kez sıralanır, dosyalar (klasör sırası, ad) ile dizilir
+        unique_folders = {entry[1] for entry in entries}
+        ordered = sorted(unique_folders, key=lambda f: () if f == '.' else tuple(f.split(os.sep)))
+        rank = {folder: i for i, folder in enumerate(ordered)}
+        entries.sort(key=lambda entry: (rank[entry[1]], entry[2].lower()))
+
+        table = cls()
+        folder_index = {}
+        folder_ids = []
+        for _, folder, name, _, _ in entries:
+            folder_id = folder_index.get(folder)
+            if folder_id is None:
+                folder_id = folder_index[folder] = len(table.folders)
+                table.folders.append(folder)
+            folder_ids.append(folder_id)
+            dot = name.rfind('.')
+            table.exts.append(name[dot + 1:].upper() if dot > 0 else '')
+        table.paths = [entry[0] for entry in entries]
+        table.names = [entry[2] for entry in entries]
+        table.folder_ids = array('I', folder_ids)
+        table.sizes = array('q', [entry[3] for entry in entries])
+        table.mtimes = array('d', [entry[4] for entry in entries])
+        return table
+
+    def id_of(self, path) -> Optional[int]:
+        """Tam yolun dosya id'sini O(1) döndürür; tabloda yoksa None."""
+        if self._path_ids is None:
+            self._path_ids = dict(zip(self.paths, range(len(self.paths))))
+        return self._path_ids.get(str(path))
+
+    def ids_of(self, paths: Iterable) -> List[int]:
+        """Tablodaki yolların id'lerini döndürür, bulunmayanlar atlanır."""
+        id_of = self.id_of
+        return [file_id for file_id in map(id_of, paths) if file_id is not None]
+
+    def folder(self, file_id: int) -> str:
+        """Dosyanın göreli klasör yolunu döndürür."""
+        return self.folders[self.folder_ids[file_id]]
@@ -0,0 +1,199 @@
+import heapq
+import os
+import re
+from array import array
+from bisect import bisect_right
+from typing import Callable, Iterable, List, NamedTuple, Optional
+from .file_table import FileTable
+from .trigram_index import SearchCancelled
+
+# Puanlama sabitleri (fzf'in v1 algoritmasına benzer)
+SCORE_MATCH = 16
+SCORE_GAP_START = -3
+SCORE_GAP_EXTENSION = -1
+BONUS_SEPARATOR = 9       # Klasör ayracından sonraki karakter
+BONUS_BOUNDARY = 8        # Yol başı veya _ - . boşluk sonrası
+BONUS_CAMEL = 7           # camelCase geçişi ve harften rakama geçiş
+BONUS_CONSECUTIVE = 4
+BONUS_FIRST_CHAR_MULTIPLIER = 2
+BONUS_FILE_NAME = 2       # Dosya adında (klasörde değil) eşleşen her karakter
+
+# İptal kontrolleri arasında puanlanan aday sayısı
+_CHUNK = 4096
+_SEPARATORS = '/\\'
+_DELIMITERS = '_-. '
+
+
+class FuzzyMatches(NamedTuple):
+    """Bulanık arama sonucu.
+
+    `candidates` sorgunun alt dizi (subsequence) olarak geçtiği tüm dosya
+    id'leridir (artan sırada, sonraki daraltmalar için); `ranked` bunların
+    en yüksek puanlı ilk K tanesidir.
+    """
+    candidates: List[int]
+    ranked: List[int]
+
+
+def is_subsequence(part: str, text: str) -> bool:
+    """`part` karakterleri `text` içinde sırasıyla geçiyor mu?"""
+    chars = iter(text)
+    return all(char in chars for char in part)
+
+
+def fold_case(text: str) -> str:
+    """Uzunluğu koruyan küçük harf dönüşümü.
+
+    `str.lower` her zaman uzunluğu korumaz ('İ' iki karaktere dönüşür); bu
+    durumda karakter başına dönüşümün ilk karakteri alınır. Böylece küçük
+    harfli yoldaki konumlar özgün yoldaki konumlarla aynı kalır.
+    """
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return ''.join(char.lower()[0] for char in text)
+
+
+def _char_bonus(path: str, pos: int) -> int:
+    """Eşleşen karakterin kelime başında olmasına göre verilen bonus."""
+    if pos == 0:
+        return BONUS_BOUNDARY
+    prev, char = path[pos - 1], path[pos]
+    if prev in _SEPARATORS:
+        return BONUS_SEPARATOR
+    if prev in _DELIMITERS:
+        return BONUS_BOUNDARY
+    if prev.islower() and char.isupper():
+        return BONUS_CAMEL
+    if char.isdigit() and not prev.isdigit():
+        return BONUS_CAMEL
+    return 0
+
+
+class FuzzyIndex:
+    """Göreli dosya yolları üzerinde fzf tarzı bulanık arama.
+
+    Yollar tarama başına bir kez uzunluğu korunarak küçük harfe çevrilir
+    (bonuslar özgün yoldaki aynı konumlardan hesaplanır); klasör önekleri
+    tekil olduğundan paylaşılır. Tüm yollar satır satır tek bir metinde
+    birleştirilir ve sorgu geri izleme yapmayan tek bir düzenli ifadeyle
+    C hızında taranır; böylece yalnızca eşleşen satırlar Python'da
+    puanlanır. Puanlama ileri eşleşmenin bittiği yerden geriye doğru en
+    kısa pencereyi bulur, kelime başı/camelCase/ardışıklık bonuslarını ve
+    boşluk cezalarını toplar. İlk K sonuç heap ile seçilir.
+    """
+
+    def __init__(self, table: FileTable, limit: int = 1000):
+        self.table = table
+        self.limit = limit  # search() ile döndürülen en iyi sonuç sayısı
+        prefixes = ['' if folder == '.' else folder + os.sep for folder in table.folders]
+        self._prefixes = prefixes
+        lowered_prefixes = [fold_case(prefix) for prefix in prefixes]
+        folder_ids = table.folder_ids
+        self.paths: List[str] = [
+            lowered_prefixes[folder_ids[i]] + fold_case(name) for i, name in enumerate(table.names)
+        ]
+        # Birleşik metinde her yolun başlangıç konumu
+        self._starts = array('q')
+        offset = 0
+        for path in self.paths:
+            self._starts.append(offset)
+            offset += len(path) + 1
+        self._text = '\n'.join(self.paths)
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    @staticmethod
+    def extends(previous: str, query: str) -> bool:
+        """Yeni sorgunun eşleşmeleri öncekilerin alt kümesi mi?"""
+        return is_subsequence(fold_case(previous), fold_case(query))
+
+    @staticmethod
+    def _pattern(query: str):
+        # İlk karakter sabit metin olarak aranır (hızlı atlama), sonrakiler için
+        # "kendisi olmayanları geç, sonra kendisi": geri izleme gerekmez
+        escaped = [re.escape(char) for char in query]
+        return re.compile(escaped[0] + ''.join(f'[^{char}\\n]*{char}' for char in escaped[1:]))
+
+    def matches(self, query: str, within: Optional[Iterable[int]] = None,
+                cancelled: Optional[Callable[[], bool]] = None) -> List[int]:
+        """Sorguyu alt dizi olarak içeren dosya id'lerini artan sırayla döndürür."""
+        if within is not None:
+            search = self._pattern(query).search
+            paths = self.paths
+            hits = []
+            ids = list(within)
+            for start in range(0, len(ids), _CHUNK):
+                if cancelled is not None and cancelled():
+                    raise SearchCancelled()
+                hits.extend(i for i in ids[start:start + _CHUNK] if search(paths[i]))
+            return hits
+
+        # Aynı satırda birden fazla eşleşme olabilir, satır numarası tekrarlanmaz
+        starts = self._starts
+        hits = []
+        last = -1
+        for m in self._pattern(query).finditer(self._text):
+            file_id = bisect_right(starts, m.start()) - 1
+            if file_id != last:
+                hits.append(file_id)
+                last = file_id
+        return hits
+
+    def rank(self, query: str, candidates: List[int], limit: int,
+             cancelled: Optional[Callable[[], bool]] = None) -> List[int]:
+        """Adayları puanlar ve en iyi `limit` tanesini puan sırasıyla döndürür."""
+        search = self._pattern(query).search
+        best = []
+        for start in range(0, len(candidates), _CHUNK):
+            if cancelled is not None and cancelled():
+                raise SearchCancelled()
+            scored = []
+            for file_id in candidates[start:start + _CHUNK]:
+                m = search(self.paths[file_id])
+                if m is not None:
+                    scored.append(self._key(query, file_id, m.end() - 1))
+            best = heapq.nlargest(limit, best + scored)
+        return [-key[-1] for key in best]
+
+    def search(self, query: str, within: Optional[Iterable[int]] = None,
+               cancelled: Optional[Callable[[], bool]] = None) -> FuzzyMatches:
+        """Eşleşmeleri bulur ve sıralar; `within` önceki sorgunun adaylarıdır."""
+        query = fold_case(query)
+        candidates = self.matches(query, within, cancelled)
+        return FuzzyMatches(candidates, self.rank(query, candidates, self.limit, cancelled))
+
+    def _key(self, query: str, file_id: int, end: int):
+        """Sıralama anahtarı: puan, dosya adında başlama, kısa ad, kısa yol, küçük id."""
+        path = self.paths[file_id]
+        # Geriye doğru tarayarak ileri eşleşmenin sonunda biten en kısa pencere
+        positions = [0] * len(query)
+        pos = end + 1
+        for k in range(len(query) - 1, -1, -1):
+            pos = path.rfind(query[k], 0, pos)
+            positions[k] = pos
+
+        table = self.table
+        folder_id = table.folder_ids[file_id]
+        original = self._prefixes[folder_id] + table.names[file_id]
+        name_start = len(self._prefixes[folder_id])
+        score = 0
+        prev = -2
+        chunk_bonus = 0
+        for k, pos in enumerate(positions):
+            bonus = _char_bonus(original, pos)
+            if pos == prev + 1:
+                # Ardışık eşleşmeler parçanın ilk karakterinin bonusunu korur
+                bonus = max(bonus, chunk_bonus, BONUS_CONSECUTIVE)
+            else:
+                if k:
+                    score += SCORE_GAP_START + SCORE_GAP_EXTENSION * (pos - prev - 2)
+                chunk_bonus = bonus
+            if k == 0:
+                bonus *= BONUS_FIRST_CHAR_MULTIPLIER
+            if pos >= name_start:
+                bonus += BONUS_FILE_NAME
+            score += SCORE_MATCH + bonus
+            prev = pos
+        return (score, positions[0] >= name_start, name_start - len(path), -len(path), -file_id)
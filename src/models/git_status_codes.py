@@ -0,0 +1,69 @@
+from itertools import compress
+from typing import Dict, Iterable, List, Optional
+from ..core.git.git_types import GitFileStatus
+from .file_table import FileTable
+
+# Kod -> durum; 0 değişiklik olmayan (veya durumu bilinmeyen) dosyadır
+STATUS_BY_CODE = (
+    None,
+    GitFileStatus.MODIFIED,
+    GitFileStatus.ADDED,
+    GitFileStatus.DELETED,
+    GitFileStatus.UNTRACKED,
+    GitFileStatus.RENAMED,
+    GitFileStatus.COPIED,
+    GitFileStatus.UNMERGED,
+)
+CODE_BY_STATUS = {status: code for code, status in enumerate(STATUS_BY_CODE) if status is not None}
+
+
+class GitStatusCodes:
+    """FileTable ile hizalı, dosya başına bir baytlık Git durum kodu dizisi.
+
+    Durumlar yol sözlüğü yerine dosya id'sine göre tutulur. Sayımlar
+    `bytearray.count`, filtre maskeleri `translate` ve id listeleri
+    `itertools.compress` ile C hızında hesaplanır; satır başına Python
+    döngüsü yoktur.
+    """
+
+    def __init__(self, size: int = 0):
+        self.codes = bytearray(size)
+
+    @classmethod
+    def from_status(cls, table: FileTable, status: Dict[str, GitFileStatus]) -> 'GitStatusCodes':
+        """Yol -> durum sözlüğünü tablonun yol indeksiyle kod dizisine çevirir."""
+        result = cls(len(table))
+        codes = result.codes
+        for path, file_status in status.items():
+            code = CODE_BY_STATUS.get(file_status)
+            if code is None:
+                continue
+            file_id = table.id_of(path)
+            if file_id is not None:
+                codes[file_id] = code
+        return result
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def status(self, file_id: int) -> Optional[GitFileStatus]:
+        """Dosyanın Git durumu; değişiklik yoksa None."""
+        return STATUS_BY_CODE[self.codes[file_id]]
+
+    def counts(self, file_ids: Optional[Iterable[int]] = None) -> Dict[GitFileStatus, int]:
+        """Durum başına dosya sayısı; file_ids verilirse yalnızca onlar sayılır."""
+        codes = self.codes
+        if file_ids is not None:
+            codes = bytes(map(codes.__getitem__, file_ids))
+        return {status: codes.count(code) for status, code in CODE_BY_STATUS.items()}
+
+    def mask(self, statuses: Iterable[GitFileStatus]) -> bytes:
+        """İstenen durumdaki dosyalar için 1, diğerleri için 0 olan maske."""
+        table = bytearray(256)
+        for status in statuses:
+            table[CODE_BY_STATUS[status]] = 1
+        return self.codes.translate(table)
+
+    def ids(self, statuses: Iterable[GitFileStatus]) -> List[int]:
+        """İstenen durumdaki dosya id'lerini artan sırayla döndürür."""
+        return list(compress(range(len(self.codes)), self.mask(statuses)))
@@ -0,0 +1,112 @@
+from itertools import compress
+from typing import Callable, Iterable, Iterator, List, NamedTuple, Optional, Sequence
+
+# 0 <-> 1 dönüşümü (seçimi tersine çevirme)
+_FLIP = bytes([1, 0]) + bytes(254)
+
+
+class SelectionDelta(NamedTuple):
+    """Seçim değişikliği bildirimi.
+
+    `ids` bir liste ise yalnızca durumu gerçekten değişen dosyaları içerir.
+    Toplu aralık işlemlerinde `range` olur ve aralıktaki tüm dosyalar artık
+    `selected` durumundadır. `selected` None ise aralıktaki seçim tersine
+    çevrilmiş veya baştan yazılmıştır; dinleyiciler sayaçlarını yeniden
+    hesaplar.
+    """
+    ids: Sequence[int]
+    selected: Optional[bool]
+    count: int  # Durumu değişen dosya sayısı
+
+
+class SelectionStore:
+    """Dosya sıra numarasına (id) göre tutulan bitset tabanlı seçim deposu.
+
+    Her dosya için bir bayt (0/1) tutulur; toplu işlemler dilim atamaları ve
+    `bytes.count` ile C hızında yapılır. Seçili dosya sayısı her değişiklikte
+    güncellendiğinden O(1) okunur. Liste görünümü, klasör ağacı ve dışa
+    aktarma aynı depoyu paylaşır; değişiklikler dinleyicilere fark (delta)
+    olarak bildirilir.
+    """
+
+    def __init__(self, size: int = 0):
+        self._bits = bytearray(size)
+        self._count = 0
+        self._listeners: List[Callable[[SelectionDelta], None]] = []
+
+    def add_listener(self, listener: Callable[[SelectionDelta], None]) -> None:
+        """Seçim değiştiğinde çağrılacak fonksiyonu ekler."""
+        self._listeners.append(listener)
+
+    def _notify(self, delta: SelectionDelta) -> None:
+        if delta.count:
+            for listener in self._listeners:
+                listener(delta)
+
+    def reset(self, size: int) -> None:
+        """Yeni tarama için depoyu boşaltır; bildirim yapılmaz."""
+        self._bits = bytearray(size)
+        self._count = 0
+
+    def __len__(self) -> int:
+        return len(self._bits)
+
+    def __contains__(self, file_id: int) -> bool:
+        return self._bits[file_id] == 1
+
+    @property
+    def count(self) -> int:
+        """Seçili dosya sayısı."""
+        return self._count
+
+    def count_range(self, start: int, end: int) -> int:
+        """[start, end) aralığındaki seçili dosya sayısı."""
+        return self._bits.count(1, start, end)
+
+    def ids(self) -> Iterator[int]:
+        """Seçili dosya id'lerini artan sırayla döndürür."""
+        return compress(range(len(self._bits)), self._bits)
+
+    def set_many(self, file_ids: Iterable[int], selected: bool) -> None:
+        """Verilen dosyaları seçer veya seçimini kaldırır (filtre sonuçları için)."""
+        bits = self._bits
+        value = 1 if selected else 0
+        changed = [i for i in file_ids if bits[i] != value]
+        for file_id in changed:
+            bits[file_id] = value
+        self._count += len(changed) if selected else -len(changed)
+        self._notify(SelectionDelta(changed, selected, len(changed)))
+
+    def set_range(self, start: int, end: int, selected: bool) -> None:
+        """[start, end) aralığını tek dilim atamasıyla seçer veya boşaltır."""
+        before = self._bits.count(1, start, end)
+        self._bits[start:end] = (b'\x01' if selected else b'\x00') * (end - start)
+        changed = (end - start - before) if selected else before
+        self._count += changed if selected else -changed
+        self._notify(SelectionDelta(range(start, end), selected, changed))
+
+    def assign(self, file_ids: Iterable[int]) -> None:
+        """Seçimi yalnızca verilen dosyalar olacak şekilde tek bildirimle değiştirir."""
+        old = self._bits
+        bits = bytearray(len(old))
+        for file_id in file_ids:
+            bits[file_id] = 1
+        count = bits.count(1)
+        # Değişen sayısı: iki kümenin simetrik farkı
+        kept = sum(old[i] for i in compress(range(len(bits)), bits)) if self._count else 0
+        changed = self._count + count - 2 * kept
+        self._bits = bits
+        self._count = count
+        self._notify(SelectionDelta(range(len(bits)), None, changed))
+
+    def select_all(self) -> None:
+        self.set_range(0, len(self._bits), True)
+
+    def clear(self) -> None:
+        self.set_range(0, len(self._bits), False)
+
+    def invert(self) -> None:
+        """Tüm dosyaların seçimini tersine çevirir."""
+        self._bits = self._bits.translate(_FLIP)
+        self._count = len(self._bits) - self._count
+        self._notify(SelectionDelta(range(len(self._bits)), None, len(self._bits)))
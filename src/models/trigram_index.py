@@ -0,0 +1,143 @@
+from array import array
+from typing import Callable, Dict, List, Optional, Sequence
+from .directory_index import DirectoryIndex
+from .file_table import FileTable
+
+# İptal kontrolleri arasında işlenen öğe sayısı
+_CHUNK = 8192
+
+
+class SearchCancelled(Exception):
+    """Arama daha yeni bir sorgu nedeniyle iptal edildi."""
+
+
+def _build_grams(keys: Sequence[str]) -> Dict[str, List[int]]:
+    """Her üçlü (trigram) için onu içeren anahtar sıra numaralarını toplar.
+
+    Aynı anahtarda tekrar eden üçlüler listeye birden fazla eklenebilir;
+    sorguda kümeye çevrildiğinden sonucu etkilemez, kurulumu hızlandırır.
+    """
+    grams: Dict[str, List[int]] = {}
+    get = grams.get
+    for key_id, key in enumerate(keys):
+        for i in range(len(key) - 2):
+            gram = key[i:i + 3]
+            postings = get(gram)
+            if postings is None:
+                postings = grams[gram] = []
+            postings.append(key_id)
+    return grams
+
+
+def _check(cancelled: Optional[Callable[[], bool]]) -> None:
+    if cancelled is not None and cancelled():
+        raise SearchCancelled()
+
+
+def _match(keys: Sequence[str], grams: Dict[str, List[int]], query: str,
+           cancelled: Optional[Callable[[], bool]] = None) -> List[int]:
+    """Sorguyu içeren anahtarların sıra numaralarını döndürür."""
+    if len(query) < 3:
+        # Kısa sorgular için üçlü yok, tekil anahtarlar parça parça taranır
+        found = []
+        for start in range(0, len(keys), _CHUNK):
+            _check(cancelled)
+            found.extend(
+                key_id for key_id in range(start, min(start + _CHUNK, len(keys)))
+                if query in keys[key_id]
+            )
+        return found
+
+    # En seçici (en kısa listeli) üçlünün adayları alt dize kontrolüyle
+    # doğrulanır; diğer listelerle kesişim almak doğrulamadan pahalıdır
+    smallest = None
+    for gram in {query[i:i + 3] for i in range(len(query) - 2)}:
+        postings = grams.get(gram)
+        if postings is None:
+            return []
+        if smallest is None or len(postings) < len(smallest):
+            smallest = postings
+    return [key_id for key_id in set(smallest) if query in keys[key_id]]
+
+
+class TrigramIndex:
+    """Dosya adları ve klasörler üzerinde alt dize araması için trigram indeksi.
+
+    Adlar küçük harfe çevrilip tekilleştirilir (aynı adlı dosyalar tek
+    anahtar paylaşır); klasörler FileTable'da zaten tekildir. Sorgunun en
+    seçici üçlüsü aday anahtarları verir, adaylar gerçek alt dize
+    kontrolüyle doğrulanır ve dosya id'lerine genişletilir.
+    """
+
+    def __init__(self, table: FileTable, directories: DirectoryIndex):
+        name_keys: Dict[str, int] = {}
+        self.name_keys: List[str] = []
+        self.name_files: List[List[int]] = []  # Ad anahtarı -> dosya id'leri
+        self.file_name_keys = array('I')       # Dosya id -> ad anahtarı
+        for file_id, name in enumerate(table.names):
+            lowered = name.lower()
+            key_id = name_keys.get(lowered)
+            if key_id is None:
+                key_id = name_keys[lowered] = len(self.name_keys)
+                self.name_keys.append(lowered)
+                self.name_files.append([])
+            self.name_files[key_id].append(file_id)
+            self.file_name_keys.append(key_id)
+
+        self.folder_keys = [folder.lower() for folder in table.folders]
+        self.file_folder_keys = table.folder_ids
+        # Bir klasörün dosyaları ardışık bir id aralığıdır
+        self.folder_ranges = [
+            (directories.file_start[node], directories.file_end[node])
+            for node in directories.folder_nodes
+        ]
+        self._name_grams = _build_grams(self.name_keys)
+        self._folder_grams = _build_grams(self.folder_keys)
+
+    @staticmethod
+    def extends(previous: str, query: str) -> bool:
+        """Yeni sorgunun eşleşmeleri öncekilerin alt kümesi mi?"""
+        return previous in query
+
+    def search(self, query: str, within: Optional[List[int]] = None,
+               cancelled: Optional[Callable[[], bool]] = None) -> List[int]:
+        """
+        Adında veya klasöründe sorguyu içeren dosya id'lerini artan sırayla döndürür.
+
+        Args:
+            query: Aranacak metin
+            within: Verilirse yalnızca bu (artan sıralı) id'ler süzülür; önceki
+                sorgu yeni sorgunun alt dizesiyken sonuçlarını daraltmak için
+            cancelled: Parçalar arasında sorulur, True dönerse SearchCancelled
+        """
+        query = query.lower()
+        if within is not None:
+            return self._narrow(query, within, cancelled)
+
+        hits = set()
+        for key_id in _match(self.name_keys, self._name_grams, query, cancelled):
+            hits.update(self.name_files[key_id])
+        _check(cancelled)
+        for folder_id in _match(self.folder_keys, self._folder_grams, query, cancelled):
+            hits.update(range(*self.folder_ranges[folder_id]))
+        _check(cancelled)
+        return sorted(hits)
+
+    def _narrow(self, query: str, within: List[int],
+                cancelled: Optional[Callable[[], bool]]) -> List[int]:
+        """Önceki sonuçları yeni sorguyla süzer."""
+        names, name_of = self.name_keys, self.file_name_keys
+        folders, folder_of = self.folder_keys, self.file_folder_keys
+        # Aynı klasör ve ad anahtarları tekrar kontrol edilmesin
+        folder_hits = {}
+        hits = []
+        for start in range(0, len(within), _CHUNK):
+            _check(cancelled)
+            for file_id in within[start:start + _CHUNK]:
+                folder_id = folder_of[file_id]
+                in_folder = folder_hits.get(folder_id)
+                if in_folder is None:
+                    in_folder = folder_hits[folder_id] = query in folders[folder_id]
+                if in_folder or query in names[name_of[file_id]]:
+                    hits.append(file_id)
+        return hits
@@ -2,6 +2,7 @@ import json
 from pathlib import Path
 from typing import Any, Dict, Optional
 import os
+from ..core.large_file_policy import DEFAULT_POLICIES
 
 class ConfigManager:
     """Program ayarlarını yöneten sınıf."""
@@ -14,6 +15,11 @@ class ConfigManager:
         'excluded_directories': ['.git', 'node_modules', 'bin', 'obj', 'build', 'dist'],
         'supported_extensions': ['.java', '.cs', '.js', '.jsx', '.ts', '.tsx', '.py', '.css'],
         'default_encoding': 'utf-8',
+        'read_chunk_size': 1024 * 1024,  # Dosyalar bu boyutta parçalar halinde okunur
+        # Büyük dosya politikaları: mode = 'skip' | 'truncate' | 'head_tail'
+        # Politika max_bytes'ı aşan dosyalara uygulanır, '*' varsayılandır
+        'large_file_policies': DEFAULT_POLICIES,
+        'churn_recent_days': 30,  # "Son değişenler" filtresinin kapsadığı gün sayısı
         'window_size': {'width': 1024, 'height': 768},
         'window_position': {'x': 100, 'y': 100},
         'recent_projects': [],
@@ -25,7 +31,11 @@ class ConfigManager:
             'max_diff_size': 1024 * 1024,  # 1MB
             'auto_scan': True,  # Git değişikliklerini otomatik tara
             'excluded_branches': ['gh-pages', 'release'],  # Yoksayılacak branch'ler
-            'diff_context_lines': 3  # Diff görünümünde gösterilecek bağlam satır sayısı
+            'diff_context_lines': 3,  # Diff görünümünde gösterilecek bağlam satır sayısı
+            'untracked_files': 'all',  # git status --untracked-files modu: no, normal, all
+            'use_untracked_cache': True,  # core.untrackedCache
+            'use_fsmonitor': False,  # core.fsmonitor, büyük çalışma ağaçlarında
+            'status_workers': 4  # Submodule/iç içe repository'ler için paralel status sayısı
         },
         'recent_repositories': [],
     }
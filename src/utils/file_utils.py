@@ -1,22 +1,118 @@
+import codecs
+import hashlib
 import os
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Set
+from threading import Lock
+from typing import Dict, Iterator, List, Set, Tuple
 import chardet
 
+try:
+    # Kriptografik olmayan hızlı hash (opsiyonel)
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# Büyük dosyalar parça parça okunurken kullanılan varsayılan parça boyutu (karakter)
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# Kodlama tespitinde incelenen örnek boyutu (bayt)
+ENCODING_SAMPLE_SIZE = 64 * 1024
+
+_BOMS = [
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+]
+
+# Kodlama önbelleğinde tutulan en fazla dosya sayısı (en eski kullanılan atılır)
+ENCODING_CACHE_SIZE = 50000
+
+# Dosya yolu -> (boyut, değişiklik zamanı, kodlama), LRU sırasında
+_encoding_cache: 'OrderedDict[str, Tuple[int, int, str]]' = OrderedDict()
+_encoding_cache_lock = Lock()
+
+def _detect_encoding(sample: bytes, complete: bool) -> str:
+    """
+    Örnek veri üzerinden kodlamayı tespit eder.
+    
+    Args:
+        sample: Dosyanın başından alınan örnek
+        complete: Örnek dosyanın tamamını içeriyorsa True
+    """
+    # BOM varsa doğrudan kullan (UTF-32 LE BOM, UTF-16 LE BOM ile başlar)
+    for bom, encoding in _BOMS:
+        if sample.startswith(bom):
+            return encoding
+    
+    # Hızlı yol: saf ASCII veya geçerli UTF-8
+    if sample.isascii():
+        return 'utf-8'
+    try:
+        # Örnek ortasında kesilmiş çok baytlı karakterler hata sayılmasın
+        codecs.getincrementaldecoder('utf-8')().decode(sample, final=complete)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        pass
+    
+    encoding = chardet.detect(sample)['encoding']
+    if not encoding or encoding.lower() == 'ascii':
+        return 'utf-8'
+    return encoding.lower()
+
 def get_file_encoding(file_path: str | Path) -> str:
     """
     Dosyanın karakter kodlamasını tespit eder.
     
+    Yalnızca dosyanın ilk 64 KB'ı incelenir. Sonuç (yol, boyut, değişiklik
+    zamanı) ile en fazla ENCODING_CACHE_SIZE dosyalık LRU önbelleğe alınır,
+    dosya değişmedikçe tekrar okunmaz.
+    
     Args:
         file_path: Dosya yolu
         
     Returns:
         str: Tespit edilen kodlama (örn: 'utf-8', 'windows-1254')
     """
-    with open(file_path, 'rb') as f:
-        raw_data = f.read()
-        result = chardet.detect(raw_data)
-        return result['encoding'] or 'utf-8'
+    path_key = str(file_path)
+    stat = os.stat(path_key)
+    
+    with _encoding_cache_lock:
+        cached = _encoding_cache.get(path_key)
+        if cached:
+            _encoding_cache.move_to_end(path_key)
+    if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+        return cached[2]
+    
+    with open(path_key, 'rb') as f:
+        sample = f.read(ENCODING_SAMPLE_SIZE)
+    encoding = _detect_encoding(sample, len(sample) >= stat.st_size)
+    
+    with _encoding_cache_lock:
+        _encoding_cache[path_key] = (stat.st_size, stat.st_mtime_ns, encoding)
+        _encoding_cache.move_to_end(path_key)
+        if len(_encoding_cache) > ENCODING_CACHE_SIZE:
+            _encoding_cache.popitem(last=False)
+    return encoding
+
+def decode_bytes(data: bytes) -> str:
+    """
+    Bellekteki içeriği (örn. Git nesnesi) tespit edilen kodlamayla çözer.
+    
+    Args:
+        data: Ham içerik
+        
+    Returns:
+        str: Çözülmüş metin, çözülemeyen baytlar değiştirilir
+    """
+    sample = data[:ENCODING_SAMPLE_SIZE]
+    encoding = _detect_encoding(sample, len(sample) == len(data))
+    try:
+        return data.decode(encoding, errors='replace')
+    except LookupError:
+        return data.decode('utf-8', errors='replace')
 
 def safe_read_file(file_path: str | Path, encoding: str = None) -> str:
     """
@@ -29,31 +125,75 @@ def safe_read_file(file_path: str | Path, encoding: str = None) -> str:
     Returns:
         str: Dosya içeriği
     """
-    try:
-        # Belirtilen kodlama ile okumayı dene
-        if encoding:
-            with open(file_path, 'r', encoding=encoding) as f:
-                return f.read()
+    encodings = [encoding or get_file_encoding(file_path)]
+    
+    # Dosyayı bir kez oku, alternatif kodlamaları aynı veri üzerinde dene
+    with open(file_path, 'rb') as f:
+        raw_data = f.read()
+    
+    # Yaygın kodlamalar
+    encodings += ['utf-8', 'windows-1254', 'iso-8859-9', 'latin1']
+    for enc in encodings:
+        try:
+            return raw_data.decode(enc)
+        except (UnicodeDecodeError, LookupError):
+            continue
+    
+    # Hiçbir kodlama işe yaramadıysa hatalı karakterleri değiştir
+    return raw_data.decode('utf-8', errors='replace')
+
+def iter_file_chunks(
+    file_path: str | Path,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    encoding: str = 'utf-8',
+    errors: str = 'strict'
+) -> Iterator[str]:
+    """
+    Dosyayı sabit boyutlu parçalar halinde okur.
+    
+    Bellek kullanımı dosya boyutundan bağımsız olarak parça boyutuyla sınırlı kalır.
+    
+    Args:
+        file_path: Dosya yolu
+        chunk_size: Her seferde okunacak karakter sayısı
+        encoding: Kullanılacak kodlama
+        errors: Kod çözme hatalarında uygulanacak strateji
         
-        # Kodlamayı tespit et ve oku
-        detected_encoding = get_file_encoding(file_path)
-        with open(file_path, 'r', encoding=detected_encoding) as f:
-            return f.read()
-            
-    except UnicodeDecodeError:
-        # Yaygın kodlamaları dene
-        encodings = ['utf-8', 'windows-1254', 'iso-8859-9', 'latin1']
+    Yields:
+        str: Dosya içeriğinin sıradaki parçası
+    """
+    with open(file_path, 'r', encoding=encoding, errors=errors) as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+def content_hasher():
+    """İçerik hash'leri için yeni bir hasher (XXH3 veya BLAKE2b) döndürür."""
+    return xxhash.xxh3_128() if xxhash else hashlib.blake2b(digest_size=16)
+
+def content_hash(file_path: str | Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
+    """
+    Dosyanın ham içeriğinin hash değerini hesaplar.
+    
+    xxhash kuruluysa XXH3 kullanılır, değilse BLAKE2b'ye geri dönülür.
+    
+    Args:
+        file_path: Dosya yolu
+        chunk_size: Okuma parça boyutu (bayt)
         
-        for enc in encodings:
-            try:
-                with open(file_path, 'r', encoding=enc) as f:
-                    return f.read()
-            except UnicodeDecodeError:
-                continue
-                
-        # Hiçbir kodlama işe yaramadıysa binary modda oku
-        with open(file_path, 'rb') as f:
-            return f.read().decode('utf-8', errors='replace')
+    Returns:
+        str: Hex formatında hash değeri
+    """
+    hasher = content_hasher()
+    with open(file_path, 'rb') as f:
+        while True:
+            data = f.read(chunk_size)
+            if not data:
+                break
+            hasher.update(data)
+    return hasher.hexdigest()
 
 def create_unique_filename(base_path: str | Path, name: str, extension: str = '.txt') -> Path:
     """
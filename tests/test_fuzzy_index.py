@@ -0,0 +1,73 @@
+import os
+
+import pytest
+
+from src.models.file_table import FileTable
+from src.models.fuzzy_index import FuzzyIndex, fold_case, is_subsequence
+from src.models.trigram_index import SearchCancelled
+
+
+def make_index(paths):
+    entries = []
+    for path in paths:
+        folder, name = os.path.split(path)
+        entries.append((os.path.join('/r', path), folder or '.', name, 1, 0.0))
+    table = FileTable.from_entries(entries)
+    return table, FuzzyIndex(table)
+
+
+def names(table, ids):
+    return [table.names[i] for i in ids]
+
+
+def test_fold_case_preserves_length():
+    assert fold_case('İstanbul') == 'istanbul'
+    assert len(fold_case('aİİx')) == 4
+    assert fold_case('MixedCase') == 'mixedcase'
+
+
+def test_candidates_are_all_subsequence_matches():
+    table, index = make_index([
+        os.path.join('src', 'user', 'UserService.java'),
+        os.path.join('src', 'user', 'UserServiceImpl.java'),
+        os.path.join('docs', 'usage.md'),
+        'setup.py',
+    ])
+    for query in ('usi', 'us', 'py', 'srcjava', 'zzz'):
+        result = index.search(query)
+        expected = [i for i, path in enumerate(index.paths) if is_subsequence(query, path)]
+        assert result.candidates == expected
+
+
+def test_ranking_prefers_word_starts_in_file_name():
+    table, index = make_index([
+        os.path.join('src', 'domain_model.py'),
+        os.path.join('docs', 'mainframe', 'notes.txt'),
+        os.path.join('src', 'main.py'),
+    ])
+    ranked = names(table, index.search('main').ranked)
+    assert ranked == ['main.py', 'notes.txt', 'domain_model.py']
+
+
+def test_non_length_preserving_lowercase_does_not_misalign():
+    # 'İ'.lower() iki karakterdir; konumlar özgün yolla hizalı kalmalı
+    table, index = make_index([os.path.join('İİİİ', 'aİx.py'), os.path.join('b', 'İi.py')])
+    assert names(table, index.search('x.py').ranked) == ['aİx.py']
+    assert set(names(table, index.search('İ').ranked)) == {'aİx.py', 'İi.py'}
+
+
+def test_narrowing_and_limit():
+    paths = [f'file{i}.py' for i in range(50)]
+    table, index = make_index(paths)
+    index.limit = 5
+    previous = index.search('f')
+    assert FuzzyIndex.extends('f', 'fpy')
+    result = index.search('fpy', within=previous.candidates)
+    assert len(result.candidates) == 50
+    assert len(result.ranked) == 5
+
+
+def test_cancelled_search_raises():
+    table, index = make_index(['a.py', 'b.py'])
+    with pytest.raises(SearchCancelled):
+        index.search('py', within=[0, 1], cancelled=lambda: True)
@@ -0,0 +1,65 @@
+import pytest
+
+from src.core.large_file_policy import LargeFilePolicyManager, skipped_marker
+
+LINES = [f"satır {i} çğüşöıİ €😀" for i in range(3000)]
+
+
+def write(tmp_path, encoding, newline):
+    path = tmp_path / 'big.txt'
+    path.write_bytes((newline.join(LINES) + newline).encode(encoding))
+    return path
+
+
+def read(path, encoding, mode, head_lines=7, tail_lines=5, chunk_size=333):
+    manager = LargeFilePolicyManager({'*': {
+        'mode': mode, 'max_bytes': 20000, 'head_lines': head_lines, 'tail_lines': tail_lines,
+    }})
+    return ''.join(manager.iter_content(path, chunk_size=chunk_size, encoding=encoding))
+
+
+@pytest.mark.parametrize('encoding', ['utf-8', 'utf-8-sig', 'utf-16', 'utf-16-be', 'utf-32'])
+@pytest.mark.parametrize('newline', ['\n', '\r\n'])
+def test_head_tail_keeps_whole_lines(tmp_path, encoding, newline):
+    path = write(tmp_path, encoding, newline)
+
+    out = read(path, encoding, 'head_tail')
+
+    assert '�' not in out and '\r' not in out
+    lines = out.split('\n')
+    assert lines[:7] == LINES[:7]
+    assert lines[-6:-1] == LINES[-5:]
+    assert any('bayt atlandı' in line for line in lines)
+
+
+@pytest.mark.parametrize('encoding', ['utf-8', 'utf-16'])
+def test_truncate_reports_hidden_bytes(tmp_path, encoding):
+    path = write(tmp_path, encoding, '\r\n')
+
+    out = read(path, encoding, 'truncate')
+
+    lines = out.split('\n')
+    assert lines[:7] == LINES[:7]
+    assert 'dosya kırpıldı' in out
+    assert LINES[-1] not in out
+
+
+def test_small_file_is_read_in_full(tmp_path):
+    path = tmp_path / 'small.txt'
+    path.write_text('a\nb\n', encoding='utf-8')
+
+    assert read(path, 'utf-8', 'head_tail') == 'a\nb\n'
+
+
+def test_skip_mode_yields_marker(tmp_path):
+    path = write(tmp_path, 'utf-8', '\n')
+    manager = LargeFilePolicyManager({'*': {'mode': 'skip', 'max_bytes': 10}})
+
+    assert list(manager.iter_content(path)) == [skipped_marker(path.stat().st_size)]
+
+
+def test_longest_suffix_policy_wins():
+    manager = LargeFilePolicyManager()
+
+    assert manager.get_policy('app.min.js').mode == 'skip'
+    assert manager.get_policy('app.js').mode == 'head_tail'
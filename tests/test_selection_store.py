@@ -0,0 +1,68 @@
+from src.models.selection_store import SelectionStore
+
+
+def make_store(size, selected=()):
+    store = SelectionStore(size)
+    store.set_many(selected, True)
+    return store
+
+
+def test_set_many_reports_only_changed_ids():
+    store = make_store(10, [1, 2])
+    deltas = []
+    store.add_listener(deltas.append)
+
+    store.set_many([2, 3, 4], True)
+
+    assert list(deltas[0].ids) == [3, 4]
+    assert deltas[0].count == 2
+    assert store.count == 4
+
+
+def test_set_range_counts_previously_selected():
+    store = make_store(10, [2, 8])
+
+    store.set_range(0, 5, True)
+    assert store.count == 6
+    assert store.count_range(0, 5) == 5
+
+    store.set_range(4, 10, False)
+    assert list(store.ids()) == [0, 1, 2, 3]
+
+
+def test_invert_flips_bits_and_count():
+    store = make_store(6, [0, 3])
+    deltas = []
+    store.add_listener(deltas.append)
+
+    store.invert()
+
+    assert list(store.ids()) == [1, 2, 4, 5]
+    assert store.count == 4
+    assert deltas[0].selected is None
+    store.invert()
+    assert list(store.ids()) == [0, 3]
+    assert store.count == 2
+
+
+def test_assign_counts_symmetric_difference():
+    store = make_store(8, [0, 1, 2])
+    deltas = []
+    store.add_listener(deltas.append)
+
+    store.assign([2, 3])
+
+    assert list(store.ids()) == [2, 3]
+    assert store.count == 2
+    assert deltas[0].count == 3  # 0 ve 1 kaldırıldı, 3 eklendi
+
+
+def test_no_notification_without_change():
+    store = make_store(4, [1])
+    deltas = []
+    store.add_listener(deltas.append)
+
+    store.set_many([1], True)
+    store.set_range(2, 4, False)
+
+    assert deltas == []
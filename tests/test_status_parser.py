@@ -0,0 +1,62 @@
+import io
+
+from src.core.git.git_repository import _unquote_path
+from src.core.git.git_types import GitFileStatus
+from src.core.git.status_parser import iter_status_v2
+
+MODE = b'100644 100644 100644 ' + b'a' * 40 + b' ' + b'b' * 40
+
+
+def parse(records, chunk_size=7):
+    data = b'\0'.join(records) + b'\0'
+    return list(iter_status_v2(io.BytesIO(data), chunk_size))
+
+
+def test_ordinary_and_untracked_entries():
+    entries = parse([
+        b'# branch.oid ' + b'c' * 40,
+        b'1 .M N... ' + MODE + b' src/app.py',
+        b'1 A. N... ' + MODE + b' new file.py',
+        b'? docs/yeni dosya \xc3\xa7.md',
+        b'! ignored.log',
+    ])
+
+    assert entries == [
+        ('src/app.py', GitFileStatus.MODIFIED, None, False),
+        ('new file.py', GitFileStatus.ADDED, None, False),
+        ('docs/yeni dosya ç.md', GitFileStatus.UNTRACKED, None, False),
+    ]
+
+
+def test_rename_reads_original_path_from_next_record():
+    entries = parse([
+        b'2 R. N... ' + MODE + b' R100 new name.py',
+        b'old name.py',
+        b'1 D. N... ' + MODE + b' gone.py',
+    ])
+
+    assert entries == [
+        ('new name.py', GitFileStatus.RENAMED, 'old name.py', False),
+        ('gone.py', GitFileStatus.DELETED, None, False),
+    ]
+
+
+def test_unmerged_and_submodule_entries():
+    entries = parse([
+        b'u UU N... 100644 100644 100644 100644 ' + b'a' * 40 + b' ' + b'b' * 40 + b' '
+        + b'c' * 40 + b' conflict.py',
+        b'1 .M S.M. 160000 160000 160000 ' + b'a' * 40 + b' ' + b'a' * 40 + b' vendor/lib',
+    ])
+
+    assert entries == [
+        ('conflict.py', GitFileStatus.UNMERGED, None, False),
+        ('vendor/lib', GitFileStatus.MODIFIED, None, True),
+    ]
+
+
+def test_unquote_path_decodes_octal_utf8_and_escapes():
+    assert _unquote_path('"\\303\\274n\\304\\261.py"') == 'ünı.py'
+    assert _unquote_path('"\\344\\270\\255.py"') == '中.py'
+    assert _unquote_path('"a\\tb\\"c\\\\d"') == 'a\tb"c\\d'
+    assert _unquote_path('plain ş.py') == 'plain ş.py'
+    assert _unquote_path('"bad\\377"') == 'bad\udcff'
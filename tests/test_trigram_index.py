@@ -0,0 +1,60 @@
+import os
+
+import pytest
+
+from src.models.directory_index import DirectoryIndex
+from src.models.file_table import FileTable
+from src.models.trigram_index import SearchCancelled, TrigramIndex
+
+FILES = [
+    ('.', 'README.md'),
+    ('.', 'setup.py'),
+    ('src', 'main.py'),
+    (os.path.join('src', 'core'), 'FileExporter.py'),
+    (os.path.join('src', 'core'), 'file_scanner.py'),
+    (os.path.join('src', 'core', 'git'), 'git_manager.py'),
+    (os.path.join('src', 'gui'), 'main_window.py'),
+    ('tests', 'test_main.py'),
+]
+
+
+@pytest.fixture
+def table():
+    return FileTable.from_entries(
+        (os.path.join('/r', folder, name), folder, name, 1, 0.0) for folder, name in FILES
+    )
+
+
+@pytest.fixture
+def index(table):
+    return TrigramIndex(table, DirectoryIndex.from_table(table))
+
+
+def brute_force(table, query):
+    query = query.lower()
+    return [
+        file_id for file_id, name in enumerate(table.names)
+        if query in name.lower() or query in table.folders[table.folder_ids[file_id]].lower()
+    ]
+
+
+@pytest.mark.parametrize('query', ['main', 'MAIN', 'py', 'fi', 'file', 'core', 'git', 'e.p', 'xyz', 'a', 'rc'])
+def test_search_matches_substring_scan(table, index, query):
+    assert index.search(query) == brute_force(table, query)
+
+
+def test_folder_match_includes_all_files_of_folder(table, index):
+    hits = index.search('gui')
+    assert [table.names[i] for i in hits] == ['main_window.py']
+
+
+def test_narrowing_previous_results(table, index):
+    previous = index.search('ma')
+    assert TrigramIndex.extends('ma', 'main')
+    assert index.search('main', within=previous) == brute_force(table, 'main')
+    assert not TrigramIndex.extends('main', 'mai')
+
+
+def test_cancelled_search_raises(index):
+    with pytest.raises(SearchCancelled):
+        index.search('main', cancelled=lambda: True)